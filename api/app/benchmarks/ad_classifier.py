@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark ad-classification throughput: serial requests against the pooled client.
+
+Runs against the local stand-in server, so the numbers reflect client-side
+overhead and concurrency for a given service latency.
+
+Usage (from the app directory):
+    python -m benchmarks.ad_classifier --segments 500 --latency 0.05 --concurrency 1 4 8 16
+"""
+
+import argparse
+import time
+
+import requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    from benchmarks.ad_classifier_server import serve_in_background
+    from services.classifier_client import AdClassifierClient
+
+    server = serve_in_background(latency=args.latency, error_rate=args.error_rate)
+    url = f"http://127.0.0.1:{server.server_port}/classify"
+    texts = [f"segment {i} " + ("this video is sponsored by" if i % 20 == 0 else "content") for i in range(args.segments)]
+
+    # The previous path: a new connection per request, one request at a time
+    started = time.perf_counter()
+    for index in range(len(texts)):
+        requests.post(url, json=AdClassifierClient.build_payload(texts, index))
+    baseline = time.perf_counter() - started
+    print(f"serial     {len(texts) / baseline:8.1f} segments/s")
+
+    for concurrency in args.concurrency:
+        client = AdClassifierClient(url=url, concurrency=concurrency, timeout=5, max_retries=3, backoff=0.05)
+        started = time.perf_counter()
+        classes = client.classify_many(texts)
+        elapsed = time.perf_counter() - started
+        client.close()
+
+        failed = sum(1 for c in classes if c is None)
+        print(f"pooled c={concurrency:<3} {len(texts) / elapsed:8.1f} segments/s "
+              f"speedup={baseline / elapsed:5.1f}x failed={failed}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
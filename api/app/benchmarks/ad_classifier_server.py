@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the ad-classification service.
+
+Answers the same JSON contract as AD_AI_URL: "1" when the current segment
+mentions a sponsor keyword, "0" otherwise, with a confidence, after a
+configurable latency.
+A share of requests can fail with 503 to exercise retries.
+
+Usage (from the app directory):
+    python -m benchmarks.ad_classifier_server --port 8100 --latency 0.05
+    AD_AI_URL=http://127.0.0.1:8100/classify celery -A celery_app worker ...
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+AD_KEYWORDS = ("sponsor", "patrocin", "promo code", "link in the description", "discount")
+
+
+def make_server(host: str = "127.0.0.1", port: int = 0, latency: float = 0.05, error_rate: float = 0.0) -> ThreadingHTTPServer:
+    """Create the stand-in server; port 0 picks a free port"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are separate writes on a kept-alive connection
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            time.sleep(latency)
+
+            if random.random() < error_rate:
+                self._reply(503, {"error": "unavailable"})
+                return
+
+            text = (payload.get("currentSegment") or "").lower()
+            hits = sum(1 for k in AD_KEYWORDS if k in text)
+            self._reply(200, {
+                "response": "1" if hits else "0",
+                "confidence": min(0.99, 0.6 + 0.2 * hits) if hits else 0.9
+            })
+
+        def _reply(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve_in_background(**kwargs) -> ThreadingHTTPServer:
+    """Start the stand-in server on a daemon thread and return it"""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency, args.error_rate)
+    print(f"Serving on http://{args.host}:{server.server_port}/classify")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
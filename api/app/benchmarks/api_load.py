@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Load test for the API: latency percentiles under concurrent requests.
+
+Sends a fixed number of requests with a fixed number in flight and reports
+p50/p95/p99 latency and throughput. Run it against a build before and after
+a change, with the same database and Redis, to compare tail latency.
+
+Usage (from the app directory, with the API running):
+    python -m benchmarks.api_load --url http://localhost:8000/v2/extension/segments/VIDEO_ID/youtube \
+        --user-id 1 --concurrency 64 --requests 5000
+"""
+
+import argparse
+import asyncio
+import time
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+async def _run(url, headers, concurrency, total):
+    import httpx
+
+    latencies, errors = [], 0
+    remaining = iter(range(total))
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            for _ in remaining:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url, headers=headers)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return latencies, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--token", help="Bearer token (minted for --user-id when omitted)")
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    token = args.token
+    if token is None:
+        from core.auth import create_access_token
+        token = create_access_token(data={"sub": str(args.user_id), "role": "user"})
+
+    latencies, errors, elapsed = asyncio.run(
+        _run(args.url, {"Authorization": f"Bearer {token}"}, args.concurrency, args.requests)
+    )
+
+    print(f"{len(latencies)} requests, concurrency {args.concurrency}, {errors} errors")
+    print(f"throughput {len(latencies) / elapsed:8.1f} req/s")
+    for q in (50, 95, 99):
+        print(f"p{q:<3}      {_percentile(latencies, q) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
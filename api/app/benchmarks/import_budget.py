@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Import budget check for the API process.
+
+Imports the API entry point in a fresh interpreter and fails (exit code 1)
+if it pulls in any module of the ML stack, or exceeds the import time or
+RSS budget. Meant to run in CI next to the build.
+
+Usage (from the app directory, with the API environment configured):
+    python -m benchmarks.import_budget --max-seconds 3 --max-rss-mb 250
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+FORBIDDEN = ("torch", "torchaudio", "ctranslate2", "faster_whisper", "sympy", "onnxruntime", "pydub", "librosa", "whisper")
+
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": sorted({{name.split(".")[0] for name in sys.modules}})
+}}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module imported as the API entry point")
+    parser.add_argument("--max-seconds", type=float, default=3.0)
+    parser.add_argument("--max-rss-mb", type=float, default=250.0)
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=args.module)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(result.returncode)
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    forbidden = [name for name in FORBIDDEN if name in report["modules"]]
+
+    print(f"import {args.module}: {report['seconds']:.2f}s, max RSS {report['rss_mb']:.0f} MB, "
+          f"{len(report['modules'])} top-level modules")
+
+    failures = []
+    if forbidden:
+        failures.append(f"forbidden modules imported: {', '.join(forbidden)}")
+    if report["seconds"] > args.max_seconds:
+        failures.append(f"import time {report['seconds']:.2f}s over budget {args.max_seconds}s")
+    if report["rss_mb"] > args.max_rss_mb:
+        failures.append(f"RSS {report['rss_mb']:.0f} MB over budget {args.max_rss_mb} MB")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
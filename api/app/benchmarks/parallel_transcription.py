@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel chunk transcription: wall-clock speedup against core count.
+
+The audio is decoded and planned once; each worker count then transcribes
+the same plan. Pool start-up (process spawn and model load) is reported
+separately from transcription time.
+
+Usage (from the app directory):
+    python -m benchmarks.parallel_transcription audio.mp3 --workers 1 2 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio_file")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--model", default="base")
+    args = parser.parse_args()
+
+    from services.audio_workflow_orchestrator import AudioWorkflowOrchestrator
+    from services.parallel_transcription import ParallelTranscriber, default_threads_per_worker
+    from services.transcription_service import TranscriptionConfig
+    from services.vad_backends import SAMPLE_RATE
+
+    cores = os.cpu_count() or 1
+    config = TranscriptionConfig(model_name=args.model, cpu_threads=cores, temp_dir=Path(tempfile.mkdtemp()))
+    orchestrator = AudioWorkflowOrchestrator(config)
+    samples = orchestrator.ingest_audio(Path(args.audio_file), "benchmark")
+    plan = orchestrator.plan_chunks(samples)
+    print(f"{len(samples) / SAMPLE_RATE:.1f}s of audio, {len(plan)} chunks, {cores} cores")
+
+    baseline = None
+    for workers in args.workers:
+        if workers == 1:
+            started = time.perf_counter()
+            orchestrator.transcription_service.preload()
+            startup = time.perf_counter() - started
+            started = time.perf_counter()
+            list(orchestrator.transcription_service.transcribe_plan(samples, plan))
+        else:
+            # A single process owns the whole host here, unlike a Celery worker
+            transcriber = ParallelTranscriber(config, workers, default_threads_per_worker(workers, concurrency=1))
+            started = time.perf_counter()
+            executor = transcriber.executor()
+            # Wait until every process has loaded its model
+            list(executor.map(abs, range(workers * 4)))
+            startup = time.perf_counter() - started
+            started = time.perf_counter()
+            list(transcriber.transcribe_plan(Path(samples.filename), plan))
+            executor.shutdown()
+        elapsed = time.perf_counter() - started
+
+        baseline = baseline or elapsed
+        print(f"workers={workers:<3} startup={startup:7.2f}s transcribe={elapsed:8.2f}s speedup={baseline / elapsed:5.2f}x")
+
+    orchestrator.cleanup_workflow_files("benchmark")
+
+
+if __name__ == "__main__":
+    main()
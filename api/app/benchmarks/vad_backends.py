@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark Silero VAD backends: cold start and cost per minute of audio.
+
+Each backend runs in a fresh interpreter so that cold start includes the
+imports it pulls in (torch for hub/torchscript, onnxruntime for onnx).
+
+Usage (from the app directory):
+    python -m benchmarks.vad_backends audio.mp3 --backends hub onnx --model-path silero_vad.onnx
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+def run_backend(backend: str, audio_file: str, model_path: str = None) -> dict:
+    """Measure a single backend inside the current process"""
+    started = time.perf_counter()
+    from services.vad_backends import create_vad_backend, SAMPLE_RATE
+    vad = create_vad_backend(backend, model_path)
+    cold_start = time.perf_counter() - started
+
+    wav = vad.read_audio(audio_file)
+    minutes = len(wav) / SAMPLE_RATE / 60
+
+    started = time.perf_counter()
+    speech = vad.get_speech_timestamps(wav)
+    inference = time.perf_counter() - started
+
+    return {
+        "backend": backend,
+        "cold_start_s": round(cold_start, 3),
+        "audio_minutes": round(minutes, 2),
+        "inference_s": round(inference, 3),
+        "seconds_per_audio_minute": round(inference / minutes, 4) if minutes else None,
+        "speech_segments": len(speech),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio_file")
+    parser.add_argument("--backends", nargs="+", default=["hub", "onnx"])
+    parser.add_argument("--model-path", help="Local model file for the onnx/torchscript backends")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_backend(args.backends[0], args.audio_file, args.model_path)))
+        return
+
+    for backend in args.backends:
+        command = [sys.executable, "-m", "benchmarks.vad_backends", args.audio_file,
+                   "--backends", backend, "--single"]
+        if args.model_path:
+            command += ["--model-path", args.model_path]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"{backend}: failed\n{result.stderr}")
+            continue
+        print(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
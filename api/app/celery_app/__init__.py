@@ -3,6 +3,12 @@ Celery configuration and worker setup for Neuroskip
 """
 
 from .config import celery_app
-from .worker import start_worker
+
+
+def start_worker():
+    """Start the Celery worker (imports every task module)."""
+    from .worker import start_worker as _start_worker
+    _start_worker()
+
 
 __all__ = ['celery_app', 'start_worker']
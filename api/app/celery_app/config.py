@@ -15,16 +15,27 @@ celery_app = Celery(
 
 # Basic configuration
 celery_app.conf.task_track_started = True
+# Also used to size transcription process pools, so both agree on the process count
+celery_app.conf.worker_concurrency = settings.worker_concurrency
 
 # Configure autodiscovery of tasks
 celery_app.autodiscover_tasks(['tasks'])
 
+# Task modules are imported by worker processes only; the API dispatches
+# tasks by name (see celery_app.dispatch) and never imports them
+celery_app.conf.imports = ('celery_app.worker',)
+
 # Configure task routes and queues
 celery_app.conf.task_routes = {
     'tasks.youtube_processing.process_youtube_video': {'queue': 'urgent'},
+    'tasks.sharded_transcription.transcribe_chunk_range': {'queue': 'urgent'},
+    'tasks.sharded_transcription.reduce_sharded_transcription': {'queue': 'default'},
+    'tasks.sharded_transcription.handle_sharded_transcription_failure': {'queue': 'default'},
     'tasks.content_classification.classify_advertisement_content': {'queue': 'default'},
     'tasks.maintenance.cleanup_temporary_files': {'queue': 'default'},
+    'tasks.maintenance.evict_transcript_cache': {'queue': 'default'},
     'tasks.file_storage.store_audio_file': {'queue': 'default'},
+    'tasks.skip_manifest.build_skip_manifest': {'queue': 'default'},
 }
 
 # Define queues
@@ -0,0 +1,19 @@
+"""
+Task dispatch by name for processes that do not import the task modules.
+
+The API only publishes tasks; importing tasks.* would pull in the whole
+transcription stack. These helpers send the same messages by task name.
+"""
+from .config import celery_app
+
+PROCESS_YOUTUBE_VIDEO = 'tasks.youtube_processing.process_youtube_video'
+
+
+def process_youtube_video(external_id, session_key, upload=False):
+    """Queue processing of a video on the urgent queue."""
+    return celery_app.send_task(
+        PROCESS_YOUTUBE_VIDEO,
+        args=[external_id, session_key, upload],
+        queue='urgent'
+    )
+
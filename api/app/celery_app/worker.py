@@ -10,16 +10,33 @@ setup_logging(settings.log_level)
 logger = get_logger('celery.worker')
 
 from .config import celery_app
+from celery.signals import task_prerun, task_postrun
+from database.database import db
 
 # Import all task modules to ensure they are registered with Celery
 import tasks.maintenance
 import tasks.youtube_processing
+import tasks.sharded_transcription
 import tasks.file_storage
 import tasks.content_classification
+import tasks.skip_manifest
 
 logger.info("Celery worker initialized with all task modules")
 
 
+@task_prerun.connect(dispatch_uid='open_task_connection')
+def open_task_connection(**kwargs):
+    """Check out a database connection for the duration of a task."""
+    db.connect(reuse_if_open=True)
+
+
+@task_postrun.connect(dispatch_uid='close_task_connection')
+def close_task_connection(**kwargs):
+    """Return the task's database connection to the pool."""
+    if not db.is_closed():
+        db.close()
+
+
 def start_worker():
     """Start the Celery worker with debug support if enabled."""
     if settings.debug_worker:
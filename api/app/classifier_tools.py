@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Maintenance commands for the local classification stages
+
+Usage:
+    python classifier_tools.py build-ad-index [--clear]
+    python classifier_tools.py train-prefilter --output prefilter.npz [--epochs 10]
+    python classifier_tools.py report-prefilter --model prefilter.npz
+"""
+
+import argparse
+import sys
+import os
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.config import settings
+from models.Segment import Segment
+from services.ad_index import AdIndex, get_ad_index_stats
+from services.classification_stages import LOCAL_VERSION_PREFIXES
+from services.lexical_prefilter import LexicalPrefilter, evaluate
+
+# Every fifth labelled segment is held out of training for the report
+HOLDOUT_MODULO = 5
+
+def remote_labels():
+    """Condition selecting segments labelled by the AI service, not by a local stage"""
+    condition = Segment.classifier_version.is_null(False)
+    for prefix in LOCAL_VERSION_PREFIXES:
+        condition &= ~Segment.classifier_version.startswith(prefix)
+    return condition
+
+def build_ad_index(clear=False, batch_size=1000):
+    """Index every segment the AI service labelled as an ad"""
+    index = AdIndex()
+    if clear:
+        print("Clearing ad index...")
+        index.clear()
+    
+    added = seen = 0
+    last_id = 0
+    while True:
+        batch = list(
+            Segment.select(Segment.id, Segment.text)
+            .where(Segment.type == "ad", remote_labels(), Segment.id > last_id)
+            .order_by(Segment.id)
+            .limit(batch_size)
+            .tuples()
+        )
+        if not batch:
+            break
+        added += index.add_many(batch)
+        seen += len(batch)
+        last_id = batch[-1][0]
+        print(f"Indexed {added} of {seen} ad segments")
+    
+    print(f"Ad index stats: {get_ad_index_stats()}")
+    return added
+
+def labelled_segments(holdout):
+    """Get (texts, labels) of segments labelled by the AI service, split by ID"""
+    rows = (Segment
+            .select(Segment.id, Segment.text, Segment.type)
+            .where(remote_labels())
+            .order_by(Segment.id)
+            .tuples())
+    texts, labels = [], []
+    for id, text, segment_type in rows:
+        if (id % HOLDOUT_MODULO == 0) == holdout:
+            texts.append(text)
+            labels.append(1 if segment_type == "ad" else 0)
+    return texts, labels
+
+def print_report(model):
+    """Print precision and recall of the prefilter on the held-out segments"""
+    texts, labels = labelled_segments(holdout=True)
+    report = evaluate(model, texts, labels, settings.prefilter_negative_threshold)
+    print(f"Prefilter {model.version} on {report['segments']} held-out segments ({report['ads']} ads):")
+    print(f"  ad precision:       {report['precision']:.3f}")
+    print(f"  ad recall:          {report['recall']:.3f}")
+    print(f"  labelled locally:   {report['skipped_share']:.1%} below p={report['negative_threshold']}")
+    print(f"  local precision:    {report['negative_precision']:.4f}")
+    print(f"  ads missed locally: {report['missed_ads_share']:.2%}")
+    return report
+
+def train_prefilter(output, epochs=10):
+    """Train the lexical prefilter on the labelled segments and export it"""
+    texts, labels = labelled_segments(holdout=False)
+    print(f"Training on {len(texts)} segments ({sum(labels)} ads)...")
+    model = LexicalPrefilter.train(texts, labels, epochs=epochs, version=f"lexical-{settings.classifier_version}")
+    model.save(output)
+    print(f"Prefilter exported to {output}")
+    print_report(model)
+    return model
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintenance commands for the local classification stages")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build-ad-index", help="Build the near-duplicate ad index from labelled segments")
+    build.add_argument("--clear", action="store_true", help="Remove the existing index first")
+    
+    train = commands.add_parser("train-prefilter", help="Train and export the lexical prefilter")
+    train.add_argument("--output", required=True, help="Path of the exported .npz model")
+    train.add_argument("--epochs", type=int, default=10)
+    
+    report = commands.add_parser("report-prefilter", help="Report prefilter precision/recall against the AI service labels")
+    report.add_argument("--model", default=settings.prefilter_model_path, help="Path of an exported .npz model")
+    
+    args = parser.parse_args()
+    if args.command == "build-ad-index":
+        build_ad_index(clear=args.clear)
+    elif args.command == "train-prefilter":
+        train_prefilter(args.output, epochs=args.epochs)
+    elif args.command == "report-prefilter":
+        print_report(LexicalPrefilter.load(args.model))
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
+import json
+from fastapi import APIRouter, Depends, HTTPException, Header, Path, Query
+from fastapi.responses import Response
+from sse_starlette.sse import EventSourceResponse
 from typing import Optional
 
-from sympy import false
-from schemas.base import SuccessResponse, ErrorResponse
+from schemas.base import SuccessResponse, ErrorResponse, PaginatedResponse
 from models.User import User
-from models.Segment import Segment
+from models.Video import DONE, FAILED
 from middlewares.jwt import verify_jwt
-from tasks.youtube_processing import process_youtube_video
-from services.lock_service import is_task_locked, lock_task, unlock_task
+from celery_app import dispatch
+from services.lock_service import is_task_locked_async, lock_task_async, unlock_task_async
+from core.concurrency import run_db, run_dispatch
+from services import progress_store, segments_cache, skip_manifest, video_events
+from core.config import settings
+from services.video_service import VideoService
+from services.segment_repository import get_segment_repository, format_cursor, parse_cursor
 import httpx
 from core.auth import create_access_token
 import decimal
@@ -76,17 +83,7 @@ async def google_login(request_data: dict):
             )
         
         user_info = response.json()
-        user = User.get_user_by_google_id(user_info["sub"]) 
-        
-        if user is None:
-            user = User(
-                google_id=user_info["sub"],
-                email=user_info["email"],
-                name=user_info.get("name"),
-                given_name=user_info.get("given_name"),
-                picture=user_info.get("picture"),
-            )
-            user.save()
+        user = await run_db(_get_or_create_google_user, user_info)
         
         access_token = create_access_token(
             data={"sub": str(user.id), "role": "user"}
@@ -126,7 +123,7 @@ async def get_current_user_extension(payload: dict = Depends(verify_jwt)):
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token.")
         
-        user = User.get_or_none(User.id == int(user_id))
+        user = await run_db(User.get_or_none, User.id == int(user_id))
         if user is None:
             raise HTTPException(status_code=404, detail="User not found.")
         
@@ -147,9 +144,14 @@ async def get_current_user_extension(payload: dict = Depends(verify_jwt)):
 @router.get(
     "/segments/{external_id}/{provider}",
     summary="Get video segments",
-    description="Get transcription segments for a video",
+    description=(
+        "Get transcription segments for a video. With `after` or `limit`, returns one keyset page "
+        "of segments following the cursor, so clients of a video still processing fetch only new segments"
+    ),
     responses={
         200: {"description": "Segments retrieved successfully"},
+        304: {"description": "Segments unchanged since the given ETag"},
+        400: {"description": "Invalid cursor"},
         401: {"description": "Authentication failed"},
         404: {"description": "User not found"},
         422: {"description": "Insufficient balance"}
@@ -158,67 +160,83 @@ async def get_current_user_extension(payload: dict = Depends(verify_jwt)):
 async def get_segments_extension(
     external_id: str = Path(..., description="Video ID"),
     provider: str = Path(..., description="Video provider (e.g., youtube)"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a previously fetched response"),
+    after: Optional[str] = Query(None, description="Cursor from pagination.next, or a time in seconds"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of segments per page"),
     payload: dict = Depends(verify_jwt)
 ):
     """Get video transcription segments"""
     
-    locked = is_task_locked(external_id)
     user_id = payload.get("sub")
     
     if not user_id:
         raise HTTPException(status_code=404, detail="User ID not found in token")
-
-    user = User.get_or_none(User.id == int(user_id))
-    if user is None:
-        raise HTTPException(status_code=404, detail="User not found.")
     
-    # if user.balance < decimal.Decimal('0.02'):  
-    #     raise HTTPException(status_code=422, detail="Insufficient balance")
+    paginated = after is not None or limit is not None
+    
+    # Serve the serialized payload from the cache without touching the database
+    cached = None if paginated else await segments_cache.get_cached_async(provider, external_id)
+    if cached is not None:
+        return _segments_response(*cached, if_none_match)
+    
+    # Read before the database so a body loaded before an invalidation is not cached
+    generation = None if paginated else await segments_cache.get_generation_async(provider, external_id)
     
     try:
-        # Check if segments already exist
-        segments = Segment.select().where(
-            (Segment.external_id == external_id) & 
-            (Segment.provider == provider)
-        )
+        # One indexed row tells whether the video exists, is done and how far along it is
+        video = await run_db(VideoService.get, provider, external_id)
+        # A worker that died leaves the row active without the lock: process again.
+        # A failed row can still hold the lock while its task finishes cleaning up.
+        locked = await is_task_locked_async(external_id) if video is None or video.state != DONE else False
         
-        if segments.exists():
-            segments_data = [
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text,
-                    "type": segment.type
-                }
-                for segment in segments.order_by(Segment.created_at)
-            ]
+        if video is not None and (video.state == DONE or (locked and video.state != FAILED and video.chunks_done > 0)):
+            if paginated:
+                return await _segments_page(video, external_id, provider, after, limit)
             
+            segments_data = await run_db(_load_segments, external_id, provider)
             response = SuccessResponse(
                 message="Segments retrieved successfully",
                 data={
                     "segments": segments_data,
                     "external_id": external_id,
                     "provider": provider,
+                    "status": VideoService.to_status(video),
+                    "complete": video.state == DONE,
                     "cached": True
                 }
             )
-            return response.dict()
+            body = json.dumps(response.dict())
+            etag = await segments_cache.set_cached_async(
+                provider, external_id, body, complete=video.state == DONE, generation=generation
+            )
+            return _segments_response(etag, body, if_none_match)
+        
+        user = await run_db(User.get_or_none, User.id == int(user_id))
+        if user is None:
+            raise HTTPException(status_code=404, detail="User not found.")
+        
+        # if user.balance < decimal.Decimal('0.02'):  
+        #     raise HTTPException(status_code=422, detail="Insufficient balance")
         
         # If not cached and not locked, start processing
         if not locked:
-            lock_task(external_id)
             try:
+                await lock_task_async(external_id)
+            except ValueError:
+                # Another request or task took the lock since it was checked
+                locked = True
+        
+        if not locked:
+            try:
+                await run_db(VideoService.enqueue, provider, external_id)
                 # Create video_info dict with provider info
                 video_info = {"provider": provider}
                 print(f"Dispatching task for external_id: {external_id}, provider: {provider}, user_id: {user.id}")
-                process_youtube_video.apply_async(
-                    args=[external_id, user.id, False], 
-                    queue="urgent"
-                )
+                await run_dispatch(dispatch.process_youtube_video, external_id, user.id, False)
                 print(f"Task dispatched successfully for external_id: {external_id}")
             except Exception as e:
                 print(f"Error dispatching task: {str(e)}")
-                unlock_task(external_id)
+                await unlock_task_async(external_id)
                 raise HTTPException(
                     status_code=500, 
                     detail="Failed to start video processing"
@@ -231,10 +249,254 @@ async def get_segments_extension(
                 "external_id": external_id,
                 "provider": provider,
                 "status": "processing",
+                "progress": VideoService.to_status(video) if locked and video is not None else None,
                 "cached": False
             }
         )
         return response.dict()
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get(
+    "/skips/{external_id}/{provider}",
+    summary="Get video skip manifest",
+    description="Get the merged skip intervals of a video as [start, end, type_code] with version and completeness flags",
+    responses={
+        200: {"description": "Skip manifest retrieved successfully"},
+        304: {"description": "Skip manifest unchanged since the given ETag"},
+        401: {"description": "Authentication failed"},
+        404: {"description": "Video is not done and has no manifest yet"}
+    }
+)
+async def get_skip_manifest_extension(
+    external_id: str = Path(..., description="Video ID"),
+    provider: str = Path(..., description="Video provider (e.g., youtube)"),
+    accept_encoding: Optional[str] = Header(None, description="Encodings accepted by the client"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a previously fetched manifest"),
+    payload: dict = Depends(verify_jwt)
+):
+    """Get the precomputed skip manifest of a video"""
+    
+    if not payload.get("sub"):
+        raise HTTPException(status_code=404, detail="User ID not found in token")
+    
+    encoding = skip_manifest.choose_encoding(accept_encoding)
+    stored = await skip_manifest.get_manifest_async(provider, external_id, encoding)
+    
+    if stored is None:
+        # Manifests are built by the workers; this only covers done videos whose manifest expired
+        if not await run_db(_build_skip_manifest, external_id, provider):
+            raise HTTPException(status_code=404, detail="Skip manifest not available")
+        stored = await skip_manifest.get_manifest_async(provider, external_id, encoding)
+        if stored is None:
+            raise HTTPException(status_code=404, detail="Skip manifest not available")
+    
+    version, body = stored
+    headers = {"ETag": f'"{version}"', "Cache-Control": "private, no-cache", "Vary": "Accept-Encoding"}
+    if if_none_match and headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get(
+    "/progress",
+    summary="Get progress of several videos",
+    description="Live processing progress of several videos of one provider, read from Redis in one round trip",
+    responses={
+        200: {"description": "Progress retrieved successfully"},
+        400: {"description": "Too many video IDs"},
+        401: {"description": "Authentication failed"}
+    }
+)
+async def get_progress_many_extension(
+    ids: str = Query(..., description="Comma-separated video IDs"),
+    provider: str = Query("youtube", description="Video provider"),
+    payload: dict = Depends(verify_jwt)
+):
+    """Get the live progress of several videos"""
+    
+    external_ids = list(dict.fromkeys(external_id for external_id in ids.split(",") if external_id))
+    if len(external_ids) > settings.max_page_size:
+        raise HTTPException(status_code=400, detail=f"At most {settings.max_page_size} video IDs per request")
+    
+    response = SuccessResponse(
+        message="Progress retrieved successfully",
+        data={
+            "provider": provider,
+            "progress": await progress_store.get_progress_many_async(provider, external_ids)
+        }
+    )
+    return response.dict()
+
+@router.get(
+    "/progress/{external_id}/{provider}",
+    summary="Get video progress",
+    description="Live processing progress of a video (stage, chunks, duration, ETA, worker), read from Redis only",
+    responses={
+        200: {"description": "Progress retrieved successfully"},
+        401: {"description": "Authentication failed"},
+        404: {"description": "No live progress for this video"}
+    }
+)
+async def get_progress_extension(
+    external_id: str = Path(..., description="Video ID"),
+    provider: str = Path(..., description="Video provider (e.g., youtube)"),
+    payload: dict = Depends(verify_jwt)
+):
+    """Get the live progress of a video"""
+    
+    progress = await progress_store.get_progress_async(provider, external_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="No progress for this video")
+    
+    response = SuccessResponse(
+        message="Progress retrieved successfully",
+        data={
+            "external_id": external_id,
+            "provider": provider,
+            "progress": progress
+        }
+    )
+    return response.dict()
+
+@router.get(
+    "/events/{external_id}/{provider}",
+    summary="Stream video processing events",
+    description=(
+        "Server-Sent Events stream of a video: progress, skip intervals as they are "
+        "classified, then a final complete (or failed) event"
+    ),
+    responses={
+        200: {"description": "Event stream opened"},
+        401: {"description": "Authentication failed"},
+        404: {"description": "Video was never requested"}
+    }
+)
+async def stream_video_events(
+    external_id: str = Path(..., description="Video ID"),
+    provider: str = Path(..., description="Video provider (e.g., youtube)"),
+    payload: dict = Depends(verify_jwt)
+):
+    """Stream the processing events of a video"""
+    
+    if not payload.get("sub"):
+        raise HTTPException(status_code=404, detail="User ID not found in token")
+    
+    # Subscribe before reading the current state so no event falls in between
+    subscription = video_events.hub.subscribe(provider, external_id)
+    try:
+        video = await run_db(VideoService.get, provider, external_id)
+        manifest = await skip_manifest.get_manifest_async(provider, external_id, "identity")
+        if manifest is None and video is not None and video.state == DONE:
+            # Expired or never built: build it now, as /skips does
+            await run_db(_build_skip_manifest, external_id, provider)
+            manifest = await skip_manifest.get_manifest_async(provider, external_id, "identity")
+    except Exception:
+        video_events.hub.unsubscribe(subscription)
+        raise
+    
+    if video is None:
+        video_events.hub.unsubscribe(subscription)
+        raise HTTPException(status_code=404, detail="Video not found")
+    
+    async def events():
+        try:
+            yield {"event": video_events.PROGRESS, "data": json.dumps(VideoService.to_status(video))}
+            if video.state == FAILED:
+                yield {"event": video_events.FAILED, "data": json.dumps({"state": FAILED})}
+                return
+            
+            if manifest is not None:
+                version, body = manifest
+                yield {"event": video_events.INTERVALS, "data": body.decode()}
+                # A manifest left from an earlier run only counts once this run is done
+                if video.state == DONE and json.loads(body)["complete"]:
+                    yield {"event": video_events.COMPLETE, "data": json.dumps({"version": int(version)})}
+                    return
+            elif video.state == DONE:
+                # Nothing left to wait for even though no manifest could be stored
+                yield {"event": video_events.COMPLETE, "data": json.dumps({"version": None})}
+                return
+            
+            while True:
+                event, data = await subscription.get()
+                yield {"event": event, "data": json.dumps(data)}
+                if event in (video_events.COMPLETE, video_events.FAILED):
+                    return
+        finally:
+            video_events.hub.unsubscribe(subscription)
+    
+    return EventSourceResponse(events(), ping=settings.video_events_ping_seconds)
+
+def _get_or_create_google_user(user_info: dict) -> User:
+    """Get the user of a Google account, creating it on first login"""
+    user = User.get_user_by_google_id(user_info["sub"]) 
+    
+    if user is None:
+        user = User(
+            google_id=user_info["sub"],
+            email=user_info["email"],
+            name=user_info.get("name"),
+            given_name=user_info.get("given_name"),
+            picture=user_info.get("picture"),
+        )
+        user.save()
+    return user
+
+def _load_segments(external_id: str, provider: str) -> list:
+    """Load the segments of a video as dicts, in timeline order, with times in seconds"""
+    return get_segment_repository().load(provider, external_id)
+
+async def _segments_page(video, external_id: str, provider: str, after: Optional[str], limit: Optional[int]) -> dict:
+    """Build one keyset page of a video's segments"""
+    try:
+        cursor = parse_cursor(after) if after is not None else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    limit = min(limit or settings.segments_page_size, settings.segments_max_page_size)
+    # One extra row tells whether another page follows
+    segments_data = await run_db(get_segment_repository().page, provider, external_id, cursor, limit + 1)
+    has_more = len(segments_data) > limit
+    segments_data = segments_data[:limit]
+    
+    response = PaginatedResponse(
+        message="Segments retrieved successfully",
+        data={
+            "segments": segments_data,
+            "external_id": external_id,
+            "provider": provider,
+            "status": VideoService.to_status(video),
+            "complete": video.state == DONE and not has_more
+        },
+        pagination={
+            "after": after,
+            "next": format_cursor(segments_data[-1]) if segments_data else after,
+            "limit": limit,
+            "has_more": has_more
+        }
+    )
+    return response.dict()
+
+def _segments_response(etag: str, body: str, if_none_match: Optional[str]) -> Response:
+    """Build the segments response, or a 304 when the client already has this ETag"""
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _build_skip_manifest(external_id: str, provider: str) -> bool:
+    """
+    Build and store the skip manifest of a done video whose manifest is missing.
+
+    Videos still queued or processing get theirs from the workers, so a
+    request never rebuilds one while they run.
+    """
+    video = VideoService.get(provider, external_id)
+    if video is None or video.state != DONE:
+        return False
+    return skip_manifest.refresh_manifest(provider, external_id, processing=False) is not None
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Path
 from schemas.base import SuccessResponse
 from core.config import settings
+from database.database import get_pool_stats
+from services.video_events import hub
 
 router = APIRouter(tags=["System"])
 
@@ -77,3 +79,29 @@ async def extension_status(
         }
     )
     return response.dict()
+
+@router.get(
+    "/metrics/database",
+    summary="Database pool metrics",
+    description="Connection pool checkouts, waits and sizes of this API process"
+)
+async def database_metrics():
+    """Database connection pool metrics endpoint"""
+    response = SuccessResponse(
+        message="Database metrics retrieved successfully",
+        data=get_pool_stats()
+    )
+    return response.dict()
+
+@router.get(
+    "/metrics/events",
+    summary="Event stream metrics",
+    description="Videos and event stream subscribers followed by this API process"
+)
+async def event_metrics():
+    """Event stream fan-out metrics endpoint"""
+    response = SuccessResponse(
+        message="Event metrics retrieved successfully",
+        data=hub.stats()
+    )
+    return response.dict()
@@ -4,6 +4,7 @@ from schemas.base import SuccessResponse, ErrorResponse
 from services.user_service import UserService
 from middlewares.jwt import verify_jwt
 from core.exceptions import AuthenticationError
+from core.concurrency import run_db
 import decimal
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -24,7 +25,7 @@ async def get_current_user(payload: dict = Depends(verify_jwt)):
     if not user_id:
         raise AuthenticationError("Invalid token")
     
-    user_info = UserService.get_user_public_info(int(user_id))
+    user_info = await run_db(UserService.get_user_public_info, int(user_id))
     response = SuccessResponse(
         message="User information retrieved successfully",
         data={
@@ -50,7 +51,7 @@ async def get_user_by_id(
     payload: dict = Depends(verify_jwt)
 ):
     """Get user information by ID"""
-    user = UserService.get_user_by_id(user_id)
+    user = await run_db(UserService.get_user_by_id, user_id)
     response = SuccessResponse(
         message="User information retrieved successfully",
         data={
@@ -122,7 +123,7 @@ async def add_balance(
     if not amount or amount <= 0:
         raise HTTPException(status_code=422, detail="Amount must be positive")
     
-    updated_user = UserService.add_balance(int(user_id), decimal.Decimal(str(amount)))
+    updated_user = await run_db(UserService.add_balance, int(user_id), decimal.Decimal(str(amount)))
     response = SuccessResponse(
         message="Balance added successfully",
         data={"new_balance": float(updated_user.balance)}
@@ -154,7 +155,7 @@ async def subtract_balance(
     if not amount or amount <= 0:
         raise HTTPException(status_code=422, detail="Amount must be positive")
     
-    updated_user = UserService.subtract_balance(int(user_id), decimal.Decimal(str(amount)))
+    updated_user = await run_db(UserService.subtract_balance, int(user_id), decimal.Decimal(str(amount)))
     response = SuccessResponse(
         message="Balance subtracted successfully",
         data={"new_balance": float(updated_user.balance)}
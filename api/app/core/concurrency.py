@@ -0,0 +1,52 @@
+"""
+Bounded executors for blocking calls made from async endpoints
+
+Peewee queries and Celery publishing block. Running them on the event loop
+stalls every in-flight request of the worker, so async endpoints hand them
+to small dedicated thread pools instead. The pools are bounded so a slow
+database queues requests instead of opening unlimited connections.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+from core.config import settings
+
+T = TypeVar("T")
+
+_db_executor = ThreadPoolExecutor(max_workers=settings.db_executor_workers, thread_name_prefix="db")
+_dispatch_executor = ThreadPoolExecutor(max_workers=settings.dispatch_executor_workers, thread_name_prefix="dispatch")
+
+
+def _with_connection(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    from database.database import db
+    # Each executor thread holds its own connection for the duration of the call
+    with db.connection_context():
+        return func(*args, **kwargs)
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking database call on the database executor.
+
+    Args:
+        func: Callable doing peewee queries
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, functools.partial(_with_connection, func, *args, **kwargs))
+
+
+async def run_dispatch(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking task dispatch (e.g. apply_async) on the dispatch executor.
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_dispatch_executor, functools.partial(func, *args, **kwargs))
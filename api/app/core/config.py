@@ -36,9 +36,16 @@ class Settings(BaseSettings):
     # ==================== DATABASE ====================
     database_url: str = Field(default="sqlite:///./neuroskip.db", env="DATABASE_URL", description="Database URL")
     connection_string_postgres: Optional[str] = Field(default=None, env="CONNECTION_STRING_POSTGRES", description="PostgreSQL connection")
+    segment_insert_batch_size: int = Field(default=500, env="SEGMENT_INSERT_BATCH_SIZE", description="Rows per bulk segment insert statement")
+    db_executor_workers: int = Field(default=16, env="DB_EXECUTOR_WORKERS", description="Threads running blocking database calls for async endpoints")
+    db_max_connections: int = Field(default=20, env="DB_MAX_CONNECTIONS", description="Maximum pooled Postgres connections per process")
+    db_stale_timeout: int = Field(default=300, env="DB_STALE_TIMEOUT", description="Seconds after which a pooled connection is recycled")
+    db_pool_wait_timeout: int = Field(default=10, env="DB_POOL_WAIT_TIMEOUT", description="Seconds to wait for a free pooled connection")
+    auto_migrate: bool = Field(default=False, env="AUTO_MIGRATE", description="Apply pending migrations when the API starts (development)")
     
     # ==================== REDIS/CELERY ====================
     redis_string: str = Field(env="REDIS_STRING", description="Redis connection string")
+    dispatch_executor_workers: int = Field(default=4, env="DISPATCH_EXECUTOR_WORKERS", description="Threads publishing Celery tasks for async endpoints")
     
     # ==================== CORS ====================
     cors_origins: List[str] = Field(
@@ -88,10 +95,82 @@ class Settings(BaseSettings):
     
     # ==================== AI SERVICES ====================
     ad_ai_url: str = Field(env="AD_AI_URL", description="AI service URL")
+    ad_ai_timeout: float = Field(default=10.0, env="AD_AI_TIMEOUT", description="AI service request timeout in seconds")
+    ad_ai_max_retries: int = Field(default=3, env="AD_AI_MAX_RETRIES", description="Retries for failed AI service requests")
+    ad_ai_backoff: float = Field(default=0.5, env="AD_AI_BACKOFF", description="Backoff factor between AI service retries")
+    ad_ai_concurrency: int = Field(default=8, env="AD_AI_CONCURRENCY", description="Concurrent AI service requests per task")
+    classifier_version: str = Field(default="ad-ai-v1", env="CLASSIFIER_VERSION", description="Version recorded on classified segments")
+    
+    # ==================== AD INDEX ====================
+    ad_index_enabled: bool = Field(default=True, env="AD_INDEX_ENABLED", description="Label near-duplicates of known ad reads locally")
+    ad_index_threshold: float = Field(default=0.7, env="AD_INDEX_THRESHOLD", description="Minimum estimated Jaccard similarity for a local ad label")
+    ad_index_num_perm: int = Field(default=64, env="AD_INDEX_NUM_PERM", description="MinHash permutations per signature")
+    ad_index_bands: int = Field(default=16, env="AD_INDEX_BANDS", description="LSH bands (num_perm must be divisible by bands)")
+    
+    # ==================== CLASSIFICATION STAGES ====================
+    classification_stages: str = Field(default="ad_index,lexical_prefilter", env="CLASSIFICATION_STAGES", description="Comma-separated local stages run before the AI service")
+    prefilter_model_path: Optional[str] = Field(default=None, env="PREFILTER_MODEL_PATH", description="Exported lexical prefilter model (.npz)")
+    prefilter_negative_threshold: float = Field(default=0.05, env="PREFILTER_NEGATIVE_THRESHOLD", description="Ad probability below which a segment is labelled content locally")
+    
+    # ==================== TRANSCRIPTION ====================
+    whisper_model: str = Field(default="base", env="WHISPER_MODEL", description="Whisper model name")
+    whisper_compute_type: str = Field(default="int8", env="WHISPER_COMPUTE_TYPE", description="Whisper compute type")
+    cpu_threads: int = Field(default=4, env="CPU_THREADS", description="CPU threads per Whisper model")
+    transcription_workers: int = Field(default=1, env="TRANSCRIPTION_WORKERS", description="Processes transcribing chunks in parallel (1 disables the pool)")
+    transcription_worker_threads: Optional[int] = Field(default=None, env="TRANSCRIPTION_WORKER_THREADS", description="CPU threads per transcription process (defaults to cores / (worker concurrency * workers))")
+    worker_concurrency: Optional[int] = Field(default=None, env="WORKER_CONCURRENCY", description="Celery worker processes per host (defaults to cores)")
+    warm_models_on_startup: bool = Field(default=True, env="WARM_MODELS_ON_STARTUP", description="Load models when a worker process starts")
+    
+    # ==================== VOICE ACTIVITY DETECTION ====================
+    vad_backend: str = Field(default="hub", env="VAD_BACKEND", description="VAD backend (hub, onnx or torchscript)")
+    vad_model_path: Optional[str] = Field(default=None, env="VAD_MODEL_PATH", description="Local Silero VAD model file")
+    vad_model_sha256: Optional[str] = Field(default=None, env="VAD_MODEL_SHA256", description="Expected SHA256 of the VAD model file (required by the onnx and torchscript backends)")
+    vad_threshold: float = Field(default=0.5, env="VAD_THRESHOLD", description="Speech probability threshold")
+    
+    # ==================== CHUNK PLANNING ====================
+    chunk_target_seconds: float = Field(default=180.0, env="CHUNK_TARGET_SECONDS", description="Target transcription chunk length")
+    chunk_min_seconds: float = Field(default=30.0, env="CHUNK_MIN_SECONDS", description="Minimum transcription chunk length")
+    chunk_max_seconds: float = Field(default=300.0, env="CHUNK_MAX_SECONDS", description="Maximum transcription chunk length")
+    chunk_overlap_seconds: float = Field(default=2.0, env="CHUNK_OVERLAP_SECONDS", description="Overlap used by fixed-length cuts")
+    
+    # ==================== TRANSCRIPT CACHE ====================
+    transcript_cache_enabled: bool = Field(default=True, env="TRANSCRIPT_CACHE_ENABLED", description="Reuse transcripts of identical audio")
+    transcript_cache_retention_days: int = Field(default=90, env="TRANSCRIPT_CACHE_RETENTION_DAYS", description="Days an unused cached transcript is kept")
+    transcript_cache_max_entries: int = Field(default=100000, env="TRANSCRIPT_CACHE_MAX_ENTRIES", description="Maximum cached transcripts")
+    
+    # ==================== SHARDED TRANSCRIPTION ====================
+    shard_transcription: bool = Field(default=False, env="SHARD_TRANSCRIPTION", description="Fan long videos out to several workers")
+    shard_min_chunks: int = Field(default=8, env="SHARD_MIN_CHUNKS", description="Minimum planned chunks before a video is sharded")
+    shard_chunks_per_task: int = Field(default=2, env="SHARD_CHUNKS_PER_TASK", description="Planned chunks transcribed by each subtask")
+    shard_state_ttl: int = Field(default=86400, env="SHARD_STATE_TTL", description="Lifetime of sharded job state in Redis (seconds)")
+    blob_store_dir: str = Field(default="/tmp/neuroskip_blobs", env="BLOB_STORE_DIR", description="Shared content-addressed blob directory")
+    
+    # ==================== SEGMENTS CACHE ====================
+    segments_cache_ttl: int = Field(default=3600, env="SEGMENTS_CACHE_TTL", description="Seconds a finished video's segments stay cached")
+    segments_cache_processing_ttl: int = Field(default=10, env="SEGMENTS_CACHE_PROCESSING_TTL", description="Seconds segments of a video still processing stay cached")
+    segments_cache_local_size: int = Field(default=1024, env="SEGMENTS_CACHE_LOCAL_SIZE", description="Videos kept in the in-process cache tier")
+    
+    # ==================== VIDEO EVENTS ====================
+    video_events_queue_size: int = Field(default=64, env="VIDEO_EVENTS_QUEUE_SIZE", description="Events buffered per stream subscriber before the oldest is dropped")
+    video_events_ping_seconds: int = Field(default=15, env="VIDEO_EVENTS_PING_SECONDS", description="Seconds between keep-alive pings on idle event streams")
+    
+    # ==================== PROGRESS ====================
+    progress_ttl: int = Field(default=3600, env="PROGRESS_TTL", description="Seconds the live progress of a video is kept after its last update")
+    
+    # ==================== SEGMENT STORAGE ====================
+    segment_storage: str = Field(default="rows", env="SEGMENT_STORAGE", description="Segment read layout: rows or blob (packed per video, rows as fallback)")
+    segment_blob_level: int = Field(default=10, env="SEGMENT_BLOB_LEVEL", description="zstd level of packed transcripts")
+    segment_blob_drop_rows: bool = Field(default=False, env="SEGMENT_BLOB_DROP_ROWS", description="Delete a video's segment rows once they are packed")
+    
+    # ==================== SKIP MANIFEST ====================
+    skip_manifest_merge_gap: float = Field(default=1.0, env="SKIP_MANIFEST_MERGE_GAP", description="Seconds between same-type intervals that are merged")
+    skip_manifest_ttl: int = Field(default=30 * 86400, env="SKIP_MANIFEST_TTL", description="Seconds a stored skip manifest is kept in Redis")
     
     # ==================== PAGINATION ====================
     default_page_size: int = Field(default=10, description="Default pagination size")
     max_page_size: int = Field(default=100, description="Maximum pagination size")
+    segments_page_size: int = Field(default=500, env="SEGMENTS_PAGE_SIZE", description="Default number of segments per incremental page")
+    segments_max_page_size: int = Field(default=2000, env="SEGMENTS_MAX_PAGE_SIZE", description="Maximum number of segments per incremental page")
     
     class Config:
         """Pydantic config"""
@@ -0,0 +1,34 @@
+"""
+Startup timing for the API process.
+
+Records how long each startup phase takes (imports, settings, logging,
+schema check, router registration, ...) so a single log line shows where
+boot time goes.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class StartupTimer:
+    """Accumulates the duration of named startup phases"""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block as the given phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def report(self) -> str:
+        """Format the phases and the total since the timer started"""
+        total = time.perf_counter() - self.started
+        phases = ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.phases.items())
+        return f"Startup took {total * 1000:.0f}ms ({phases})"
@@ -1,3 +1,3 @@
-from .database import db
+from .database import db, get_pool_stats
 
-__all__ = ['db']
+__all__ = ['db', 'get_pool_stats']
@@ -1,20 +1,94 @@
 import os
+import sqlite3
+import threading
+import time
 from core.config import settings
 from urllib.parse import urlparse
-from peewee import SqliteDatabase, PostgresqlDatabase
+from peewee import SqliteDatabase
+from playhouse.pool import MaxConnectionsExceeded, PooledPostgresqlDatabase
+
+
+class MonitoredPooledPostgresqlDatabase(PooledPostgresqlDatabase):
+    """Connection pool that counts checkouts and time spent waiting for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self._waiting = threading.local()
+        self._metrics = {
+            "checkouts": 0,
+            "created": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0
+        }
+
+    def _count(self, name, value=1):
+        with self._metrics_lock:
+            self._metrics[name] += value
+
+    def connect(self, reuse_if_open=False):
+        self._waiting.exhausted = False
+        started = time.perf_counter()
+        try:
+            return super().connect(reuse_if_open)
+        except MaxConnectionsExceeded:
+            self._count("timeouts")
+            raise
+        finally:
+            if self._waiting.exhausted:
+                self._count("waits")
+                self._count("wait_seconds", time.perf_counter() - started)
+
+    def _connect(self):
+        with self._pool_lock:
+            created_before = len(self._in_use) + len(self._connections)
+            try:
+                conn = super()._connect()
+            except MaxConnectionsExceeded:
+                self._waiting.exhausted = True
+                raise
+            total = len(self._in_use) + len(self._connections)
+        self._count("checkouts")
+        if total > created_before:
+            self._count("created")
+        return conn
+
+    def pool_stats(self):
+        """Pool sizes and cumulative checkout/wait counters"""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics.update({
+            "pooled": True,
+            "max_connections": self._max_connections,
+            "in_use": len(self._in_use),
+            "idle": len(self._connections)
+        })
+        return metrics
 
 
 if settings.connection_string_postgres:
     parsed = urlparse(settings.connection_string_postgres)
-    db = PostgresqlDatabase(
+    db = MonitoredPooledPostgresqlDatabase(
     database=parsed.path[1:],
     user=parsed.username,
     password=parsed.password,
     host=parsed.hostname,
-    port=parsed.port
+    port=parsed.port,
+    max_connections=settings.db_max_connections,
+    stale_timeout=settings.db_stale_timeout,
+    timeout=settings.db_pool_wait_timeout
     )
     print("Using postgres")
 else:
     db = SqliteDatabase('segments.db')
+    # SQLite supports INSERT ... RETURNING from 3.35
+    db.returning_clause = sqlite3.sqlite_version_info >= (3, 35, 0)
     print("Using Sqlite")
-    
\ No newline at end of file
+
+
+def get_pool_stats():
+    """Get connection pool metrics of this process"""
+    if hasattr(db, "pool_stats"):
+        return db.pool_stats()
+    return {"pooled": False}
@@ -1,76 +1,103 @@
 import os
-import debugpy
+import time
 
-# Modern logging setup
-from core.logging import setup_logging, get_app_logger
+# Everything after this line counts as startup time
+_startup_started = time.perf_counter()
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.exceptions import RequestValidationError
-from starlette.exceptions import HTTPException as StarletteHTTPException
+from core.startup import StartupTimer
 
-# New imports for modern architecture
-from core.config import settings
-from core.exceptions import BaseAPIException
-from core.error_handlers import (
-    base_exception_handler,
-    http_exception_handler,
-    validation_exception_handler,
-    general_exception_handler
-)
+startup_timer = StartupTimer(_startup_started)
 
-# Import controllers
-from controllers.user_controller import router as user_router
-from controllers.system_controller import router as system_router
-from controllers.extension_controller import router as extension_router
+with startup_timer.phase("settings"):
+    from core.config import settings
 
-# Import middlewares
-from middlewares.logging import RequestLoggingMiddleware
+with startup_timer.phase("imports"):
+    # Modern logging setup
+    from core.logging import setup_logging, get_app_logger
 
-import migrate
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.exceptions import RequestValidationError
+    from starlette.exceptions import HTTPException as StarletteHTTPException
+
+    # New imports for modern architecture
+    from core.exceptions import BaseAPIException
+    from core.error_handlers import (
+        base_exception_handler,
+        http_exception_handler,
+        validation_exception_handler,
+        general_exception_handler
+    )
+
+    # Import controllers
+    from controllers.user_controller import router as user_router
+    from controllers.system_controller import router as system_router
+    from controllers.extension_controller import router as extension_router
+
+    # Import middlewares
+    from middlewares.logging import RequestLoggingMiddleware
+
+    import migrate
 
 def create_app():
     # Setup modern logging first
-    setup_logging(settings.log_level)
-    logger = get_app_logger()
+    with startup_timer.phase("logging"):
+        setup_logging(settings.log_level)
+        logger = get_app_logger()
     
-    # Run database migrations
-    logger.info("Running database migrations...")
-    try:
-        migrate.create_tables()
-        logger.info("Database migrations completed successfully")
-    except Exception as e:
-        logger.error(f"Failed to run database migrations: {e}")
-        raise
+    # Migrations run once per deploy (python migrate.py); here only the version is checked
+    with startup_timer.phase("schema_check"):
+        current, latest = migrate.check_schema_version()
+        if current < latest:
+            if not settings.auto_migrate:
+                logger.error(f"Database schema is at version {current}, expected {latest}. Run `python migrate.py`.")
+                raise RuntimeError("Database schema is out of date")
+            logger.info(f"Applying migrations {current + 1}..{latest}...")
+            migrate.run_migrations()
     
     # Initialize FastAPI with modern configuration
-    app = FastAPI(
-        title=settings.app_name,
-        description=settings.description,
-        version=settings.app_version,
-        docs_url=settings.docs_url,
-        redoc_url=settings.redoc_url,
-        openapi_url=settings.openapi_url,
-        openapi_tags=[
-            {
-                "name": "System",
-                "description": "System health and status endpoints"
-            },
-            {
-                "name": "Users", 
-                "description": "User management and profile operations"
-            },
-            {
-                "name": "Browser Extension",
-                "description": "Browser extension specific endpoints"
-            }
-        ]
-    )
+    with startup_timer.phase("app"):
+        app = FastAPI(
+            title=settings.app_name,
+            description=settings.description,
+            version=settings.app_version,
+            docs_url=settings.docs_url,
+            redoc_url=settings.redoc_url,
+            openapi_url=settings.openapi_url,
+            openapi_tags=[
+                {
+                    "name": "System",
+                    "description": "System health and status endpoints"
+                },
+                {
+                    "name": "Users", 
+                    "description": "User management and profile operations"
+                },
+                {
+                    "name": "Browser Extension",
+                    "description": "Browser extension specific endpoints"
+                }
+            ]
+        )
      
     if settings.debug:
+        import debugpy
         debugpy.listen(("0.0.0.0", 5678))
         logger.debug("Debugpy escutando na porta 5678 para FastAPI...")
 
+    with startup_timer.phase("middlewares"):
+        _add_middlewares(app)
+
+    # Register modern API routes
+    with startup_timer.phase("routers"):
+        app.include_router(system_router, prefix="/v2")
+        app.include_router(user_router, prefix="/v2")
+        app.include_router(extension_router, prefix="/v2")
+    
+    logger.info(startup_timer.report())
+    return app
+
+def _add_middlewares(app):
     # Setup CORS
     cors_origins = settings.cors_origins.copy()
     if settings.development:
@@ -97,11 +124,4 @@ def create_app():
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(Exception, general_exception_handler)
 
-    # Register modern API routes
-    app.include_router(system_router, prefix="/v2")
-    app.include_router(user_router, prefix="/v2")
-    app.include_router(extension_router, prefix="/v2")
-    
-    return app
-
 app = create_app()  
\ No newline at end of file
@@ -1,56 +1,332 @@
 #!/usr/bin/env python3
 """
-Database migration script for creating tables
+Database migration runner
+
+Applies versioned migrations and records them in the schema_version table.
+Run once per deploy, before starting the API and workers:
+
+    python migrate.py           # apply pending migrations
+    python migrate.py status    # show the current and latest version
+    python migrate.py drop      # drop all tables
 """
 
 import sys
 import os
+import time
 
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from datetime import datetime
+from peewee import (
+    AutoField, BooleanField, Case, CharField, DateTimeField, DecimalField, FloatField, IntegerField,
+    Model, PostgresqlDatabase, TextField, Value, fn
+)
+from playhouse.migrate import SchemaMigrator, migrate
 from database.database import db
 from models.User import User
 from models.Segment import Segment
+from models.TranscriptCache import TranscriptCache
+from models.Video import Video, DONE
+from models.TranscriptBlob import TranscriptBlob
+from models.SkipInterval import SkipInterval
+from models.SchemaVersion import SchemaVersion
 
-def create_tables():
-    """Create all tables in the database"""
+# Every model with a table, in creation order
+MODELS = [User, Segment, TranscriptCache, Video, TranscriptBlob, SkipInterval]
+
+# Rows per UPDATE when backfilling existing segments
+BACKFILL_BATCH_SIZE = 1000
+
+def remove_duplicate_segments(*key):
+    """Delete duplicate segment rows so the unique segment index can be created"""
+    if not Segment.table_exists():
+        return 0
     
+    key = key or (Segment.provider, Segment.external_id, Segment.start, Segment.end)
+    keep = Segment.select(fn.MIN(Segment.id)).group_by(*key)
+    return Segment.delete().where(Segment.id.not_in(keep)).execute()
+
+def _parse_ms(value):
     try:
-        if db.is_closed():
-            db.connect()
+        return int(round(float(value) * 1000))
+    except (TypeError, ValueError):
+        return None
+
+def backfill_segment_times(batch_size=BACKFILL_BATCH_SIZE, log=lambda *args: None):
+    """
+    Fill start_ms/end_ms from the text columns, one committed batch at a time.
+    
+    Rows are walked by id, so an interrupted run resumes where it stopped.
+    Rows whose text times cannot be parsed keep NULL and are skipped by reads.
+    
+    Returns:
+        Tuple of (updated rows, unparseable rows)
+    """
+    updated = unparseable = 0
+    last_id = 0
+    
+    while True:
+        batch = list(Segment
+                     .select(Segment.id, Segment.start, Segment.end)
+                     .where(Segment.id > last_id, Segment.start_ms.is_null())
+                     .order_by(Segment.id)
+                     .limit(batch_size)
+                     .tuples())
+        if not batch:
+            break
+        last_id = batch[-1][0]
         
-        # Create tables
-        db.create_tables([User, Segment], safe=True)
+        times = {}
+        for segment_id, start, end in batch:
+            start_ms, end_ms = _parse_ms(start), _parse_ms(end)
+            if start_ms is None or end_ms is None:
+                unparseable += 1
+            else:
+                times[segment_id] = (start_ms, end_ms)
         
-        return True
+        if times:
+            with db.atomic():
+                updated += (Segment
+                            .update(start_ms=Case(Segment.id, [(i, t[0]) for i, t in times.items()]),
+                                    end_ms=Case(Segment.id, [(i, t[1]) for i, t in times.items()]))
+                            .where(Segment.id.in_(list(times)))
+                            .execute())
+        log(f"Backfilled segment times up to id {last_id} ({updated} rows)")
+    
+    return updated, unparseable
+
+def baseline_models():
+    """
+    Snapshot of the models at schema version 1.
+    
+    The baseline creates its tables from these frozen definitions rather than
+    the live models, so version 1 means the same schema however the models
+    change later. The class names match the live models, as peewee derives
+    index names from them.
+    """
+    class User(Model):
+        id = AutoField()
+        google_id = CharField(unique=True, index=True)
+        email = CharField(unique=True, index=True)
+        name = CharField(null=True)
+        given_name = CharField(null=True)
+        picture = CharField(null=True)
+        balance = DecimalField(default=0)
+        requests = IntegerField(default=0)
+        created_at = DateTimeField(default=datetime.utcnow)
+        updated_at = DateTimeField(default=datetime.utcnow)
         
-    except Exception as e:
-        print(f"Error creating tables: {e}")
-        raise
+        class Meta:
+            database = db
+            table_name = 'users'
+    
+    class Segment(Model):
+        id = AutoField()
+        hash_id = CharField(max_length=255)
+        start = CharField(max_length=10)
+        end = CharField(max_length=10)
+        text = TextField()
+        type = CharField(max_length=5, null=True)
+        label_confidence = FloatField(null=True)
+        classifier_version = CharField(max_length=20, null=True)
+        revised = BooleanField(default=False)
+        revised_at = DateTimeField(null=True)
+        porcentage = IntegerField()
+        provider = CharField(max_length=15, null=True)
+        external_id = CharField(max_length=15, null=True)
+        created_at = DateTimeField(default=datetime.utcnow)
+        updated_at = DateTimeField(default=datetime.utcnow)
+        
+        class Meta:
+            database = db
+            table_name = 'segment'
+            indexes = (
+                (('provider', 'external_id', 'start', 'end'), True),
+            )
+    
+    class TranscriptCache(Model):
+        id = AutoField()
+        audio_hash = CharField(max_length=64)
+        model_name = CharField(max_length=50)
+        decode_profile = CharField(max_length=100)
+        language = CharField(max_length=10, null=True)
+        segments = TextField()
+        hits = IntegerField(default=0)
+        created_at = DateTimeField(default=datetime.utcnow)
+        last_used_at = DateTimeField(default=datetime.utcnow)
+        
+        class Meta:
+            database = db
+            table_name = 'transcript_cache'
+            indexes = (
+                (('audio_hash', 'model_name', 'decode_profile'), True),
+            )
+    
+    return [User, Segment, TranscriptCache]
+
+def add_missing_columns(models):
+    """Add nullable model columns that are missing from existing tables"""
+    migrator = SchemaMigrator.from_database(db)
+    operations = []
+    
+    for model in models:
+        if not model.table_exists():
+            continue
+        existing = {column.name for column in db.get_columns(model._meta.table_name)}
+        for field in model._meta.sorted_fields:
+            if field.column_name not in existing and field.null:
+                operations.append(migrator.add_column(model._meta.table_name, field.column_name, field))
+    
+    if operations:
+        migrate(*operations)
+    return len(operations)
+
+def migration_0001_baseline(log):
+    """Tables, columns and indexes up to the introduction of schema versions"""
+    models = baseline_models()
+    add_missing_columns(models)
+    remove_duplicate_segments()
+    db.create_tables(models, safe=True)
+
+def migration_0002_numeric_segment_times(log):
+    """Integer millisecond segment times, backfilled, with the unique index moved onto them"""
+    migrator = SchemaMigrator.from_database(db)
+    existing = {column.name for column in db.get_columns(Segment._meta.table_name)}
+    migrate(*[
+        migrator.add_column(Segment._meta.table_name, name, IntegerField(null=True))
+        for name in ("start_ms", "end_ms") if name not in existing
+    ])
+    # Rebuilt below: the backfill can map distinct text times to the same milliseconds
+    db.execute_sql("DROP INDEX IF EXISTS segment_provider_external_id_start_ms_end_ms")
+    db.execute_sql("DROP INDEX IF EXISTS segment_provider_external_id_start_end")
+    updated, unparseable = backfill_segment_times(log=log)
+    log(f"Backfilled {updated} segments, {unparseable} with unparseable times")
+    with db.atomic():
+        remove_duplicate_segments(Segment.provider, Segment.external_id, Segment.start_ms, Segment.end_ms)
+        migrate(migrator.add_index(Segment._meta.table_name, ("provider", "external_id", "start_ms", "end_ms"), unique=True))
+
+# Commits its own batches, so a large backfill does not hold one long transaction
+migration_0002_numeric_segment_times.atomic = False
+
+def migration_0003_video_status(log):
+    """Video status table, with a done row for every video that already has segments"""
+    db.create_tables([Video], safe=True)
+    processed = (Segment
+                 .select(Segment.provider, Segment.external_id, Value(DONE), Value(0), Value(0),
+                         fn.MAX(Segment.hash_id), fn.MIN(Segment.created_at), fn.MAX(Segment.updated_at),
+                         fn.MAX(Segment.updated_at))
+                 .where(Segment.provider.is_null(False), Segment.external_id.is_null(False))
+                 .group_by(Segment.provider, Segment.external_id))
+    Video.insert_from(processed, [
+        Video.provider, Video.external_id, Video.state, Video.chunks_total, Video.chunks_done,
+        Video.audio_hash, Video.created_at, Video.updated_at, Video.finished_at
+    ]).on_conflict_ignore().execute()
+
+def migration_0004_packed_transcripts(log):
+    """Packed per-video transcripts and their skip interval sidecar"""
+    db.create_tables([TranscriptBlob, SkipInterval], safe=True)
+
+# Every migration, in order: (version, name, function). Each function gets
+# the runner's log function. Migrations must be safe to apply to a database
+# created before schema versions existed, and to re-apply after an interruption.
+MIGRATIONS = [
+    (1, "baseline", migration_0001_baseline),
+    (2, "numeric_segment_times", migration_0002_numeric_segment_times),
+    (3, "video_status", migration_0003_video_status),
+    (4, "packed_transcripts", migration_0004_packed_transcripts),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# Key of the Postgres advisory lock held while migrating
+MIGRATION_LOCK_KEY = 728301
+
+def get_schema_version():
+    """Get the version of the database schema (0 when never migrated)"""
+    if not SchemaVersion.table_exists():
+        return 0
+    return SchemaVersion.select(fn.MAX(SchemaVersion.version)).scalar() or 0
+
+def check_schema_version():
+    """
+    Cheap startup check of the schema version.
+    
+    Returns:
+        Tuple of (current version, latest version)
+    """
+    try:
+        if db.is_closed():
+            db.connect()
+        return get_schema_version(), LATEST_VERSION
     finally:
         if not db.is_closed():
             db.close()
 
-def create_tables_verbose():
-    """Create all tables in the database with verbose output"""
-    print("Connecting to database...")
+def run_migrations(verbose=False):
+    """
+    Apply every pending migration, one transaction per migration.
     
-    try:
+    On Postgres an advisory lock makes concurrent runners wait for each other.
+    
+    Returns:
+        List of applied migration versions
+    """
+    log = print if verbose else (lambda *args: None)
+    applied = []
+    
+    if db.is_closed():
         db.connect()
-        print("Connected to database successfully")
+    is_postgres = isinstance(db, PostgresqlDatabase)
+    try:
+        if is_postgres:
+            db.execute_sql("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_KEY,))
         
-        # Create tables
-        print("Creating tables...")
-        db.create_tables([User, Segment], safe=True)
-        print("Tables created successfully!")
+        db.create_tables([SchemaVersion], safe=True)
+        current = get_schema_version()
+        log(f"Schema version: {current}, latest: {LATEST_VERSION}")
         
-        # Verify tables were created
-        tables = db.get_tables()
-        print(f"Tables in database: {tables}")
+        for version, name, migration in MIGRATIONS:
+            if version <= current:
+                continue
+            log(f"Applying migration {version:04d} {name}...")
+            started = time.perf_counter()
+            if getattr(migration, "atomic", True):
+                with db.atomic():
+                    migration(log)
+                    SchemaVersion.create(version=version, name=name)
+            else:
+                migration(log)
+                SchemaVersion.create(version=version, name=name)
+            log(f"Applied migration {version:04d} in {time.perf_counter() - started:.2f}s")
+            applied.append(version)
         
+        if not applied:
+            log("Schema is up to date")
+        return applied
+    finally:
+        if is_postgres:
+            db.execute_sql("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_KEY,))
+        if not db.is_closed():
+            db.close()
+
+def create_tables():
+    """Create all tables in the database by applying pending migrations"""
+    try:
+        run_migrations()
+        return True
     except Exception as e:
         print(f"Error creating tables: {e}")
+        raise
+
+def create_tables_verbose():
+    """Apply pending migrations with verbose output"""
+    print("Connecting to database...")
+    
+    try:
+        run_migrations(verbose=True)
+        print(f"Tables in database: {db.get_tables()}")
+    except Exception as e:
+        print(f"Error running migrations: {e}")
         return False
     finally:
         if not db.is_closed():
@@ -69,7 +345,7 @@ def drop_tables():
         
         # Drop tables
         print("Dropping tables...")
-        db.drop_tables([User, Segment], safe=True)
+        db.drop_tables(MODELS + [SchemaVersion], safe=True)
         print("Tables dropped successfully!")
         
     except Exception as e:
@@ -90,5 +366,10 @@ if __name__ == "__main__":
             drop_tables()
         else:
             print("Operation cancelled")
+    elif len(sys.argv) > 1 and sys.argv[1] == "status":
+        current, latest = check_schema_version()
+        print(f"Schema version: {current}, latest: {latest}")
     else:
-        create_tables_verbose()
+        # A failed migration must fail the deploy step that runs it
+        if not create_tables_verbose():
+            sys.exit(1)
@@ -0,0 +1,12 @@
+from peewee import Model, CharField, DateTimeField, IntegerField
+from datetime import datetime
+from database import db
+
+class SchemaVersion(Model):
+    version = IntegerField(primary_key=True)                  # Applied migration number
+    name = CharField(max_length=100)                          # Migration description
+    applied_at = DateTimeField(default=datetime.utcnow)       # Date the migration was applied
+
+    class Meta:
+        database = db
+        table_name = 'schema_version'
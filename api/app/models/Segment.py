@@ -1,14 +1,18 @@
-from peewee import Model, CharField, DateTimeField, AutoField, TextField, IntegerField, BooleanField
+from peewee import Model, CharField, DateTimeField, AutoField, TextField, IntegerField, BooleanField, FloatField
 from datetime import datetime
 from database import db
 
 class Segment(Model):
     id = AutoField()                                          # Auto-incrementing primary key
     hash_id = CharField(max_length=255)                       # Identifier of the video associated with the segment
-    start = CharField(max_length=10)                           # Segment start time
-    end = CharField(max_length=10)                             # Segment end time
+    start = CharField(max_length=10)                           # Segment start time in seconds, as text (legacy)
+    end = CharField(max_length=10)                             # Segment end time in seconds, as text (legacy)
+    start_ms = IntegerField(null=True)                        # Segment start time in milliseconds
+    end_ms = IntegerField(null=True)                          # Segment end time in milliseconds
     text = TextField()                                        # Text content of the segment
     type = CharField(max_length=5, null=True)                 # Segment type (optional)
+    label_confidence = FloatField(null=True)                  # Confidence of the classifier label
+    classifier_version = CharField(max_length=20, null=True)  # Classifier that labelled the segment
     revised = BooleanField(default=False)                     # Indicates if the segment has been revised
     revised_at = DateTimeField(null=True)                     # Revision date
     porcentage = IntegerField()                               # Percentage of video processing completion
@@ -27,3 +31,8 @@ class Segment(Model):
 
     class Meta:
         database = db  # Conexão com o banco de dados
+        indexes = (
+            # One row per segment of a video, so repeated saves are idempotent.
+            # Its (provider, external_id, start_ms) prefix serves the time range queries.
+            (('provider', 'external_id', 'start_ms', 'end_ms'), True),
+        )
@@ -0,0 +1,17 @@
+from peewee import Model, CharField, AutoField, IntegerField
+from database import db
+
+class SkipInterval(Model):
+    id = AutoField()                                          # Auto-incrementing primary key
+    provider = CharField(max_length=15)                       # Video provider
+    external_id = CharField(max_length=15)                    # External identifier
+    start_ms = IntegerField()                                 # Interval start time in milliseconds
+    end_ms = IntegerField()                                   # Interval end time in milliseconds
+    type = CharField(max_length=5)                            # Segment type of the interval (ad, intro)
+
+    class Meta:
+        database = db
+        table_name = 'skip_interval'
+        indexes = (
+            (('provider', 'external_id', 'start_ms'), False),
+        )
@@ -0,0 +1,20 @@
+from peewee import Model, CharField, DateTimeField, AutoField, IntegerField, BlobField
+from datetime import datetime
+from database import db
+
+class TranscriptBlob(Model):
+    id = AutoField()                                          # Auto-incrementing primary key
+    provider = CharField(max_length=15)                       # Video provider
+    external_id = CharField(max_length=15)                    # External identifier
+    format_version = IntegerField()                           # Layout version of the packed data
+    segment_count = IntegerField()                            # Number of packed segments
+    data = BlobField()                                        # zstd-compressed columnar segments
+    created_at = DateTimeField(default=datetime.utcnow)       # Creation date
+    updated_at = DateTimeField(default=datetime.utcnow)       # Last update date
+
+    class Meta:
+        database = db
+        table_name = 'transcript_blob'
+        indexes = (
+            (('provider', 'external_id'), True),
+        )
@@ -0,0 +1,21 @@
+from peewee import Model, CharField, DateTimeField, AutoField, TextField, IntegerField
+from datetime import datetime
+from database import db
+
+class TranscriptCache(Model):
+    id = AutoField()                                          # Auto-incrementing primary key
+    audio_hash = CharField(max_length=64)                     # SHA256 of the transcribed audio file
+    model_name = CharField(max_length=50)                     # Whisper model used for the transcript
+    decode_profile = CharField(max_length=100)                # Decoding settings that shape the transcript
+    language = CharField(max_length=10, null=True)            # Detected language
+    segments = TextField()                                    # JSON list of {start, end, text}
+    hits = IntegerField(default=0)                            # Number of times the transcript was reused
+    created_at = DateTimeField(default=datetime.utcnow)       # Creation date
+    last_used_at = DateTimeField(default=datetime.utcnow)     # Last time the transcript was stored or reused
+
+    class Meta:
+        database = db
+        table_name = 'transcript_cache'
+        indexes = (
+            (('audio_hash', 'model_name', 'decode_profile'), True),
+        )
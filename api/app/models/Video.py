@@ -0,0 +1,34 @@
+from peewee import Model, CharField, DateTimeField, AutoField, TextField, IntegerField, FloatField
+from datetime import datetime
+from database import db
+
+# Processing states of a video
+QUEUED = "queued"
+PROCESSING = "processing"
+DONE = "done"
+FAILED = "failed"
+
+class Video(Model):
+    id = AutoField()                                          # Auto-incrementing primary key
+    provider = CharField(max_length=15)                       # Video provider
+    external_id = CharField(max_length=15)                    # External identifier
+    state = CharField(max_length=10, default=QUEUED)          # queued, processing, done or failed
+    chunks_total = IntegerField(default=0)                    # Number of planned transcription chunks
+    chunks_done = IntegerField(default=0)                     # Number of chunks persisted
+    duration = FloatField(null=True)                          # Audio duration in seconds
+    language = CharField(max_length=10, null=True)            # Detected language
+    audio_hash = CharField(max_length=64, null=True)          # SHA256 of the audio file
+    whisper_model = CharField(max_length=50, null=True)       # Whisper model used for the transcript
+    classifier_version = CharField(max_length=20, null=True)  # Classifier that labels the segments
+    error = TextField(null=True)                              # Last processing error
+    created_at = DateTimeField(default=datetime.utcnow)       # Creation date
+    updated_at = DateTimeField(default=datetime.utcnow)       # Last update date
+    started_at = DateTimeField(null=True)                     # Start of the last processing run
+    finished_at = DateTimeField(null=True)                    # End of the last processing run
+
+    class Meta:
+        database = db
+        table_name = 'video'
+        indexes = (
+            (('provider', 'external_id'), True),
+        )
@@ -1,18 +1,37 @@
 # Services layer for business logic
+#
+# Exports are resolved lazily, so importing a single service module (as the
+# API does) does not load the transcription stack.
 
-from .transcription_service import TranscriptionService, TranscriptionConfig
-from .audio_processing_service import AudioProcessingService
-from .voice_activity_service import VoiceActivityService
-from .temp_file_service import TempFileService
-from .audio_workflow_orchestrator import AudioWorkflowOrchestrator
-from .user_service import UserService
+from importlib import import_module
 
-__all__ = [
-    'TranscriptionService',
-    'TranscriptionConfig',
-    'AudioProcessingService',
-    'VoiceActivityService',
-    'TempFileService',
-    'AudioWorkflowOrchestrator',
-    'UserService'
-]
+_EXPORTS = {
+    'TranscriptionService': '.transcription_service',
+    'TranscriptionConfig': '.transcription_service',
+    'AudioProcessingService': '.audio_processing_service',
+    'VoiceActivityService': '.voice_activity_service',
+    'TempFileService': '.temp_file_service',
+    'AudioWorkflowOrchestrator': '.audio_workflow_orchestrator',
+    'UserService': '.user_service',
+    'SegmentService': '.segment_service',
+    'VideoService': '.video_service',
+    'SegmentRepository': '.segment_repository',
+    'get_segment_repository': '.segment_repository',
+    'ModelPool': '.model_pool',
+    'model_pool': '.model_pool',
+    'ChunkPlanner': '.chunk_planner',
+    'ChunkPlan': '.chunk_planner',
+    'AudioChunk': '.chunk_planner',
+    'ParallelTranscriber': '.parallel_transcription',
+    'ClassificationStage': '.classification_stages',
+    'build_stages': '.classification_stages'
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
+
+
+__all__ = list(_EXPORTS)
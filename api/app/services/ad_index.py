@@ -0,0 +1,186 @@
+"""
+Ad Index Service - Near-duplicate index of known ad reads
+
+Sponsor reads repeat nearly word for word across videos. This service keeps
+MinHash signatures of segments labelled as ads in a locality-sensitive
+hash index stored in Redis, so every worker shares it, and finds the known
+ad read closest to a new segment without calling the AI service.
+"""
+
+import hashlib
+import re
+from typing import Iterable, List, Optional, Set, Tuple
+import numpy as np
+import redis
+from core.config import settings
+from core.logging import get_logger
+
+INDEX_PREFIX = "adindex:"
+METRICS_KEY = f"{INDEX_PREFIX}metrics"
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+SHINGLE_SIZE = 3
+
+# Signatures are stored as raw bytes
+redis_client = redis.from_url(settings.redis_string)
+
+_token_pattern = re.compile(r"\w+", re.UNICODE)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    Split a text into overlapping word n-grams.
+
+    Args:
+        text: Segment text
+        size: Words per shingle
+
+    Returns:
+        Set of shingles; a single shingle of all words for short texts
+    """
+    words = _token_pattern.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Computes MinHash signatures with seeded universal hash permutations"""
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, items: Iterable[str]) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of a set of shingles.
+
+        Returns:
+            uint64 array of num_perm values, or None for an empty set
+        """
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(item.encode(), digest_size=4).digest(), "little") for item in items),
+            dtype=np.uint64
+        )
+        if hashes.size == 0:
+            return None
+        with np.errstate(over="ignore"):
+            permuted = ((hashes[:, None] * self.a + self.b) % MERSENNE_PRIME) & MAX_HASH
+        return permuted.min(axis=0)
+
+
+class AdIndex:
+    """MinHash LSH index of ad reads shared through Redis"""
+
+    def __init__(self, num_perm: Optional[int] = None, bands: Optional[int] = None):
+        self.num_perm = num_perm or settings.ad_index_num_perm
+        self.bands = bands or settings.ad_index_bands
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.rows = self.num_perm // self.bands
+        self.hasher = MinHasher(self.num_perm)
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+    def _band_keys(self, signature: np.ndarray) -> List[str]:
+        keys = []
+        for band in range(self.bands):
+            values = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            keys.append(f"{INDEX_PREFIX}band:{band}:{hashlib.blake2b(values, digest_size=8).hexdigest()}")
+        return keys
+
+    def query(self, text: str) -> Optional[Tuple[int, float]]:
+        """
+        Find the indexed ad read most similar to a text.
+
+        Args:
+            text: Segment text
+
+        Returns:
+            Tuple of (segment_id, estimated Jaccard similarity), or None when
+            no indexed read shares a band with the text
+        """
+        signature = self.hasher.signature(shingles(text))
+        if signature is None:
+            return None
+        return self._best_match(signature)
+
+    def _best_match(self, signature: np.ndarray) -> Optional[Tuple[int, float]]:
+        pipe = redis_client.pipeline()
+        for key in self._band_keys(signature):
+            pipe.smembers(key)
+        candidates = sorted(set().union(*pipe.execute()))
+        if not candidates:
+            return None
+
+        stored = redis_client.mget([f"{INDEX_PREFIX}sig:{int(c)}" for c in candidates])
+        best = None
+        for candidate, raw in zip(candidates, stored):
+            if raw is None:
+                continue
+            similarity = float(np.mean(np.frombuffer(raw, dtype=np.uint64) == signature))
+            if best is None or similarity > best[1]:
+                best = (int(candidate), similarity)
+        return best
+
+    def add(self, segment_id: int, text: str) -> bool:
+        """
+        Index an ad read.
+
+        Reads that are already near-identical to an indexed read are skipped
+        to keep the buckets small.
+
+        Returns:
+            True if the read was added
+        """
+        signature = self.hasher.signature(shingles(text))
+        if signature is None:
+            return False
+
+        match = self._best_match(signature)
+        if match is not None and match[1] >= 0.95:
+            return False
+
+        pipe = redis_client.pipeline()
+        pipe.set(f"{INDEX_PREFIX}sig:{segment_id}", signature.tobytes())
+        for key in self._band_keys(signature):
+            pipe.sadd(key, segment_id)
+        pipe.execute()
+        return True
+
+    def add_many(self, reads: Iterable[Tuple[int, str]]) -> int:
+        """Index several (segment_id, text) ad reads and return how many were added"""
+        return sum(1 for segment_id, text in reads if self.add(segment_id, text))
+
+    def clear(self) -> None:
+        """Remove every key of the index"""
+        for key in redis_client.scan_iter(match=f"{INDEX_PREFIX}*", count=1000):
+            if key.decode() != METRICS_KEY:
+                redis_client.delete(key)
+
+
+def record_classifications(index_hits: int, classifications: int) -> None:
+    """Count classifications answered by the index out of all classifications"""
+    pipe = redis_client.pipeline()
+    pipe.hincrby(METRICS_KEY, "index_hits", index_hits)
+    pipe.hincrby(METRICS_KEY, "classifications", classifications)
+    pipe.execute()
+
+
+def get_ad_index_stats() -> dict:
+    """
+    Get the share of classifications handled by the index.
+
+    Returns:
+        Dictionary with index_hits, classifications and handled_share
+    """
+    metrics = redis_client.hgetall(METRICS_KEY)
+    index_hits = int(metrics.get(b"index_hits", 0))
+    classifications = int(metrics.get(b"classifications", 0))
+
+    return {
+        "index_hits": index_hits,
+        "classifications": classifications,
+        "handled_share": index_hits / classifications if classifications else 0.0
+    }
@@ -8,7 +8,7 @@ validation and splitting operations.
 import subprocess
 from pathlib import Path
 from typing import List, Tuple
-from pydub import AudioSegment
+import numpy as np
 from core.logging import get_logger
 
 
@@ -40,6 +40,66 @@ class AudioProcessingService:
             self.logger.error(f"Invalid audio file: {audio_file}")
             return False
 
+    def decode_audio(self, audio_file: Path, sampling_rate: int = 16000) -> np.ndarray:
+        """
+        Decode an audio file to mono float32 samples.
+        
+        Args:
+            audio_file: Path to the audio file
+            sampling_rate: Target sampling rate in Hz
+            
+        Returns:
+            Array of float32 samples in the range [-1, 1]
+        """
+        try:
+            result = subprocess.run([
+                "ffmpeg", "-v", "error", "-nostdin", "-i", str(audio_file),
+                "-ac", "1", "-ar", str(sampling_rate),
+                "-f", "f32le", "-"
+            ], check=True, capture_output=True)
+            return np.frombuffer(result.stdout, dtype=np.float32)
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Error decoding audio {audio_file}: {e.stderr}")
+            raise ValueError(f"Audio decoding failed: {audio_file}")
+
+    def decode_audio_to_file(self, audio_file: Path, output_file: Path, sampling_rate: int = 16000) -> np.ndarray:
+        """
+        Decode an audio file once to a raw mono float32 file and map it into memory.
+        
+        Args:
+            audio_file: Path to the audio file
+            output_file: Path of the raw .f32 file to write
+            sampling_rate: Target sampling rate in Hz
+            
+        Returns:
+            Memory-mapped array of float32 samples backed by the output file
+        """
+        try:
+            subprocess.run([
+                "ffmpeg", "-v", "error", "-nostdin", "-i", str(audio_file),
+                "-ac", "1", "-ar", str(sampling_rate),
+                "-f", "f32le", str(output_file), "-y"
+            ], check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Error decoding audio {audio_file}: {e.stderr}")
+            raise ValueError(f"Audio decoding failed: {audio_file}")
+        
+        return self.load_samples(output_file)
+
+    def load_samples(self, samples_file: Path) -> np.ndarray:
+        """
+        Map a raw float32 samples file into memory without copying it.
+        
+        Args:
+            samples_file: Path to the raw .f32 file
+            
+        Returns:
+            Copy-on-write memory-mapped array of float32 samples
+        """
+        if not samples_file.exists() or samples_file.stat().st_size == 0:
+            raise ValueError(f"Decoded audio is empty: {samples_file}")
+        return np.memmap(samples_file, dtype=np.float32, mode="c")
+
     def get_longest_audio(self, audio_parts: List[Path]) -> Path | None:
         """
         Find the audio part with the longest duration.
@@ -50,6 +110,8 @@ class AudioProcessingService:
         Returns:
             Path to the longest audio file or None
         """
+        from pydub import AudioSegment
+
         longest = None
         max_duration = 0
 
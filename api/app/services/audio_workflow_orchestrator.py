@@ -7,10 +7,15 @@ coordinating between transcription, audio processing, VAD, and file management s
 
 from pathlib import Path
 from typing import List, Optional, Generator, Tuple
+import numpy as np
+from core.config import settings
 from core.logging import get_logger
 from .transcription_service import TranscriptionService, TranscriptionConfig
 from .audio_processing_service import AudioProcessingService
 from .voice_activity_service import VoiceActivityService
+from .vad_backends import SAMPLE_RATE
+from .chunk_planner import ChunkPlanner, ChunkPlan, AudioChunk
+from .parallel_transcription import ParallelTranscriber
 from .temp_file_service import TempFileService
 
 
@@ -22,12 +27,98 @@ class AudioWorkflowOrchestrator:
         
         # Initialize services
         self.transcription_service = TranscriptionService(transcription_config)
+        self.parallel_transcriber = None
+        if settings.transcription_workers > 1:
+            self.parallel_transcriber = ParallelTranscriber(
+                self.transcription_service.config,
+                settings.transcription_workers,
+                settings.transcription_worker_threads
+            )
         self.audio_service = AudioProcessingService()
         self.vad_service = VoiceActivityService()
+        self.chunk_planner = ChunkPlanner()
         self.temp_service = TempFileService(
             transcription_config.temp_dir if transcription_config else Path("/tmp")
         )
 
+    def ingest_audio(self, audio_file: Path, video_id: str) -> np.ndarray:
+        """
+        Decode the input audio once to 16 kHz mono float32 in the job temp dir.
+        
+        Every later stage (VAD, splitting, language detection and Whisper)
+        works on views of the returned array instead of decoding again.
+        
+        Args:
+            audio_file: Path to the input audio file
+            video_id: Unique identifier for the video
+            
+        Returns:
+            Memory-mapped array of decoded samples
+        """
+        temp_dir = self.temp_service.create_temp_dir(video_id)
+        samples_file = temp_dir / f"audio_{video_id}.f32"
+        
+        samples = self.audio_service.decode_audio_to_file(
+            audio_file, samples_file, SAMPLE_RATE
+        )
+        self.logger.info(
+            f"Ingested {len(samples) / SAMPLE_RATE:.1f}s of audio for video: {video_id}"
+        )
+        return samples
+
+    def plan_chunks(self, samples: np.ndarray) -> ChunkPlan:
+        """
+        Detect silence in decoded samples and plan bounded-length chunks.
+        
+        Args:
+            samples: Decoded 16 kHz mono samples
+            
+        Returns:
+            Chunk plan covering the whole audio
+        """
+        self.logger.info("Detecting silence intervals...")
+        silence_times = self.vad_service.detect_silence_samples(samples)
+        return self.chunk_planner.plan(silence_times, len(samples) / SAMPLE_RATE)
+
+    def detect_language(self, samples: np.ndarray, plan: ChunkPlan) -> Optional[str]:
+        """
+        Detect the language on the longest planned chunk.
+        
+        Args:
+            samples: Decoded 16 kHz mono samples
+            plan: Chunk plan covering the audio
+            
+        Returns:
+            Detected language code, or None for an empty plan
+        """
+        if len(plan) == 0:
+            return None
+        longest = max(plan, key=lambda chunk: chunk.duration)
+        start, end = longest.sample_range(SAMPLE_RATE)
+        return self.transcription_service.detect_language(samples[start:end])
+
+    def transcribe_plan(
+        self, 
+        samples: np.ndarray, 
+        plan: ChunkPlan, 
+        language: Optional[str] = None
+    ) -> Generator[Tuple[AudioChunk, List[dict], Optional[str]], None, None]:
+        """
+        Transcribe a chunk plan, in parallel when a process pool is configured.
+        
+        Args:
+            samples: Memory-mapped samples returned by ingest_audio
+            plan: Chunk plan covering the audio
+            language: Language code for transcription (auto-detected if None)
+            
+        Yields:
+            Tuples of (chunk, segments, language_info) in timeline order
+        """
+        if self.parallel_transcriber is not None and len(plan) > 1:
+            yield from self.parallel_transcriber.transcribe_plan(Path(samples.filename), plan, language)
+        else:
+            yield from self.transcription_service.transcribe_plan(samples, plan, language)
+
     def process_audio_complete_workflow(
         self, 
         audio_file: Path, 
@@ -48,28 +139,16 @@ class AudioWorkflowOrchestrator:
         try:
             self.logger.info(f"Starting audio workflow for video: {video_id}")
             
-            # Step 1: Verify audio file
-            if not self.audio_service.verify_audio(audio_file):
-                raise ValueError(f"Invalid audio file: {audio_file}")
-            
-            # Step 2: Detect silence using VAD service
-            self.logger.info("Detecting silence intervals...")
-            silence_times = self.vad_service.detect_silence(str(audio_file))
+            # Step 1: Decode once (fails on invalid audio)
+            samples = self.ingest_audio(audio_file, video_id)
             
-            # Step 3: Create temporary directory
-            temp_dir = self.temp_service.create_temp_dir(video_id)
+            # Step 2: Detect silence and plan bounded-length chunks
+            plan = self.plan_chunks(samples)
             
-            # Step 4: Split audio using audio processing service
-            self.logger.info("Splitting audio into segments...")
-            audio_parts, silence_times = self.audio_service.split_audio(
-                audio_file, silence_times, temp_dir, video_id
-            )
-            
-            # Step 5: Transcribe all parts
-            self.logger.info(f"Transcribing {len(audio_parts)} audio segments...")
-            yield from self.transcription_service.transcribe_audio(
-                audio_parts, video_id, silence_times, language
-            )
+            # Step 3: Transcribe views of the decoded samples chunk by chunk
+            self.logger.info(f"Transcribing {len(plan)} audio chunks...")
+            for _, segments, detected_lang in self.transcribe_plan(samples, plan, language):
+                yield segments, detected_lang
             
             self.logger.info(f"Audio workflow completed for video: {video_id}")
             
@@ -0,0 +1,82 @@
+"""
+Blob Store Service - Content-addressed file storage
+
+This service stores files under their SHA256 digest in a directory shared
+by every worker (a mounted volume standing in for an object store), so a
+task on any node can fetch the same audio by digest.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+from core.config import settings
+from core.filesystem import generate_sha256_from_file
+from core.logging import get_logger
+
+
+class LocalBlobStore:
+    """Content-addressed blob store backed by a shared directory"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.blob_store_dir)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put_file(self, file_path: Path) -> str:
+        """
+        Store a file and return its content digest.
+
+        Args:
+            file_path: Path to the file to store
+
+        Returns:
+            SHA256 hex digest addressing the stored blob
+        """
+        digest = generate_sha256_from_file(str(file_path))
+        target = self._path(digest)
+        if target.exists():
+            return digest
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Copy to a temporary name first so readers never see a partial blob
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{digest}.")
+        os.close(fd)
+        shutil.copyfile(file_path, tmp_name)
+        os.replace(tmp_name, target)
+
+        self.logger.info(f"Stored blob {digest} ({target.stat().st_size} bytes)")
+        return digest
+
+    def get_path(self, digest: str) -> Path:
+        """
+        Get the local path of a stored blob.
+
+        Args:
+            digest: SHA256 hex digest of the blob
+
+        Returns:
+            Path to the blob
+
+        Raises:
+            FileNotFoundError: If the blob is not in the store
+        """
+        path = self._path(digest)
+        if not path.exists():
+            raise FileNotFoundError(f"Blob not found: {digest}")
+        return path
+
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is in the store"""
+        return self._path(digest).exists()
+
+    def delete(self, digest: str) -> None:
+        """Remove a blob from the store if present"""
+        try:
+            self._path(digest).unlink()
+        except FileNotFoundError:
+            pass
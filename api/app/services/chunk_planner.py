@@ -0,0 +1,167 @@
+"""
+Chunk Planner Service - Turns silence points into transcription units
+
+This service merges the cut points found by VAD into chunks close to a
+target duration, bounded by a minimum and maximum length. When no usable
+silence exists it falls back to fixed-length cuts with overlap and marks
+which chunk owns each part of the timeline so boundary segments are kept
+only once.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+from core.config import settings
+from core.logging import get_logger
+
+
+@dataclass(frozen=True)
+class AudioChunk:
+    """A planned transcription unit, in seconds from the start of the audio"""
+    index: int
+    offset: float
+    duration: float
+    keep_start: float
+    keep_end: float
+
+    @property
+    def end(self) -> float:
+        return self.offset + self.duration
+
+    def owns(self, start: float) -> bool:
+        """Check whether a segment starting at the given time belongs to this chunk"""
+        return self.keep_start <= start < self.keep_end
+
+    def sample_range(self, sampling_rate: int) -> Tuple[int, int]:
+        """Get the [start, end) sample indexes of this chunk"""
+        return int(self.offset * sampling_rate), int(self.end * sampling_rate)
+
+
+@dataclass
+class ChunkPlan:
+    """Ordered list of chunks covering the whole audio"""
+    total_duration: float
+    chunks: List[AudioChunk] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def __iter__(self) -> Iterator[AudioChunk]:
+        return iter(self.chunks)
+
+    def __getitem__(self, index: int) -> AudioChunk:
+        return self.chunks[index]
+
+    def slices(self, samples: np.ndarray, sampling_rate: int) -> Iterator[Tuple[AudioChunk, np.ndarray]]:
+        """
+        Yield each chunk with a zero-copy view of its samples.
+
+        Args:
+            samples: Decoded mono samples of the whole audio
+            sampling_rate: Sampling rate of the samples
+
+        Yields:
+            Tuples of (chunk, samples view)
+        """
+        for chunk in self.chunks:
+            start, end = chunk.sample_range(sampling_rate)
+            yield chunk, samples[start:end]
+
+
+class ChunkPlanner:
+    """Plans bounded-length transcription chunks from VAD cut points"""
+
+    def __init__(
+        self,
+        target_seconds: Optional[float] = None,
+        min_seconds: Optional[float] = None,
+        max_seconds: Optional[float] = None,
+        overlap_seconds: Optional[float] = None
+    ):
+        self.target_seconds = settings.chunk_target_seconds if target_seconds is None else target_seconds
+        self.min_seconds = settings.chunk_min_seconds if min_seconds is None else min_seconds
+        self.max_seconds = settings.chunk_max_seconds if max_seconds is None else max_seconds
+        self.overlap_seconds = settings.chunk_overlap_seconds if overlap_seconds is None else overlap_seconds
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+        if not 0 < self.min_seconds <= self.target_seconds <= self.max_seconds:
+            raise ValueError("Chunk durations must satisfy 0 < min <= target <= max")
+        # A span just over the maximum must split into two chunks of at least the minimum
+        if 2 * self.min_seconds > self.max_seconds:
+            raise ValueError("Chunk durations must satisfy 2 * min <= max")
+        if self.overlap_seconds < 0:
+            raise ValueError("Chunk overlap must not be negative")
+
+    def plan(self, cut_times: List[float], total_duration: float) -> ChunkPlan:
+        """
+        Build a chunk plan from silence cut points.
+
+        Args:
+            cut_times: Candidate cut timestamps in seconds (e.g. silence ends)
+            total_duration: Duration of the audio in seconds
+
+        Returns:
+            The chunk plan covering [0, total_duration]
+        """
+        cuts = sorted(float(t) for t in cut_times if 0 < t < total_duration)
+
+        # Each boundary is (end time, hard cut flag)
+        boundaries: List[Tuple[float, bool]] = []
+        start = 0.0
+        while total_duration - start > self.max_seconds:
+            candidates = [c for c in cuts if start + self.min_seconds <= c <= start + self.max_seconds]
+            if candidates:
+                target = start + self.target_seconds
+                end = min(candidates, key=lambda c: abs(c - target))
+                boundaries.append((end, False))
+            else:
+                end = start + self.target_seconds
+                boundaries.append((end, True))
+            start = end
+
+        # Merge a short tail into the previous chunk, or cut that span again
+        # where merging would exceed the maximum length
+        if boundaries and total_duration - start < self.min_seconds:
+            boundaries.pop()
+            start = boundaries[-1][0] if boundaries else 0.0
+            if total_duration - start > self.max_seconds:
+                low = max(start + self.min_seconds, total_duration - self.max_seconds)
+                high = min(start + self.max_seconds, total_duration - self.min_seconds)
+                candidates = [c for c in cuts if low <= c <= high]
+                middle = (start + total_duration) / 2
+                if candidates:
+                    boundaries.append((min(candidates, key=lambda c: abs(c - middle)), False))
+                else:
+                    boundaries.append((middle, True))
+
+        plan = ChunkPlan(total_duration=total_duration)
+        half_overlap = self.overlap_seconds / 2
+        start, start_is_hard = 0.0, False
+
+        for index, (end, end_is_hard) in enumerate(boundaries + [(total_duration, False)]):
+            offset = max(0.0, start - half_overlap) if start_is_hard else start
+            chunk_end = min(total_duration, end + half_overlap) if end_is_hard else end
+            is_last = index == len(boundaries)
+
+            # The overlap is trimmed rather than let a chunk exceed the maximum
+            excess = (chunk_end - offset) - self.max_seconds
+            if excess > 0:
+                trim_start = min(start - offset, max(excess / 2, excess - (chunk_end - end)))
+                offset += trim_start
+                chunk_end -= excess - trim_start
+
+            plan.chunks.append(AudioChunk(
+                index=index,
+                offset=offset,
+                duration=chunk_end - offset,
+                keep_start=start if index > 0 else float("-inf"),
+                keep_end=end if not is_last else float("inf")
+            ))
+            start, start_is_hard = end, end_is_hard
+
+        hard_cuts = sum(1 for _, hard in boundaries if hard)
+        self.logger.info(
+            f"Planned {len(plan)} chunks for {total_duration:.1f}s of audio "
+            f"from {len(cuts)} cut points ({hard_cuts} fixed-length cuts)"
+        )
+        return plan
@@ -0,0 +1,147 @@
+"""
+Classification Stages - Local stages run before the AI service
+
+Each stage looks at the segments that are still unlabelled and labels the
+ones it is confident about; only the rest are sent to the AI service.
+Stages are selected by name in settings.classification_stages. Labels of
+a stage are recorded under the stage's own classifier version, so local
+labels can be told apart from the AI service's.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+from core.config import settings
+from core.logging import get_logger
+from .ad_index import AdIndex, record_classifications
+from .lexical_prefilter import LexicalPrefilter
+from .model_pool import model_pool
+from models.Segment import Segment
+
+# Label for a position: (segment type, confidence); None type means content
+StageLabel = Tuple[Optional[str], Optional[float]]
+
+# Prefixes of the classifier versions recorded by the local stages
+AD_INDEX_VERSION_PREFIX = "ad-index-"
+LEXICAL_VERSION_PREFIX = "lexical-"
+LOCAL_VERSION_PREFIXES = (AD_INDEX_VERSION_PREFIX, LEXICAL_VERSION_PREFIX)
+
+
+def _stage_version(prefix: str, version: str) -> str:
+    if not version.startswith(prefix):
+        version = f"{prefix}{version}"
+    return version[:Segment.classifier_version.max_length]
+
+
+class ClassificationStage(ABC):
+    """Base class of a local classification stage"""
+
+    name = "stage"
+
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Classifier version recorded on the segments this stage labels"""
+
+    @abstractmethod
+    def label(self, texts: Sequence[str], positions: Sequence[int]) -> Dict[int, StageLabel]:
+        """
+        Label the segments this stage is confident about.
+
+        Args:
+            texts: Texts of all segments in timeline order
+            positions: Positions still unlabelled
+
+        Returns:
+            Labels by position for the segments handled by this stage
+        """
+
+    def learn(self, ads: List[Tuple[int, str]]) -> None:
+        """Receive (segment_id, text) ads confirmed by the AI service"""
+
+    def report(self, handled: int, total: int) -> None:
+        """Receive how many of a batch's classifications this stage handled"""
+
+
+class AdIndexStage(ClassificationStage):
+    """Labels near-duplicates of known ad reads as ads"""
+
+    name = "ad_index"
+
+    def __init__(self):
+        self.index = AdIndex()
+
+    @property
+    def version(self):
+        return _stage_version(AD_INDEX_VERSION_PREFIX, settings.classifier_version)
+
+    def label(self, texts, positions):
+        labels = {}
+        for position in positions:
+            match = self.index.query(texts[position])
+            if match is not None and match[1] >= settings.ad_index_threshold:
+                labels[position] = ("ad", match[1])
+        return labels
+
+    def learn(self, ads):
+        self.index.add_many(ads)
+
+    def report(self, handled, total):
+        record_classifications(handled, total)
+
+
+class LexicalPrefilterStage(ClassificationStage):
+    """Labels segments with a very low lexical ad score as content"""
+
+    name = "lexical_prefilter"
+
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or settings.prefilter_model_path
+        self.model = model_pool.get(("lexical_prefilter", self.model_path), lambda: LexicalPrefilter.load(self.model_path))
+
+    @property
+    def version(self):
+        return _stage_version(LEXICAL_VERSION_PREFIX, self.model.version)
+
+    def label(self, texts, positions):
+        positions = list(positions)
+        proba = self.model.predict_proba([texts[position] for position in positions])
+        return {
+            position: (None, float(1.0 - p))
+            for position, p in zip(positions, proba)
+            if p < settings.prefilter_negative_threshold
+        }
+
+
+STAGES = {
+    AdIndexStage.name: AdIndexStage,
+    LexicalPrefilterStage.name: LexicalPrefilterStage
+}
+
+
+def build_stages(names: Optional[str] = None) -> List[ClassificationStage]:
+    """
+    Instantiate the configured stages in order.
+
+    Stages that are disabled or have no model configured are left out.
+
+    Args:
+        names: Comma-separated stage names (settings.classification_stages when None)
+
+    Returns:
+        List of stages
+    """
+    logger = get_logger('services.classification_stages')
+    stages = []
+    for name in (names if names is not None else settings.classification_stages).split(","):
+        name = name.strip()
+        if not name:
+            continue
+        if name == AdIndexStage.name and not settings.ad_index_enabled:
+            continue
+        if name == LexicalPrefilterStage.name and not settings.prefilter_model_path:
+            continue
+        if name not in STAGES:
+            logger.warning(f"Unknown classification stage: {name}")
+            continue
+        stages.append(STAGES[name]())
+    return stages
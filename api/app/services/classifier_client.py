@@ -0,0 +1,130 @@
+"""
+Classifier Client - Pooled, concurrent client for the ad-classification service
+
+This client keeps a persistent HTTP connection pool to the AI service,
+applies timeouts and retries with backoff, and classifies the segments of
+a video concurrently. Each request carries the previous and next segment
+text as context instead of depending on the previous segment's label.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from core.config import settings
+from core.logging import get_logger
+
+
+class Classification(NamedTuple):
+    """Label returned by the classification service"""
+    label: str
+    confidence: Optional[float] = None
+
+
+class AdClassifierClient:
+    """HTTP client for the ad-classification service"""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.url = url or settings.ad_ai_url
+        self.timeout = timeout if timeout is not None else settings.ad_ai_timeout
+        self.concurrency = max(1, concurrency or settings.ad_ai_concurrency)
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+        retry = Retry(
+            total=max_retries if max_retries is not None else settings.ad_ai_max_retries,
+            backoff_factor=backoff if backoff is not None else settings.ad_ai_backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"])
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=self.concurrency)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @staticmethod
+    def build_payload(texts: Sequence[str], index: int) -> dict:
+        """
+        Build the request payload for one segment with its neighbours as context.
+
+        Args:
+            texts: Texts of the video's segments in timeline order
+            index: Position of the segment to classify
+
+        Returns:
+            Payload expected by the classification service
+        """
+        return {
+            "previousSegment": texts[index - 1] if index > 0 else None,
+            "previousClass": None,
+            "currentSegment": texts[index],
+            "nextSegment": texts[index + 1] if index + 1 < len(texts) else None
+        }
+
+    def classify(self, payload: dict) -> Optional[Classification]:
+        """
+        Classify one segment.
+
+        Args:
+            payload: Request payload as built by build_payload
+
+        Returns:
+            Classification with the service's class ("1" for advertisement)
+            and its confidence when provided, or None on failure
+        """
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            result = response.json()
+            if result.get("response") is None:
+                return None
+            confidence = result.get("confidence")
+            return Classification(str(result["response"]), float(confidence) if confidence is not None else None)
+        except (requests.RequestException, ValueError, TypeError) as e:
+            self.logger.warning(f"Classification request failed: {e}")
+            return None
+
+    def classify_many(self, texts: Sequence[str], indexes: Optional[Sequence[int]] = None) -> List[Optional[Classification]]:
+        """
+        Classify a sequence of segments concurrently.
+
+        Args:
+            texts: Texts of the segments in timeline order
+            indexes: Positions to classify (all when None); the context
+                window still uses the neighbouring texts
+
+        Returns:
+            Classifications in the order of indexes (None where a request failed)
+        """
+        indexes = range(len(texts)) if indexes is None else indexes
+        if not indexes:
+            return []
+
+        payloads = [self.build_payload(texts, index) for index in indexes]
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(payloads))) as executor:
+            return list(executor.map(self.classify, payloads))
+
+    def close(self) -> None:
+        """Close the pooled connections"""
+        self.session.close()
+
+
+_client: Optional[AdClassifierClient] = None
+_client_lock = threading.Lock()
+
+
+def get_classifier_client() -> AdClassifierClient:
+    """Get the classifier client of this process, created on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = AdClassifierClient()
+        return _client
@@ -0,0 +1,182 @@
+"""
+Lexical Prefilter Service - Hashed bag-of-words logistic scorer
+
+This service scores segment texts with a small logistic regression over
+hashed word unigrams and bigrams. It is trained offline from the labels the
+AI service already produced and exported to a .npz file that workers load
+once per process.
+"""
+
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence, Tuple
+import numpy as np
+from core.logging import get_logger
+
+DEFAULT_FEATURES = 1 << 18
+
+_token_pattern = re.compile(r"\w+", re.UNICODE)
+
+
+def hashed_features(text: str, n_features: int) -> np.ndarray:
+    """
+    Map a text to the hashed indexes of its word unigrams and bigrams.
+
+    Args:
+        text: Segment text
+        n_features: Size of the hashed feature space (a power of two)
+
+    Returns:
+        Sorted unique feature indexes
+    """
+    words = _token_pattern.findall(text.lower())
+    grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    mask = n_features - 1
+    return np.unique(np.fromiter((zlib.crc32(g.encode()) & mask for g in grams), dtype=np.int64))
+
+
+def _vectorize(texts: Sequence[str], n_features: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # CSR-style layout: feature indexes, L2-normalized values, row offsets
+    rows = [hashed_features(text, n_features) for text in texts]
+    lengths = np.array([len(row) for row in rows], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    values = np.repeat(1.0 / np.sqrt(np.maximum(lengths, 1)), lengths)
+    return indices, values, offsets
+
+
+def _scores(weights: np.ndarray, bias: float, indices: np.ndarray, values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    contributions = weights[indices] * values
+    sums = np.zeros(len(offsets) - 1)
+    nonempty = offsets[:-1] < offsets[1:]
+    sums[nonempty] = np.add.reduceat(contributions, offsets[:-1][nonempty]) if contributions.size else 0.0
+    return 1.0 / (1.0 + np.exp(-(sums + bias)))
+
+
+@dataclass
+class LexicalPrefilter:
+    """Logistic regression over hashed bag-of-words features"""
+    weights: np.ndarray
+    bias: float = 0.0
+    version: str = "lexical-v1"
+
+    @property
+    def n_features(self) -> int:
+        return len(self.weights)
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Estimate the probability that each text is an ad read.
+
+        Args:
+            texts: Segment texts
+
+        Returns:
+            Array of probabilities in [0, 1]
+        """
+        if not texts:
+            return np.zeros(0)
+        return _scores(self.weights, self.bias, *_vectorize(texts, self.n_features))
+
+    @classmethod
+    def train(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[int],
+        n_features: int = DEFAULT_FEATURES,
+        epochs: int = 10,
+        learning_rate: float = 5.0,
+        l2: float = 1e-6,
+        batch_size: int = 64,
+        version: str = "lexical-v1",
+        seed: int = 0
+    ) -> "LexicalPrefilter":
+        """
+        Fit the model with mini-batch gradient descent on the log loss.
+
+        Args:
+            texts: Segment texts
+            labels: 1 for ad, 0 for content
+            n_features: Size of the hashed feature space (a power of two)
+            epochs: Passes over the data
+            learning_rate: Gradient step size
+            l2: L2 regularization strength
+            batch_size: Rows per gradient step
+            version: Version stored with the model
+            seed: Shuffling seed
+
+        Returns:
+            Trained prefilter
+        """
+        logger = get_logger(f'services.{cls.__name__}')
+        labels = np.asarray(labels, dtype=np.float64)
+        positives = max(labels.sum(), 1.0)
+        # Balance the classes so the rare ad reads are not drowned out
+        sample_weights = np.where(labels == 1, len(labels) / (2 * positives), len(labels) / (2 * max(len(labels) - positives, 1.0)))
+
+        weights = np.zeros(n_features)
+        bias = 0.0
+        rng = np.random.RandomState(seed)
+
+        for epoch in range(epochs):
+            order = rng.permutation(len(texts))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                indices, values, offsets = _vectorize([texts[i] for i in batch], n_features)
+                errors = (_scores(weights, bias, indices, values, offsets) - labels[batch]) * sample_weights[batch]
+
+                gradient = np.zeros(n_features)
+                np.add.at(gradient, indices, np.repeat(errors, np.diff(offsets)) * values)
+                weights -= learning_rate * (gradient / len(batch) + l2 * weights)
+                bias -= learning_rate * errors.mean()
+
+            logger.info(f"Prefilter training epoch {epoch + 1}/{epochs} done")
+
+        return cls(weights=weights, bias=bias, version=version)
+
+    def save(self, path: Path) -> None:
+        """Export the model to a .npz file"""
+        np.savez_compressed(path, weights=self.weights.astype(np.float32), bias=self.bias, version=self.version)
+
+    @classmethod
+    def load(cls, path: Path) -> "LexicalPrefilter":
+        """Load a model exported with save"""
+        with np.load(path) as data:
+            return cls(weights=data["weights"].astype(np.float64), bias=float(data["bias"]), version=str(data["version"]))
+
+
+def evaluate(model: LexicalPrefilter, texts: Sequence[str], labels: Sequence[int], negative_threshold: float) -> dict:
+    """
+    Compare the prefilter against reference labels.
+
+    Args:
+        model: Trained prefilter
+        texts: Segment texts
+        labels: Reference labels (1 for ad, 0 for content)
+        negative_threshold: Probability below which a segment is labelled content locally
+
+    Returns:
+        Dictionary with ad precision/recall at 0.5, and for the local
+        negatives the share of segments skipped, their precision and the
+        share of ads wrongly labelled content
+    """
+    labels = np.asarray(labels)
+    proba = model.predict_proba(texts)
+
+    predicted = proba >= 0.5
+    true_positives = int(np.sum(predicted & (labels == 1)))
+    local_negatives = proba < negative_threshold
+    ads = max(int(np.sum(labels == 1)), 1)
+
+    return {
+        "segments": len(labels),
+        "ads": int(np.sum(labels == 1)),
+        "precision": true_positives / max(int(np.sum(predicted)), 1),
+        "recall": true_positives / ads,
+        "negative_threshold": negative_threshold,
+        "skipped_share": float(np.mean(local_negatives)) if len(labels) else 0.0,
+        "negative_precision": float(np.mean(labels[local_negatives] == 0)) if local_negatives.any() else 1.0,
+        "missed_ads_share": int(np.sum(local_negatives & (labels == 1))) / ads
+    }
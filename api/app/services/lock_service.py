@@ -5,12 +5,16 @@ This service provides functionality for managing distributed locks
 to prevent concurrent execution of tasks.
 """
 
+import asyncio
 from core.filesystem import delete_dir_tmp
 import redis
+import redis.asyncio
 from core.config import settings
 
 LOCK_PREFIX = "task_lock:"
 redis_client = redis.from_url(settings.redis_string, decode_responses=True)
+# Used by async endpoints so lock checks do not block the event loop
+async_redis_client = redis.asyncio.from_url(settings.redis_string, decode_responses=True)
 
 
 def is_task_locked(task_id: str) -> bool:
@@ -55,3 +59,48 @@ def unlock_task(task_id: str) -> bool:
     delete_dir_tmp(task_id) 
     lock_key = f"{LOCK_PREFIX}{task_id}"
     return redis_client.delete(lock_key) == 1
+
+
+async def is_task_locked_async(task_id: str) -> bool:
+    """
+    Check if a task is currently locked, without blocking the event loop.
+    
+    Args:
+        task_id (str): The ID of the task to check
+        
+    Returns:
+        bool: True if the task is locked, False otherwise
+    """
+    lock_key = f"{LOCK_PREFIX}{task_id}"
+    return await async_redis_client.exists(lock_key) == 1
+
+
+async def lock_task_async(task_id: str) -> None:
+    """
+    Lock a task to prevent concurrent execution, without blocking the event loop.
+    
+    Args:
+        task_id (str): The ID of the task to lock
+        
+    Raises:
+        ValueError: If the task is already locked
+    """
+    lock_key = f"{LOCK_PREFIX}{task_id}"
+    if not await async_redis_client.set(lock_key, "locked", ex=3600, nx=True):
+        raise ValueError(f"Task {task_id} is already locked.")
+
+
+async def unlock_task_async(task_id: str) -> bool:
+    """
+    Unlock a task without blocking the event loop.
+    
+    Args:
+        task_id (str): The ID of the task to unlock
+        
+    Returns:
+        bool: True if the task was successfully unlocked, False otherwise
+    """
+    # Removing the temporary directory is blocking disk I/O
+    await asyncio.to_thread(delete_dir_tmp, task_id)
+    lock_key = f"{LOCK_PREFIX}{task_id}"
+    return await async_redis_client.delete(lock_key) == 1
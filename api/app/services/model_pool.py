@@ -0,0 +1,112 @@
+"""
+Model Pool Service - Process-wide registry of loaded models
+
+This service keeps a single instance of every model configuration per
+worker process and hands out leases to the tasks that use them, so that
+each task only pays for inference and not for model loading.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Hashable, Iterator
+from core.logging import get_logger
+
+
+@dataclass
+class ModelStats:
+    """Usage counters for a pooled model"""
+    loads: int = 0
+    hits: int = 0
+    active_leases: int = 0
+    load_seconds: float = 0.0
+
+
+class ModelPool:
+    """Registry that loads each model key once and reuses it afterwards"""
+
+    def __init__(self):
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+        self._models: Dict[Hashable, Any] = {}
+        self._stats: Dict[Hashable, ModelStats] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            self._stats.setdefault(key, ModelStats())
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get the model registered under a key, loading it on first use.
+
+        Args:
+            key: Hashable identifier of the model configuration
+            loader: Callable that builds the model when it is not loaded yet
+
+        Returns:
+            The loaded model instance
+        """
+        with self._key_lock(key):
+            stats = self._stats[key]
+            model = self._models.get(key)
+            if model is not None:
+                stats.hits += 1
+                return model
+
+            self.logger.info(f"Loading model: {key}")
+            started = time.perf_counter()
+            model = loader()
+            elapsed = time.perf_counter() - started
+
+            self._models[key] = model
+            stats.loads += 1
+            stats.load_seconds += elapsed
+            self.logger.info(f"Model {key} loaded in {elapsed:.2f}s")
+            return model
+
+    @contextmanager
+    def lease(self, key: Hashable, loader: Callable[[], Any]) -> Iterator[Any]:
+        """
+        Lease a model for the duration of a block.
+
+        Args:
+            key: Hashable identifier of the model configuration
+            loader: Callable that builds the model when it is not loaded yet
+
+        Yields:
+            The loaded model instance
+        """
+        model = self.get(key, loader)
+        with self._lock:
+            self._stats[key].active_leases += 1
+        try:
+            yield model
+        finally:
+            with self._lock:
+                self._stats[key].active_leases -= 1
+
+    def is_loaded(self, key: Hashable) -> bool:
+        """Check whether a model key is already loaded in this process"""
+        return key in self._models
+
+    def evict(self, key: Hashable) -> None:
+        """Drop a loaded model so that the next lease reloads it"""
+        with self._key_lock(key):
+            self._models.pop(key, None)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Get load and hit counters for every known model key.
+
+        Returns:
+            Dictionary mapping the key representation to its counters
+        """
+        with self._lock:
+            return {str(key): asdict(stats) for key, stats in self._stats.items()}
+
+
+# Process-wide pool shared by every task running in this worker process
+model_pool = ModelPool()
@@ -0,0 +1,169 @@
+"""
+Parallel Transcription Service - Transcribes planned chunks across processes
+
+This service spreads the chunks of a plan over a pool of worker processes,
+each holding its own Whisper model with a chosen number of CPU threads,
+and merges the results back in timeline order while streaming them.
+
+Every Celery worker process owns its own pool, so the default thread count
+divides the host's cores by both the worker concurrency and the pool size.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Set, Tuple
+import numpy as np
+from core.config import settings
+from core.logging import get_logger
+from .chunk_planner import AudioChunk, ChunkPlan
+from .model_pool import model_pool
+from .transcription_service import TranscriptionService, TranscriptionConfig
+from .vad_backends import SAMPLE_RATE
+
+# Transcription service of the current pool worker process
+_worker_service: Optional[TranscriptionService] = None
+# Pools started by this process, shut down with it
+_executors: Set[ProcessPoolExecutor] = set()
+
+
+def _init_worker(config: TranscriptionConfig) -> None:
+    global _worker_service
+    _worker_service = TranscriptionService(config)
+    _worker_service.preload()
+
+
+def _chunk_samples(samples_file: str, chunk: AudioChunk) -> np.ndarray:
+    samples = np.memmap(samples_file, dtype=np.float32, mode="c")
+    start, end = chunk.sample_range(SAMPLE_RATE)
+    return samples[start:end]
+
+
+def _detect_language(samples_file: str, chunk: AudioChunk) -> str:
+    return _worker_service.detect_language(_chunk_samples(samples_file, chunk))
+
+
+def _transcribe_chunk(samples_file: str, chunk: AudioChunk, language: Optional[str]) -> Tuple[int, List[dict], Optional[str]]:
+    result, detected_lang = _worker_service.transcribe_samples(
+        _chunk_samples(samples_file, chunk), chunk.offset, language
+    )
+    return chunk.index, [segment for segment in result if chunk.owns(segment["start"])], detected_lang
+
+
+def default_threads_per_worker(workers: int, concurrency: Optional[int] = None) -> int:
+    """
+    Split the host's cores between every transcription process on it.
+
+    Args:
+        workers: Processes in each pool
+        concurrency: Celery worker processes per host, each with its own pool
+            (settings.worker_concurrency, or the core count, when None)
+
+    Returns:
+        CPU threads per transcription process, at least 1
+    """
+    cores = os.cpu_count() or 1
+    concurrency = concurrency or settings.worker_concurrency or cores
+    return max(1, cores // (concurrency * max(1, workers)))
+
+
+def shutdown_executors() -> None:
+    """Stop the transcription pools started by this process"""
+    while _executors:
+        _executors.pop().shutdown(wait=False, cancel_futures=True)
+
+
+class ParallelTranscriber:
+    """Transcribes chunk plans on a pool of processes that each own a model"""
+
+    def __init__(self, config: TranscriptionConfig, workers: int, threads_per_worker: Optional[int] = None):
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+        self.workers = max(1, workers)
+        self.threads_per_worker = threads_per_worker or default_threads_per_worker(self.workers)
+        self.config = replace(config, cpu_threads=self.threads_per_worker)
+
+    @property
+    def pool_key(self) -> tuple:
+        """Key identifying the process pool in the model pool"""
+        return ("transcription_pool", self.workers) + self.config.model_key[1:]
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        self.logger.info(
+            f"Starting {self.workers} transcription processes "
+            f"with {self.threads_per_worker} CPU threads each"
+        )
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Spawn so children do not inherit the parent's model threads
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config,)
+        )
+        _executors.add(executor)
+        return executor
+
+    def executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, started once per worker process and reused"""
+        return model_pool.get(self.pool_key, self._create_executor)
+
+    def transcribe_plan(
+        self,
+        samples_file: Path,
+        plan: ChunkPlan,
+        language: Optional[str] = None
+    ) -> Generator[Tuple[AudioChunk, List[dict], Optional[str]], None, None]:
+        """
+        Transcribe all chunks of a plan in parallel.
+
+        Args:
+            samples_file: Raw float32 samples file written by the ingest stage
+            plan: Chunk plan covering the audio
+            language: Language code for transcription (auto-detected if None)
+
+        Yields:
+            Tuples of (chunk, segments, language_info) in timeline order,
+            as soon as every earlier chunk is done
+        """
+        if len(plan) == 0:
+            return
+
+        executor = self.executor()
+        samples_file = str(samples_file)
+        futures = []
+
+        try:
+            if language is None:
+                longest = max(plan, key=lambda chunk: chunk.duration)
+                language = executor.submit(_detect_language, samples_file, longest).result()
+                self.logger.info(f"Detected language: {language}")
+
+            futures = [
+                executor.submit(_transcribe_chunk, samples_file, chunk, language)
+                for chunk in plan
+            ]
+
+            finished: Dict[int, Tuple[List[dict], Optional[str]]] = {}
+            next_index = 0
+            for future in as_completed(futures):
+                index, segments, detected_lang = future.result()
+                finished[index] = (segments, detected_lang)
+
+                # Release every chunk that is now contiguous with the timeline
+                while next_index in finished:
+                    segments, detected_lang = finished.pop(next_index)
+                    yield plan[next_index], segments, detected_lang
+                    next_index += 1
+
+        except BrokenProcessPool as e:
+            self.logger.error(f"Transcription process pool broke: {e}")
+            model_pool.evict(self.pool_key)
+            _executors.discard(executor)
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise ValueError("Parallel transcription failed")
+        finally:
+            # Drop queued chunks if the caller stopped consuming early
+            for future in futures:
+                future.cancel()
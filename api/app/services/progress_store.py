@@ -0,0 +1,142 @@
+"""
+Progress Store Service - Live processing progress in Redis
+
+Workers write the progress of each video to a Redis hash that expires on
+its own: the stage, chunk counts, audio duration, an ETA and the worker
+that wrote it last. Readers answer "how far along" from Redis alone, and
+fetch many videos with one pipelined round trip of HMGETs.
+"""
+
+import os
+import socket
+import time
+from typing import Dict, Iterable, Optional
+import redis
+import redis.asyncio
+from core.config import settings
+from core.logging import get_logger
+
+PROGRESS_PREFIX = "progress:"
+FIELDS = ("stage", "chunks_done", "chunks_total", "duration", "eta", "worker", "started_at",
+          "transcribing_started_at", "updated_at")
+_INT_FIELDS = {"chunks_done", "chunks_total"}
+_FLOAT_FIELDS = {"duration", "eta", "started_at", "transcribing_started_at", "updated_at"}
+
+# Processing stages, in order
+DOWNLOADING = "downloading"
+TRANSCRIBING = "transcribing"
+SAVING = "saving"
+DONE = "done"
+FAILED = "failed"
+
+redis_client = redis.from_url(settings.redis_string, decode_responses=True)
+async_redis_client = redis.asyncio.from_url(settings.redis_string, decode_responses=True)
+logger = get_logger('services.progress_store')
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _key(provider: str, external_id: str) -> str:
+    return f"{PROGRESS_PREFIX}{provider}:{external_id}"
+
+
+def set_stage(provider: str, external_id: str, stage: str, **fields) -> None:
+    """
+    Record the current stage of a video, with any other known fields.
+
+    Entering the download stage resets the hash; entering the transcribing
+    stage starts the ETA clock, so download time does not inflate the ETA.
+    Writes are best effort: a Redis failure is logged and never fails the
+    calling task.
+
+    Args:
+        provider: Video provider
+        external_id: External video ID
+        stage: Processing stage
+        **fields: Other progress fields, e.g. chunks_total or duration
+    """
+    key = _key(provider, external_id)
+    now = time.time()
+    mapping = {"stage": stage, "worker": WORKER_ID, "updated_at": now, **fields}
+    if stage == DOWNLOADING:
+        mapping.update(started_at=now, chunks_done=0)
+    if stage == TRANSCRIBING:
+        mapping.update(transcribing_started_at=now)
+    if stage == DONE:
+        mapping["eta"] = 0
+
+    try:
+        pipe = redis_client.pipeline()
+        if stage == DOWNLOADING:
+            pipe.delete(key)
+        pipe.hset(key, mapping={name: value for name, value in mapping.items() if value is not None})
+        pipe.expire(key, settings.progress_ttl)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Could not record progress of {provider}:{external_id}: {e}")
+
+
+def record_chunk(provider: str, external_id: str) -> None:
+    """
+    Count one more transcribed chunk and refresh the ETA.
+
+    Safe to call from concurrent chunk workers: the count is incremented
+    atomically, and the ETA is extrapolated from the time per chunk since
+    transcription started.
+    """
+    key = _key(provider, external_id)
+    now = time.time()
+
+    try:
+        pipe = redis_client.pipeline()
+        pipe.hincrby(key, "chunks_done", 1)
+        pipe.hmget(key, ["chunks_total", "transcribing_started_at"])
+        done, (total, transcribing_started_at) = pipe.execute()
+
+        mapping = {"worker": WORKER_ID, "updated_at": now}
+        if total and transcribing_started_at:
+            mapping["eta"] = round((now - float(transcribing_started_at)) / done * max(int(total) - done, 0), 1)
+
+        pipe = redis_client.pipeline()
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, settings.progress_ttl)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Could not record chunk progress of {provider}:{external_id}: {e}")
+
+
+def _parse(values) -> Optional[dict]:
+    if values[0] is None:
+        return None
+    progress = {}
+    for name, value in zip(FIELDS, values):
+        if value is not None and name in _INT_FIELDS:
+            value = int(value)
+        elif value is not None and name in _FLOAT_FIELDS:
+            value = float(value)
+        progress[name] = value
+    return progress
+
+
+async def get_progress_many_async(provider: str, external_ids: Iterable[str]) -> Dict[str, Optional[dict]]:
+    """
+    Read the progress of several videos in one round trip.
+
+    Args:
+        provider: Video provider
+        external_ids: External video IDs
+
+    Returns:
+        Progress dict per video ID, None for videos without live progress
+    """
+    external_ids = list(external_ids)
+    pipe = async_redis_client.pipeline(transaction=False)
+    for external_id in external_ids:
+        pipe.hmget(_key(provider, external_id), FIELDS)
+    results = await pipe.execute()
+    return {external_id: _parse(values) for external_id, values in zip(external_ids, results)}
+
+
+async def get_progress_async(provider: str, external_id: str) -> Optional[dict]:
+    """Read the progress of one video, None when it has no live progress"""
+    return _parse(await async_redis_client.hmget(_key(provider, external_id), FIELDS))
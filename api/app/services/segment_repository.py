@@ -0,0 +1,400 @@
+"""
+Segment Repository - Storage layouts for video transcripts
+
+Segments are written one row per Whisper segment while a video is being
+processed. Once a video is done, the blob layout packs its transcript into a
+single zstd-compressed, columnar row plus a sidecar table of skip intervals,
+so reading a whole transcript is one row fetch and one decompress. Reads fall
+back to the row layout for videos that were not packed yet.
+"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+from datetime import datetime
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+from peewee import Tuple as SqlTuple
+import numpy as np
+import zstandard
+from core.config import settings
+from core.logging import get_logger
+from models.Segment import Segment
+from models.SkipInterval import SkipInterval
+from models.TranscriptBlob import TranscriptBlob
+from .segment_service import to_ms
+from .skip_manifest import TYPE_CODES, merge_intervals
+
+FORMAT_VERSION = 1
+_MAGIC = b"NSK1"
+_HEADER = struct.Struct("<4sII")
+
+# (start_ms, end_ms, text, type) in timeline order
+SegmentRow = Tuple[int, int, str, Optional[str]]
+# Keyset position of a segment within its video: (start_ms, end_ms)
+Cursor = Tuple[int, int]
+
+
+def format_cursor(segment: dict) -> str:
+    """Encode the keyset position of a loaded segment"""
+    return f"{int(round(segment['start'] * 1000))}:{int(round(segment['end'] * 1000))}"
+
+
+def parse_cursor(value: str) -> Cursor:
+    """
+    Decode a cursor from format_cursor, or a bare time in seconds.
+
+    A bare time selects the segments that start after it.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    if ":" in value:
+        start_ms, end_ms = value.split(":", 1)
+        return int(start_ms), int(end_ms)
+    return int(round(float(value) * 1000)), 2 ** 31 - 1
+
+
+def pack_segments(rows: List[SegmentRow], level: int = 10) -> bytes:
+    """
+    Pack segments into a zstd-compressed columnar blob.
+
+    Layout before compression: header (magic, count, vocabulary size), the
+    JSON list of segment types, then one array per column: start deltas,
+    durations, type indexes (0 for untyped), text lengths and the UTF-8
+    texts back to back.
+
+    Args:
+        rows: Segments sorted by start
+        level: zstd compression level
+
+    Returns:
+        Compressed blob
+    """
+    vocabulary = sorted({segment_type for *_, segment_type in rows if segment_type})
+    type_index = {segment_type: i + 1 for i, segment_type in enumerate(vocabulary)}
+    types_json = json.dumps(vocabulary).encode()
+
+    starts = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    ends = np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows))
+    texts = [row[2].encode() for row in rows]
+
+    parts = [
+        _HEADER.pack(_MAGIC, len(rows), len(types_json)),
+        types_json,
+        np.diff(starts, prepend=0).astype("<i4").tobytes(),
+        (ends - starts).astype("<i4").tobytes(),
+        np.array([type_index.get(row[3], 0) for row in rows], dtype=np.uint8).tobytes(),
+        np.array([len(text) for text in texts], dtype="<u4").tobytes(),
+        b"".join(texts)
+    ]
+    return zstandard.ZstdCompressor(level=level).compress(b"".join(parts))
+
+
+def unpack_segments(blob: bytes) -> List[dict]:
+    """
+    Unpack a blob written by pack_segments.
+
+    Returns:
+        Segments as dicts with start/end in seconds, text and type
+    """
+    data = zstandard.ZstdDecompressor().decompress(blob)
+    magic, count, types_size = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("Not a packed transcript")
+
+    offset = _HEADER.size
+    vocabulary = [None] + json.loads(data[offset:offset + types_size])
+    offset += types_size
+
+    def column(dtype):
+        nonlocal offset
+        values = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        offset += values.nbytes
+        return values
+
+    starts = np.cumsum(column("<i4"), dtype=np.int64)
+    ends = starts + column("<i4")
+    types = column(np.uint8)
+    lengths = column("<u4")
+    text_offsets = np.concatenate(([offset], offset + np.cumsum(lengths, dtype=np.int64)))
+
+    return [
+        {
+            "start": start / 1000,
+            "end": end / 1000,
+            "text": data[text_start:text_end].decode(),
+            "type": vocabulary[type_code]
+        }
+        for start, end, type_code, text_start, text_end in zip(
+            starts.tolist(), ends.tolist(), types.tolist(), text_offsets[:-1].tolist(), text_offsets[1:].tolist()
+        )
+    ]
+
+
+class SegmentRepository(ABC):
+    """Read interface shared by the segment storage layouts"""
+
+    @abstractmethod
+    def load(self, provider: str, external_id: str) -> List[dict]:
+        """
+        Load the transcript of a video.
+
+        Returns:
+            Segments in timeline order as dicts with start/end in seconds, text and type
+        """
+
+    @abstractmethod
+    def page(self, provider: str, external_id: str, after: Optional[Cursor], limit: int) -> List[dict]:
+        """
+        Load the segments of a video that follow a keyset position.
+
+        Args:
+            provider: Video provider
+            external_id: External video ID
+            after: Position to continue from, None for the beginning
+            limit: Maximum number of segments
+
+        Returns:
+            Segments in timeline order, like load
+        """
+
+    @abstractmethod
+    def overlapping(self, provider: str, external_id: str, t0: float, t1: float) -> List[dict]:
+        """
+        Get the segments of a video that overlap a time range.
+
+        Args:
+            provider: Video provider
+            external_id: External video ID
+            t0: Range start in seconds
+            t1: Range end in seconds
+
+        Returns:
+            Segments in timeline order, like load
+        """
+
+    @abstractmethod
+    def next_ad(self, provider: str, external_id: str, t: float) -> Optional[dict]:
+        """
+        Get the first ad segment of a video that starts at or after a time.
+
+        Args:
+            provider: Video provider
+            external_id: External video ID
+            t: Time in seconds
+
+        Returns:
+            The ad segment like load, or None when no ad follows
+        """
+
+    @abstractmethod
+    def skip_intervals(self, provider: str, external_id: str) -> List[List]:
+        """
+        Get the merged skip intervals of a video.
+
+        Returns:
+            List of [start, end, type_code] in seconds
+        """
+
+    def compact(self, provider: str, external_id: str) -> None:
+        """Move a finished video into this layout (no-op when already there)"""
+
+
+class RowSegmentRepository(SegmentRepository):
+    """One Segment row per Whisper segment"""
+
+    @staticmethod
+    def rows(provider: str, external_id: str, after: Optional[Cursor] = None, limit: Optional[int] = None) -> List[SegmentRow]:
+        """Get the (start_ms, end_ms, text, type) rows of a video in timeline order"""
+        query = (Segment
+                 .select(Segment.start_ms, Segment.end_ms, Segment.text, Segment.type)
+                 .where(
+                     Segment.provider == provider,
+                     Segment.external_id == external_id,
+                     Segment.start_ms.is_null(False)
+                 ))
+        if after is not None:
+            # Row comparison walks the unique (provider, external_id, start_ms, end_ms) index
+            query = query.where(SqlTuple(Segment.start_ms, Segment.end_ms) > SqlTuple(*after))
+        query = query.order_by(Segment.start_ms, Segment.end_ms)
+        if limit is not None:
+            query = query.limit(limit)
+        return list(query.tuples())
+
+    @staticmethod
+    def _as_dicts(rows: List[SegmentRow]) -> List[dict]:
+        return [
+            {"start": start_ms / 1000, "end": end_ms / 1000, "text": text, "type": segment_type}
+            for start_ms, end_ms, text, segment_type in rows
+        ]
+
+    def load(self, provider: str, external_id: str) -> List[dict]:
+        return self._as_dicts(self.rows(provider, external_id))
+
+    def page(self, provider: str, external_id: str, after: Optional[Cursor], limit: int) -> List[dict]:
+        return self._as_dicts(self.rows(provider, external_id, after, limit))
+
+    @staticmethod
+    def _range_query(provider: str, external_id: str):
+        return (Segment
+                .select(Segment.start_ms, Segment.end_ms, Segment.text, Segment.type)
+                .where(Segment.provider == provider, Segment.external_id == external_id)
+                .order_by(Segment.start_ms, Segment.end_ms))
+
+    def overlapping(self, provider: str, external_id: str, t0: float, t1: float) -> List[dict]:
+        query = self._range_query(provider, external_id).where(
+            Segment.start_ms < to_ms(t1),
+            Segment.end_ms > to_ms(t0)
+        )
+        return self._as_dicts(list(query.tuples()))
+
+    def next_ad(self, provider: str, external_id: str, t: float) -> Optional[dict]:
+        query = self._range_query(provider, external_id).where(
+            Segment.start_ms >= to_ms(t),
+            Segment.type == "ad"
+        )
+        rows = self._as_dicts(list(query.limit(1).tuples()))
+        return rows[0] if rows else None
+
+    def skip_intervals(self, provider: str, external_id: str) -> List[List]:
+        query = (Segment
+                 .select(Segment.start_ms, Segment.end_ms, Segment.type)
+                 .where(Segment.provider == provider,
+                        Segment.external_id == external_id,
+                        Segment.type.in_(list(TYPE_CODES)),
+                        Segment.start_ms.is_null(False))
+                 .tuples())
+        return merge_intervals(
+            [(start_ms / 1000, end_ms / 1000, segment_type) for start_ms, end_ms, segment_type in query],
+            settings.skip_manifest_merge_gap
+        )
+
+
+class BlobSegmentRepository(SegmentRepository):
+    """One packed row per video plus a skip interval sidecar, rows as fallback"""
+
+    def __init__(self, fallback: Optional[RowSegmentRepository] = None):
+        self.fallback = fallback or RowSegmentRepository()
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+    @staticmethod
+    def _unpacked(provider: str, external_id: str) -> Optional[List[dict]]:
+        blob = (TranscriptBlob
+                .select(TranscriptBlob.data)
+                .where(TranscriptBlob.provider == provider, TranscriptBlob.external_id == external_id)
+                .first())
+        return None if blob is None else unpack_segments(bytes(blob.data))
+
+    def load(self, provider: str, external_id: str) -> List[dict]:
+        segments = self._unpacked(provider, external_id)
+        if segments is None:
+            return self.fallback.load(provider, external_id)
+        return segments
+
+    def page(self, provider: str, external_id: str, after: Optional[Cursor], limit: int) -> List[dict]:
+        segments = self._unpacked(provider, external_id)
+        if segments is None:
+            return self.fallback.page(provider, external_id, after, limit)
+        if after is None:
+            return segments[:limit]
+        keys = [(int(round(s["start"] * 1000)), int(round(s["end"] * 1000))) for s in segments]
+        first = bisect_right(keys, after)
+        return segments[first:first + limit]
+
+    def overlapping(self, provider: str, external_id: str, t0: float, t1: float) -> List[dict]:
+        segments = self._unpacked(provider, external_id)
+        if segments is None:
+            return self.fallback.overlapping(provider, external_id, t0, t1)
+        starts = [to_ms(s["start"]) for s in segments]
+        last = bisect_left(starts, to_ms(t1))
+        return [s for s in segments[:last] if to_ms(s["end"]) > to_ms(t0)]
+
+    def next_ad(self, provider: str, external_id: str, t: float) -> Optional[dict]:
+        segments = self._unpacked(provider, external_id)
+        if segments is None:
+            return self.fallback.next_ad(provider, external_id, t)
+        starts = [to_ms(s["start"]) for s in segments]
+        first = bisect_left(starts, to_ms(t))
+        return next((s for s in segments[first:] if s["type"] == "ad"), None)
+
+    def skip_intervals(self, provider: str, external_id: str) -> List[List]:
+        if not TranscriptBlob.select().where(
+            TranscriptBlob.provider == provider, TranscriptBlob.external_id == external_id
+        ).exists():
+            return self.fallback.skip_intervals(provider, external_id)
+
+        return [
+            [start_ms / 1000, end_ms / 1000, TYPE_CODES[segment_type]]
+            for start_ms, end_ms, segment_type in SkipInterval
+            .select(SkipInterval.start_ms, SkipInterval.end_ms, SkipInterval.type)
+            .where(SkipInterval.provider == provider, SkipInterval.external_id == external_id)
+            .order_by(SkipInterval.start_ms)
+            .tuples()
+        ]
+
+    def compact(self, provider: str, external_id: str) -> None:
+        """
+        Pack the segment rows of a video and rebuild its skip intervals.
+
+        The segment rows are deleted afterwards only when
+        segment_blob_drop_rows is set; otherwise they stay for reprocessing
+        and relabelling, and the blob is rebuilt on the next compaction.
+        """
+        rows = self.fallback.rows(provider, external_id)
+        if not rows:
+            return
+
+        blob = pack_segments(rows, settings.segment_blob_level)
+        codes = {code: segment_type for segment_type, code in TYPE_CODES.items()}
+        intervals = merge_intervals(
+            [(start_ms / 1000, end_ms / 1000, segment_type) for start_ms, end_ms, _, segment_type in rows if segment_type],
+            settings.skip_manifest_merge_gap
+        )
+        now = datetime.utcnow()
+
+        with TranscriptBlob._meta.database.atomic():
+            TranscriptBlob.insert(
+                provider=provider,
+                external_id=external_id,
+                format_version=FORMAT_VERSION,
+                segment_count=len(rows),
+                data=blob,
+                created_at=now,
+                updated_at=now
+            ).on_conflict(
+                conflict_target=[TranscriptBlob.provider, TranscriptBlob.external_id],
+                update={
+                    TranscriptBlob.format_version: FORMAT_VERSION,
+                    TranscriptBlob.segment_count: len(rows),
+                    TranscriptBlob.data: blob,
+                    TranscriptBlob.updated_at: now
+                }
+            ).execute()
+
+            SkipInterval.delete().where(
+                SkipInterval.provider == provider, SkipInterval.external_id == external_id
+            ).execute()
+            if intervals:
+                SkipInterval.insert_many([
+                    {
+                        "provider": provider,
+                        "external_id": external_id,
+                        "start_ms": int(round(start * 1000)),
+                        "end_ms": int(round(end * 1000)),
+                        "type": codes[code]
+                    }
+                    for start, end, code in intervals
+                ]).execute()
+
+            if settings.segment_blob_drop_rows:
+                Segment.delete().where(Segment.provider == provider, Segment.external_id == external_id).execute()
+
+        self.logger.info(f"Packed {len(rows)} segments of {provider}:{external_id} into {len(blob)} bytes")
+
+
+def get_segment_repository() -> SegmentRepository:
+    """Get the repository for the configured segment storage layout"""
+    if settings.segment_storage == "blob":
+        return BlobSegmentRepository()
+    return RowSegmentRepository()
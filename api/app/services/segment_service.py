@@ -0,0 +1,188 @@
+"""
+Segment Service - Bulk persistence of transcription segments
+
+This service writes a batch of segments in one transaction with multi-row
+inserts. The unique (provider, external_id, start_ms, end_ms) index makes
+the write idempotent: segments that already exist are skipped by the database
+instead of being checked one query at a time. Classifier labels are applied
+the same way, with one UPDATE per label instead of one save per row. Reads
+go through the segment repository, which also covers packed transcripts.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from peewee import Case, chunked
+from core.config import settings
+from models.Segment import Segment
+
+
+def to_ms(seconds) -> int:
+    """Convert a time in seconds to integer milliseconds"""
+    return int(round(float(seconds) * 1000))
+
+
+def _format_time(ms: int) -> str:
+    # Text columns kept for older readers; three decimals fit 10 characters up to ~27 hours
+    return f"{ms / 1000:.3f}"
+
+
+class SegmentService:
+    """Service layer for segment persistence"""
+
+    @staticmethod
+    def build_rows(hash_id: str, external_id: str, segments: Iterable[dict], porcentage, provider: str = "youtube") -> List[dict]:
+        """
+        Build insertable rows from transcribed segments.
+
+        Args:
+            hash_id: SHA256 hash of the audio file
+            external_id: External video ID
+            segments: Transcribed segments with start, end and text
+            porcentage: Processing completion percentage
+            provider: Video provider
+
+        Returns:
+            List of row dicts, deduplicated on (start_ms, end_ms)
+        """
+        rows = {}
+        for segment in segments:
+            start_ms, end_ms = to_ms(segment["start"]), to_ms(segment["end"])
+            rows.setdefault((start_ms, end_ms), {
+                "hash_id": hash_id,
+                "external_id": external_id,
+                "start": _format_time(start_ms),
+                "end": _format_time(end_ms),
+                "start_ms": start_ms,
+                "end_ms": end_ms,
+                "text": segment["text"],
+                "provider": provider,
+                "type": None,
+                "porcentage": porcentage
+            })
+        return list(rows.values())
+
+    @staticmethod
+    def bulk_insert(rows: List[dict], batch_size: Optional[int] = None) -> List[int]:
+        """
+        Insert segment rows, ignoring rows that already exist.
+
+        Args:
+            rows: Row dicts as built by build_rows
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            IDs of the newly inserted rows
+        """
+        if not rows:
+            return []
+
+        batch_size = batch_size or settings.segment_insert_batch_size
+        db = Segment._meta.database
+        ids = []
+
+        with db.atomic():
+            if db.returning_clause:
+                for batch in chunked(rows, batch_size):
+                    query = Segment.insert_many(batch).on_conflict_ignore().returning(Segment.id)
+                    ids.extend(row[0] for row in query.tuples().execute())
+            else:
+                # Without RETURNING, read back the IDs of the rows that were new
+                external_ids = {row["external_id"] for row in rows}
+                existing = set(
+                    Segment.select(Segment.provider, Segment.external_id, Segment.start_ms, Segment.end_ms)
+                    .where(Segment.external_id.in_(list(external_ids)))
+                    .tuples()
+                )
+                new_rows = [
+                    row for row in rows
+                    if (row["provider"], row["external_id"], row["start_ms"], row["end_ms"]) not in existing
+                ]
+                for batch in chunked(new_rows, batch_size):
+                    Segment.insert_many(batch).on_conflict_ignore().execute()
+
+                new_keys = {(row["provider"], row["external_id"], row["start_ms"], row["end_ms"]) for row in new_rows}
+                for id, *key in (
+                    Segment.select(Segment.id, Segment.provider, Segment.external_id, Segment.start_ms, Segment.end_ms)
+                    .where(Segment.external_id.in_(list(external_ids)))
+                    .order_by(Segment.id)
+                    .tuples()
+                ):
+                    if tuple(key) in new_keys:
+                        ids.append(id)
+
+        # IDs are assigned in insertion order, which follows the timeline
+        return sorted(ids)
+
+    @staticmethod
+    def save_segments(hash_id: str, external_id: str, segments: Iterable[dict], porcentage, provider: str = "youtube") -> List[int]:
+        """
+        Persist transcribed segments of a video in one transaction.
+
+        Returns:
+            IDs of the newly inserted segments, in timeline order
+        """
+        return SegmentService.bulk_insert(
+            SegmentService.build_rows(hash_id, external_id, segments, porcentage, provider)
+        )
+
+    @staticmethod
+    def get_unlabelled(segment_ids: Iterable[int], classifier_versions: Iterable[str]) -> List[Segment]:
+        """
+        Get the segments that were not labelled by any current classifier version yet.
+
+        Revised segments carry a human label and are never relabelled.
+
+        Args:
+            segment_ids: Candidate segment IDs
+            classifier_versions: Current versions of the AI service and the local stages
+
+        Returns:
+            Segments in timeline order
+        """
+        return list(
+            Segment.select(Segment.id, Segment.text, Segment.provider, Segment.external_id)
+            .where(
+                Segment.id.in_(list(segment_ids)),
+                Segment.revised == False,
+                Segment.classifier_version.is_null() | Segment.classifier_version.not_in(list(classifier_versions))
+            )
+            .order_by(Segment.id)
+        )
+
+    @staticmethod
+    def apply_labels(labels: Dict[Optional[str], List[Tuple[int, Optional[float]]]], classifier_version: str) -> int:
+        """
+        Write classifier labels with one UPDATE per label in one transaction.
+
+        Revised segments are left alone, so a classifier never overwrites a
+        human label.
+
+        Args:
+            labels: Segment type (None for content) mapped to (segment_id, confidence) pairs
+            classifier_version: Classifier version recorded on every row
+
+        Returns:
+            Number of updated rows
+        """
+        db = Segment._meta.database
+        now = datetime.utcnow()
+        updated = 0
+
+        with db.atomic():
+            for segment_type, rows in labels.items():
+                for batch in chunked(rows, settings.segment_insert_batch_size):
+                    ids = [segment_id for segment_id, _ in batch]
+                    if all(value is None for _, value in batch):
+                        # A CASE of only NULLs is typed as text on Postgres
+                        confidence = None
+                    else:
+                        confidence = Case(Segment.id, [(segment_id, value) for segment_id, value in batch]).cast("REAL")
+                    updated += (Segment
+                                .update(type=segment_type,
+                                        label_confidence=confidence,
+                                        classifier_version=classifier_version,
+                                        updated_at=now)
+                                .where(Segment.id.in_(ids), Segment.revised == False)
+                                .execute())
+
+        return updated
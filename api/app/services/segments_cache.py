@@ -0,0 +1,273 @@
+"""
+Segments Cache Service - Two-tier cache of serialized segments responses
+
+This service keeps the serialized segments payload of each video in an
+in-process LRU in front of a shared Redis tier. Writers invalidate a video
+by deleting its Redis entry and publishing its key, and every API process
+drops the key from its local tier when the message arrives. Each payload
+carries an ETag so clients can revalidate with If-None-Match.
+
+Invalidation also bumps a per-video generation counter. Readers note the
+generation before loading from the database, and the Redis write only
+happens if it has not changed since, so a body loaded before an
+invalidation can never be cached after it.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+import redis
+import redis.asyncio
+from core.config import settings
+from core.logging import get_logger
+
+CACHE_PREFIX = "segments_cache:"
+GENERATION_PREFIX = "segments_cache_gen:"
+INVALIDATION_CHANNEL = "segments_cache:invalidate"
+
+# Store a payload only if the video's generation is still the one the caller read
+_WRITE_IF_CURRENT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'etag', ARGV[2], 'body', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+redis_client = redis.from_url(settings.redis_string, decode_responses=True)
+# Used by async endpoints so cache reads do not block the event loop
+async_redis_client = redis.asyncio.from_url(settings.redis_string, decode_responses=True)
+logger = get_logger('services.segments_cache')
+_write_if_current = redis_client.register_script(_WRITE_IF_CURRENT)
+_write_if_current_async = async_redis_client.register_script(_WRITE_IF_CURRENT)
+
+# Cached entry: (etag, body)
+CachedPayload = Tuple[str, str]
+
+
+def _key(provider: str, external_id: str) -> str:
+    return f"{provider}:{external_id}"
+
+
+def make_etag(body: str) -> str:
+    """Compute a strong ETag for a serialized payload"""
+    return '"' + hashlib.blake2b(body.encode(), digest_size=16).hexdigest() + '"'
+
+
+class LocalLRU:
+    """Thread-safe LRU of cached payloads with per-entry expiry"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, CachedPayload]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedPayload]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: CachedPayload, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_local = LocalLRU(settings.segments_cache_local_size)
+_subscriber = None
+_subscriber_lock = threading.Lock()
+
+
+def _on_invalidate(message) -> None:
+    _local.delete(message["data"])
+
+
+def start_invalidation_listener() -> None:
+    """Subscribe this process to invalidation messages, once"""
+    global _subscriber
+    with _subscriber_lock:
+        if _subscriber is not None and _subscriber.is_alive():
+            return
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: _on_invalidate})
+        _subscriber = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        logger.info("Segments cache invalidation listener started")
+
+
+# Helpers shared by the sync and async variants below
+
+def _ttl(complete: bool) -> int:
+    return settings.segments_cache_ttl if complete else settings.segments_cache_processing_ttl
+
+
+def _generation(value: Optional[str]) -> str:
+    # A video that was never invalidated has no counter yet
+    return value or "0"
+
+
+def _read_local(provider: str, external_id: str) -> Tuple[str, Optional[CachedPayload]]:
+    start_invalidation_listener()
+    key = _key(provider, external_id)
+    return key, _local.get(key)
+
+
+def _read_redis(pipe, key: str) -> None:
+    pipe.hgetall(f"{CACHE_PREFIX}{key}")
+    pipe.ttl(f"{CACHE_PREFIX}{key}")
+
+
+def _fill_local(key: str, entry: dict, ttl: int) -> Optional[CachedPayload]:
+    if not entry:
+        return None
+    payload = (entry["etag"], entry["body"])
+    # The local copy never outlives the shared one
+    _local.set(key, payload, max(ttl, 1))
+    return payload
+
+
+def _prepare_write(provider: str, external_id: str, body: str, complete: bool, generation: str) -> Tuple[str, str, int, dict]:
+    key = _key(provider, external_id)
+    etag = make_etag(body)
+    ttl = _ttl(complete)
+    script = {
+        "keys": [f"{CACHE_PREFIX}{key}", f"{GENERATION_PREFIX}{key}"],
+        "args": [generation, etag, body, ttl]
+    }
+    return key, etag, ttl, script
+
+
+def get_cached(provider: str, external_id: str) -> Optional[CachedPayload]:
+    """
+    Get the cached payload of a video from the local tier, then Redis.
+
+    Returns:
+        Tuple of (etag, body), or None on a miss
+    """
+    key, payload = _read_local(provider, external_id)
+    if payload is not None:
+        return payload
+
+    try:
+        pipe = redis_client.pipeline()
+        _read_redis(pipe, key)
+        entry, ttl = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache read failed: {e}")
+        return None
+    return _fill_local(key, entry, ttl)
+
+
+def get_generation(provider: str, external_id: str) -> Optional[str]:
+    """
+    Get a video's cache generation, to be read before loading its segments.
+
+    Returns:
+        Generation to pass to set_cached, None when Redis is unavailable
+    """
+    try:
+        return _generation(redis_client.get(f"{GENERATION_PREFIX}{_key(provider, external_id)}"))
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache read failed: {e}")
+        return None
+
+
+def set_cached(provider: str, external_id: str, body: str, complete: bool, generation: Optional[str]) -> str:
+    """
+    Store a serialized payload in both tiers, unless it went stale.
+
+    Args:
+        provider: Video provider
+        external_id: External video ID
+        body: Serialized response body
+        complete: Whether the video finished processing; payloads of videos
+            still processing expire quickly
+        generation: Generation read with get_generation before the body was
+            loaded; nothing is stored if the video was invalidated since
+
+    Returns:
+        ETag of the payload
+    """
+    if generation is None:
+        return make_etag(body)
+    key, etag, ttl, script = _prepare_write(provider, external_id, body, complete, generation)
+
+    try:
+        written = _write_if_current(**script)
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache write failed: {e}")
+        return etag
+    if written:
+        _local.set(key, (etag, body), ttl)
+    return etag
+
+
+async def get_cached_async(provider: str, external_id: str) -> Optional[CachedPayload]:
+    """Async variant of get_cached for the API event loop"""
+    key, payload = _read_local(provider, external_id)
+    if payload is not None:
+        return payload
+
+    try:
+        pipe = async_redis_client.pipeline()
+        _read_redis(pipe, key)
+        entry, ttl = await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache read failed: {e}")
+        return None
+    return _fill_local(key, entry, ttl)
+
+
+async def get_generation_async(provider: str, external_id: str) -> Optional[str]:
+    """Async variant of get_generation for the API event loop"""
+    try:
+        return _generation(await async_redis_client.get(f"{GENERATION_PREFIX}{_key(provider, external_id)}"))
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache read failed: {e}")
+        return None
+
+
+async def set_cached_async(provider: str, external_id: str, body: str, complete: bool, generation: Optional[str]) -> str:
+    """Async variant of set_cached for the API event loop"""
+    if generation is None:
+        return make_etag(body)
+    key, etag, ttl, script = _prepare_write(provider, external_id, body, complete, generation)
+
+    try:
+        written = await _write_if_current_async(**script)
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache write failed: {e}")
+        return etag
+    if written:
+        _local.set(key, (etag, body), ttl)
+    return etag
+
+
+def invalidate(provider: str, external_id: str) -> None:
+    """Drop a video's cached payload in Redis and in every API process"""
+    key = _key(provider, external_id)
+    _local.delete(key)
+    try:
+        pipe = redis_client.pipeline()
+        pipe.incr(f"{GENERATION_PREFIX}{key}")
+        # Outlives any payload cached under the previous generation
+        pipe.expire(f"{GENERATION_PREFIX}{key}", settings.segments_cache_ttl)
+        pipe.delete(f"{CACHE_PREFIX}{key}")
+        pipe.publish(INVALIDATION_CHANNEL, key)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Segments cache invalidation failed for {key}: {e}")
@@ -0,0 +1,108 @@
+"""
+Shard State Service - Per-chunk orchestration state for sharded videos
+
+This service keeps the state of a video transcribed by several workers in
+Redis: job metadata, the chunks still pending, the chunks done and each
+chunk's transcription result, so progress and retries work per chunk.
+"""
+
+import json
+from typing import Iterable, List, Optional, Tuple
+import redis
+from core.config import settings
+
+SHARD_PREFIX = "shard:"
+redis_client = redis.from_url(settings.redis_string, decode_responses=True)
+
+
+def _key(video_id: str, suffix: str) -> str:
+    return f"{SHARD_PREFIX}{video_id}:{suffix}"
+
+
+def start_job(video_id: str, chunk_indexes: Iterable[int], **meta) -> None:
+    """
+    Register a sharded job and mark all its chunks as pending.
+
+    Args:
+        video_id: ID of the video being transcribed
+        chunk_indexes: Indexes of every planned chunk
+        **meta: Job metadata stored alongside the state (digest, language, ...)
+    """
+    chunk_indexes = list(chunk_indexes)
+    ttl = settings.shard_state_ttl
+
+    pipe = redis_client.pipeline()
+    pipe.delete(_key(video_id, "meta"), _key(video_id, "pending"), _key(video_id, "done"))
+    pipe.hset(_key(video_id, "meta"), mapping={"total": len(chunk_indexes), **meta})
+    if chunk_indexes:
+        pipe.sadd(_key(video_id, "pending"), *chunk_indexes)
+    for suffix in ("meta", "pending"):
+        pipe.expire(_key(video_id, suffix), ttl)
+    pipe.execute()
+
+
+def get_meta(video_id: str) -> dict:
+    """Get the metadata of a sharded job"""
+    return redis_client.hgetall(_key(video_id, "meta"))
+
+
+def is_chunk_done(video_id: str, index: int) -> bool:
+    """Check whether a chunk already has a stored result"""
+    return bool(redis_client.sismember(_key(video_id, "done"), index))
+
+
+def store_chunk_result(video_id: str, index: int, segments: List[dict], language: Optional[str]) -> None:
+    """
+    Store a chunk's segments and move it from pending to done.
+
+    Args:
+        video_id: ID of the video being transcribed
+        index: Chunk index
+        segments: Transcribed segments with absolute timestamps
+        language: Detected language of the chunk
+    """
+    ttl = settings.shard_state_ttl
+
+    pipe = redis_client.pipeline()
+    pipe.set(_key(video_id, f"chunk:{index}"), json.dumps({"segments": segments, "language": language}), ex=ttl)
+    pipe.srem(_key(video_id, "pending"), index)
+    pipe.sadd(_key(video_id, "done"), index)
+    pipe.expire(_key(video_id, "done"), ttl)
+    pipe.execute()
+
+
+def get_chunk_result(video_id: str, index: int) -> Tuple[List[dict], Optional[str]]:
+    """
+    Get a chunk's stored segments.
+
+    Returns:
+        Tuple of (segments, language); empty when the chunk has no result
+    """
+    raw = redis_client.get(_key(video_id, f"chunk:{index}"))
+    if raw is None:
+        return [], None
+    result = json.loads(raw)
+    return result["segments"], result["language"]
+
+
+def get_progress(video_id: str) -> dict:
+    """
+    Get the per-chunk progress of a sharded job.
+
+    Returns:
+        Dictionary with total, done and pending chunk counts
+    """
+    pipe = redis_client.pipeline()
+    pipe.hget(_key(video_id, "meta"), "total")
+    pipe.scard(_key(video_id, "done"))
+    pipe.scard(_key(video_id, "pending"))
+    total, done, pending = pipe.execute()
+    return {"total": int(total or 0), "done": done, "pending": pending}
+
+
+def clear_job(video_id: str) -> None:
+    """Delete every key of a sharded job"""
+    total = int(redis_client.hget(_key(video_id, "meta"), "total") or 0)
+    keys = [_key(video_id, suffix) for suffix in ("meta", "pending", "done")]
+    keys += [_key(video_id, f"chunk:{index}") for index in range(total)]
+    redis_client.delete(*keys)
@@ -0,0 +1,233 @@
+"""
+Skip Manifest Service - Compact per-video list of skippable intervals
+
+The extension only needs the ad and intro ranges of a video. This service
+merges the labelled segments into a sorted, non-overlapping list of
+[start, end, type_code] intervals and stores it per video in Redis, already
+serialized and compressed, so serving it needs no database query.
+"""
+
+import gzip
+import json
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+import redis
+import redis.asyncio
+from core.config import settings
+from core.logging import get_logger
+from models.Segment import Segment
+from models.Video import Video, DONE, FAILED
+from . import video_events
+
+try:
+    import brotli
+except ImportError:  # Optional: manifests are served with gzip only
+    brotli = None
+
+MANIFEST_PREFIX = "skip_manifest:"
+# Segment types the extension can skip, with their compact codes
+TYPE_CODES = {"ad": 1, "intro": 2}
+ENCODINGS = ("br", "gzip", "identity")
+
+# Manifests are stored as raw (compressed) bytes
+redis_client = redis.from_url(settings.redis_string)
+async_redis_client = redis.asyncio.from_url(settings.redis_string)
+logger = get_logger('services.skip_manifest')
+
+
+def _key(provider: str, external_id: str) -> str:
+    return f"{MANIFEST_PREFIX}{provider}:{external_id}"
+
+
+def merge_intervals(rows: Iterable[Tuple[float, float, str]], merge_gap: float) -> List[List]:
+    """
+    Merge labelled ranges into sorted, non-overlapping skip intervals.
+
+    Ranges of the same type that overlap or are separated by at most
+    merge_gap seconds are joined. Where ranges of different types overlap,
+    the later one starts where the earlier one ends.
+
+    Args:
+        rows: (start, end, type) ranges in any order
+        merge_gap: Largest gap in seconds bridged between same-type ranges
+
+    Returns:
+        List of [start, end, type_code] with times rounded to centiseconds
+    """
+    intervals: List[List] = []
+    for start, end, segment_type in sorted(rows):
+        code = TYPE_CODES.get(segment_type)
+        if code is None or end <= start:
+            continue
+
+        if intervals:
+            last = intervals[-1]
+            if last[2] == code and start - last[1] <= merge_gap:
+                last[1] = max(last[1], end)
+                continue
+            if start < last[1]:
+                start = last[1]
+                if end <= start:
+                    continue
+        intervals.append([start, end, code])
+
+    return [[round(start, 2), round(end, 2), code] for start, end, code in intervals]
+
+
+def _segment_repository():
+    # Imported here: the repository imports this module for merge_intervals
+    from .segment_repository import get_segment_repository
+    return get_segment_repository()
+
+
+def build_manifest(provider: str, external_id: str, complete: bool) -> dict:
+    """
+    Build the skip manifest of a video from its labelled segments.
+
+    Args:
+        provider: Video provider
+        external_id: External video ID
+        complete: Whether processing and classification have finished
+
+    Returns:
+        Manifest dict with version, complete and intervals
+    """
+    return {
+        "version": int(time.time() * 1000),
+        "complete": complete,
+        "intervals": _segment_repository().skip_intervals(provider, external_id)
+    }
+
+
+def is_classification_pending(provider: str, external_id: str) -> bool:
+    """Check whether any segment of a video still lacks a classifier label"""
+    return (Segment
+            .select()
+            .where(Segment.provider == provider,
+                   Segment.external_id == external_id,
+                   Segment.revised == False,
+                   Segment.classifier_version.is_null())
+            .exists())
+
+
+def _encode(manifest: dict) -> Dict[str, bytes]:
+    body = json.dumps(manifest, separators=(",", ":")).encode()
+    encoded = {"identity": body, "gzip": gzip.compress(body, compresslevel=9)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body)
+    return encoded
+
+
+def store_manifest(provider: str, external_id: str, manifest: dict) -> None:
+    """Store a manifest in every supported encoding"""
+    key = _key(provider, external_id)
+    pipe = redis_client.pipeline()
+    pipe.delete(key)
+    pipe.hset(key, mapping={"version": manifest["version"], **_encode(manifest)})
+    pipe.expire(key, settings.skip_manifest_ttl)
+    pipe.execute()
+
+
+def delete_manifest(provider: str, external_id: str) -> None:
+    """Drop the stored manifest of a video, e.g. when it is processed again"""
+    try:
+        redis_client.delete(_key(provider, external_id))
+    except redis.RedisError as e:
+        logger.warning(f"Could not delete skip manifest of {provider}:{external_id}: {e}")
+
+
+def refresh_manifest(provider: str, external_id: str, processing: bool) -> Optional[dict]:
+    """
+    Rebuild and store the manifest of a video, and publish it to event streams.
+
+    A video whose processing failed gets no manifest: its transcript is
+    partial, so none is stored and the old one is dropped. Only a video in
+    the done state (or without a status row) can be complete.
+
+    Args:
+        provider: Video provider
+        external_id: External video ID
+        processing: Whether the video is still being transcribed
+
+    Returns:
+        The stored manifest, None for a failed video
+    """
+    state = (Video
+             .select(Video.state)
+             .where(Video.provider == provider, Video.external_id == external_id)
+             .scalar())
+    if state == FAILED:
+        delete_manifest(provider, external_id)
+        logger.info(f"Skip manifest of {provider}:{external_id} not built: processing failed")
+        return None
+
+    complete = (
+        not processing
+        and state in (None, DONE)
+        and not is_classification_pending(provider, external_id)
+    )
+    if complete:
+        # A finished video moves to the configured storage layout before its intervals are read
+        _segment_repository().compact(provider, external_id)
+    manifest = build_manifest(provider, external_id, complete)
+    store_manifest(provider, external_id, manifest)
+    video_events.publish(provider, external_id, video_events.INTERVALS, manifest)
+    if complete:
+        video_events.publish(provider, external_id, video_events.COMPLETE, {"version": manifest["version"]})
+    logger.info(f"Skip manifest of {provider}:{external_id}: {len(manifest['intervals'])} intervals, complete={complete}")
+    return manifest
+
+
+def _parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Map each coding of an Accept-Encoding header to its q-value"""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> str:
+    """
+    Pick the best stored encoding the client accepts.
+
+    The highest q-value wins, ties go to the smaller encoding, and codings
+    with q=0 are refused. Identity is the fallback unless refused too, in
+    which case it is still served rather than failing the request.
+    """
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*")
+    best, best_q = "identity", 0.0
+    for encoding in ENCODINGS:
+        if encoding == "br" and brotli is None:
+            continue
+        q = accepted.get(encoding, wildcard)
+        if q is None:
+            # Identity is acceptable unless the client refuses it
+            q = 0.001 if encoding == "identity" else 0.0
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+async def get_manifest_async(provider: str, external_id: str, encoding: str) -> Optional[Tuple[str, bytes]]:
+    """
+    Get a stored manifest in the given encoding.
+
+    Returns:
+        Tuple of (version, body), or None when no manifest is stored
+    """
+    version, body = await async_redis_client.hmget(_key(provider, external_id), ["version", encoding])
+    if version is None or body is None:
+        return None
+    return version.decode(), body
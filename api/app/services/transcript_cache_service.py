@@ -0,0 +1,163 @@
+"""
+Transcript Cache Service - Content-addressed transcript store
+
+This service stores finished transcripts keyed by the SHA256 of the audio,
+the Whisper model and the decode profile, so re-uploads and mirrors of the
+same audio cost a hash lookup instead of a transcription.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+import redis
+from core.config import settings
+from core.logging import get_logger
+from models.TranscriptCache import TranscriptCache
+from .transcription_service import TranscriptionConfig
+
+METRICS_KEY = "transcript_cache:metrics"
+redis_client = redis.from_url(settings.redis_string, decode_responses=True)
+
+
+def decode_profile(config: TranscriptionConfig) -> str:
+    """
+    Describe the settings that shape a transcript besides the model name.
+
+    Args:
+        config: Transcription configuration used for the transcript
+
+    Returns:
+        Compact profile string used as part of the cache key
+    """
+    return (
+        f"{config.compute_type}/beam3/vad-{settings.vad_backend}-{settings.vad_threshold:g}"
+        f"/chunk-{settings.chunk_target_seconds:g}-{settings.chunk_min_seconds:g}"
+        f"-{settings.chunk_max_seconds:g}-{settings.chunk_overlap_seconds:g}"
+    )
+
+
+class TranscriptCacheService:
+    """Service for reading and writing cached transcripts"""
+
+    def __init__(self, config: TranscriptionConfig):
+        self.model_name = config.model_name
+        self.profile = decode_profile(config)
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+    def _record(self, metric: str) -> None:
+        try:
+            redis_client.hincrby(METRICS_KEY, metric, 1)
+        except redis.RedisError as e:
+            self.logger.warning(f"Could not record transcript cache {metric}: {e}")
+
+    def get(self, audio_hash: str) -> Optional[Tuple[List[dict], Optional[str]]]:
+        """
+        Look up the transcript of an audio file.
+
+        Args:
+            audio_hash: SHA256 of the audio file
+
+        Returns:
+            Tuple of (segments, language) on a hit, None on a miss
+        """
+        entry = TranscriptCache.get_or_none(
+            TranscriptCache.audio_hash == audio_hash,
+            TranscriptCache.model_name == self.model_name,
+            TranscriptCache.decode_profile == self.profile
+        )
+
+        if entry is None:
+            self._record("misses")
+            return None
+
+        TranscriptCache.update(
+            hits=TranscriptCache.hits + 1,
+            last_used_at=datetime.utcnow()
+        ).where(TranscriptCache.id == entry.id).execute()
+
+        self._record("hits")
+        self.logger.info(f"Transcript cache hit for audio {audio_hash}")
+        return json.loads(entry.segments), entry.language
+
+    def put(self, audio_hash: str, segments: List[dict], language: Optional[str]) -> None:
+        """
+        Store the transcript of an audio file, replacing an older entry.
+
+        Empty transcripts are never stored: a later upload of the same audio
+        is transcribed again instead of inheriting a silent result.
+
+        Args:
+            audio_hash: SHA256 of the audio file
+            segments: Transcribed segments with absolute timestamps
+            language: Detected language
+        """
+        if not segments:
+            self.logger.info(f"Not caching empty transcript for audio {audio_hash}")
+            return
+
+        now = datetime.utcnow()
+        TranscriptCache.insert(
+            audio_hash=audio_hash,
+            model_name=self.model_name,
+            decode_profile=self.profile,
+            language=language,
+            segments=json.dumps(segments),
+            created_at=now,
+            last_used_at=now
+        ).on_conflict(
+            conflict_target=[TranscriptCache.audio_hash, TranscriptCache.model_name, TranscriptCache.decode_profile],
+            update={
+                TranscriptCache.segments: json.dumps(segments),
+                TranscriptCache.language: language,
+                TranscriptCache.last_used_at: now
+            }
+        ).execute()
+        self.logger.info(f"Cached transcript for audio {audio_hash} ({len(segments)} segments)")
+
+
+def get_transcript_cache_stats() -> dict:
+    """
+    Get transcript cache hit/miss counters and the number of stored entries.
+
+    Returns:
+        Dictionary with hits, misses, hit_rate and entries
+    """
+    metrics = redis_client.hgetall(METRICS_KEY)
+    hits = int(metrics.get("hits", 0))
+    misses = int(metrics.get("misses", 0))
+    lookups = hits + misses
+
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+        "entries": TranscriptCache.select().count()
+    }
+
+
+def evict_transcripts(retention_days: int, max_entries: int) -> int:
+    """
+    Apply the retention policy to the transcript cache.
+
+    Entries not used for retention_days are removed, then the least
+    recently used entries beyond max_entries.
+
+    Args:
+        retention_days: Days an unused entry is kept
+        max_entries: Maximum number of entries to keep
+
+    Returns:
+        Number of removed entries
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    removed = TranscriptCache.delete().where(TranscriptCache.last_used_at < cutoff).execute()
+
+    overflow = TranscriptCache.select().count() - max_entries
+    if overflow > 0:
+        oldest = (TranscriptCache
+                  .select(TranscriptCache.id)
+                  .order_by(TranscriptCache.last_used_at)
+                  .limit(overflow))
+        removed += TranscriptCache.delete().where(TranscriptCache.id.in_(oldest)).execute()
+
+    return removed
@@ -6,12 +6,15 @@ Focuses only on transcription logic, delegating other responsibilities to specia
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Generator, Tuple
+from typing import List, Optional, Generator, Tuple, Union
 from pathlib import Path
-from faster_whisper import WhisperModel
+import numpy as np
 from core.logging import get_logger
+from .model_pool import model_pool
 from .audio_processing_service import AudioProcessingService
 from .voice_activity_service import VoiceActivityService
+from .vad_backends import SAMPLE_RATE
+from .chunk_planner import AudioChunk, ChunkPlan
 from .temp_file_service import TempFileService
 
 
@@ -20,8 +23,14 @@ class TranscriptionConfig:
     """Configuration for transcription service"""
     model_name: str = "base"
     cpu_threads: int = 1
+    compute_type: str = "int8"
     temp_dir: Path = Path("/tmp")
 
+    @property
+    def model_key(self) -> Tuple[str, str, str, int]:
+        """Key identifying the Whisper model in the model pool"""
+        return ("whisper", self.model_name, self.compute_type, self.cpu_threads)
+
 
 class TranscriptionService:
     """Service for audio transcription using Whisper"""
@@ -30,35 +39,51 @@ class TranscriptionService:
         self.config = config or TranscriptionConfig()
         self.logger = get_logger(f'services.{self.__class__.__name__}')
         
-        # Initialize Whisper model
-        self.whisper_model = WhisperModel(
+        # Initialize supporting services
+        self.audio_service = AudioProcessingService()
+        self.vad_service = VoiceActivityService()
+        self.temp_service = TempFileService(self.config.temp_dir)
+
+    def _load_whisper_model(self):
+        # Imported here so importing this module does not load ctranslate2
+        from faster_whisper import WhisperModel
+        return WhisperModel(
             self.config.model_name,
             device="cpu", 
             cpu_threads=self.config.cpu_threads,
-            compute_type="int8",
+            compute_type=self.config.compute_type,
         )
+
+    def lease_model(self):
+        """
+        Lease the pooled Whisper model for this configuration.
         
-        # Initialize supporting services
-        self.audio_service = AudioProcessingService()
-        self.vad_service = VoiceActivityService()
-        self.temp_service = TempFileService(self.config.temp_dir)
+        Returns:
+            Context manager yielding the loaded WhisperModel
+        """
+        return model_pool.lease(self.config.model_key, self._load_whisper_model)
+
+    def preload(self) -> None:
+        """Load the Whisper model into the pool without transcribing anything"""
+        model_pool.get(self.config.model_key, self._load_whisper_model)
 
-    def detect_language(self, audio_path: str) -> str:
+    def detect_language(self, audio_path: Union[str, np.ndarray]) -> str:
         """
         Detect the language of an audio file using Whisper.
         
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file or decoded 16 kHz mono samples
             
         Returns:
             Detected language code
         """
         try:
-            segments, info = self.whisper_model.transcribe(
-                audio_path, 
-                language=None, 
-                beam_size=1
-            )
+            with self.lease_model() as model:
+                segments, info = model.transcribe(
+                    audio_path, 
+                    language=None, 
+                    beam_size=1
+                )
             return info.language
         except Exception as e:
             self.logger.error(f"Language detection failed: {e}")
@@ -83,31 +108,110 @@ class TranscriptionService:
             return [], None
             
         try:
-            segments, info = self.whisper_model.transcribe(
-                str(part), 
-                beam_size=3, 
-                language=language
-            )
+            offset = offset or 0
+            with self.lease_model() as model:
+                segments, info = model.transcribe(
+                    str(part), 
+                    beam_size=3, 
+                    language=language
+                )
+                # Segments are decoded lazily, so consume them while leased
+                result = [
+                    {
+                        "start": segment.start + offset, 
+                        "end": segment.end + offset, 
+                        "text": segment.text
+                    } 
+                    for segment in segments
+                ]
             
             # Clean up the audio part after transcription
             self.temp_service.cleanup_file(part)
             
-            offset = offset or 0
-            result = [
-                {
-                    "start": segment.start + offset, 
-                    "end": segment.end + offset, 
-                    "text": segment.text
-                } 
-                for segment in segments
-            ]
-            
             return result, info.language if info else None
             
         except Exception as e:
             self.logger.error(f"Error transcribing part {part}: {e}")
             return [], None
 
+    def transcribe_samples(self, samples: np.ndarray, offset: float, language: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """
+        Transcribe a slice of decoded 16 kHz mono samples.
+        
+        Args:
+            samples: Decoded samples, usually a view into the ingested audio
+            offset: Time offset to apply to segments
+            language: Language code for transcription
+            
+        Returns:
+            Tuple of (segments list, detected language)
+            
+        Raises:
+            Exception: Whatever the model raised, so the chunk can be retried
+            instead of being recorded as silent
+        """
+        if len(samples) == 0:
+            return [], None
+            
+        try:
+            offset = offset or 0
+            with self.lease_model() as model:
+                segments, info = model.transcribe(
+                    samples, 
+                    beam_size=3, 
+                    language=language
+                )
+                result = [
+                    {
+                        "start": segment.start + offset, 
+                        "end": segment.end + offset, 
+                        "text": segment.text
+                    } 
+                    for segment in segments
+                ]
+            
+            return result, info.language if info else None
+            
+        except Exception as e:
+            self.logger.error(f"Error transcribing samples at offset {offset}: {e}")
+            raise
+
+    def transcribe_plan(self, samples: np.ndarray, plan: ChunkPlan, language: Optional[str] = None) -> Generator[Tuple[AudioChunk, List[dict], Optional[str]], None, None]:
+        """
+        Transcribe planned chunks of decoded audio in timeline order.
+        
+        Segments that start outside a chunk's ownership window (the overlap
+        of a fixed-length cut) are dropped so each one is emitted once.
+        
+        Args:
+            samples: Decoded 16 kHz mono samples of the whole audio
+            plan: Chunk plan covering the audio
+            language: Language code for transcription (auto-detected if None)
+            
+        Yields:
+            Tuples of (chunk, segments, language_info) for each chunk
+        """
+        try:
+            # Auto-detect language on the longest chunk if not provided
+            if language is None and len(plan) > 0:
+                longest = max(plan, key=lambda chunk: chunk.duration)
+                start, end = longest.sample_range(SAMPLE_RATE)
+                language = self.detect_language(samples[start:end])
+                self.logger.info(f"Detected language: {language}")
+                
+            for chunk, chunk_samples in plan.slices(samples, SAMPLE_RATE):
+                result, detected_lang = self.transcribe_samples(chunk_samples, chunk.offset, language)
+                result = [segment for segment in result if chunk.owns(segment["start"])]
+                
+                if language is None and detected_lang is not None:
+                    language = detected_lang
+                    
+                yield chunk, result, detected_lang
+            
+        except Exception as e:
+            self.logger.error(f"Error during transcription: {e}")
+            raise ValueError("Transcription failed")
+
     def transcribe_audio(self, audio_parts: List[Path], video_id: str, silence_times: List[float], language: Optional[str] = None) -> Generator[Tuple[List[dict], Optional[str]], None, None]:
         """
         Transcribe multiple audio parts.
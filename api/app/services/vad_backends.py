@@ -0,0 +1,274 @@
+"""
+VAD Backends - Loaders and inference for the Silero VAD model
+
+This module provides interchangeable Silero VAD backends: the original
+torch.hub loader and offline loaders that read a bundled ONNX or
+TorchScript model file from a configured path.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+import numpy as np
+from core.filesystem import generate_sha256_from_file
+from .audio_processing_service import AudioProcessingService
+
+SAMPLE_RATE = 16000
+WINDOW_SIZE = 512
+CONTEXT_SIZE = 64
+
+
+def verify_model_checksum(model_path: str, expected_sha256: Optional[str]) -> None:
+    """
+    Verify the SHA256 checksum of a model file.
+
+    Args:
+        model_path: Path to the model file
+        expected_sha256: Expected SHA256 hex digest
+
+    Raises:
+        ValueError: If no checksum is configured or the checksum does not match
+    """
+    if not expected_sha256:
+        raise ValueError(f"VAD model {model_path} requires VAD_MODEL_SHA256 to be set")
+
+    actual = generate_sha256_from_file(model_path)
+    if actual != expected_sha256.lower():
+        raise ValueError(
+            f"Checksum mismatch for VAD model {model_path}: expected {expected_sha256}, got {actual}"
+        )
+
+
+class VadBackend(ABC):
+    """Base class for Silero VAD backends working on 16 kHz mono audio"""
+
+    name = "base"
+
+    def __init__(self):
+        self.audio_service = AudioProcessingService()
+
+    def read_audio(self, audio_file: str) -> np.ndarray:
+        """Decode an audio file to 16 kHz mono float32 samples"""
+        return self.audio_service.decode_audio(audio_file, SAMPLE_RATE)
+
+    @abstractmethod
+    def speech_probabilities(self, wav: np.ndarray) -> np.ndarray:
+        """Get the speech probability of every 512-sample window"""
+
+    def get_speech_timestamps(
+        self,
+        wav: np.ndarray,
+        threshold: float = 0.5,
+        min_speech_duration_ms: int = 250,
+        min_silence_duration_ms: int = 100,
+        speech_pad_ms: int = 30
+    ) -> List[dict]:
+        """
+        Get speech timestamps, in samples, following the Silero VAD utilities.
+
+        Args:
+            wav: 16 kHz mono audio samples
+            threshold: Speech probability threshold
+            min_speech_duration_ms: Speech runs shorter than this are dropped
+            min_silence_duration_ms: Silence shorter than this does not end a speech run
+            speech_pad_ms: Padding added to each side of a speech run
+
+        Returns:
+            List of dicts with 'start' and 'end' sample indexes
+        """
+        probs = self.speech_probabilities(wav)
+        audio_length = len(wav)
+
+        min_speech_samples = SAMPLE_RATE * min_speech_duration_ms / 1000
+        min_silence_samples = SAMPLE_RATE * min_silence_duration_ms / 1000
+        speech_pad_samples = SAMPLE_RATE * speech_pad_ms / 1000
+        neg_threshold = max(threshold - 0.15, 0.01)
+
+        speeches = []
+        current = {}
+        triggered = False
+        temp_end = 0
+
+        for i, prob in enumerate(probs):
+            position = WINDOW_SIZE * i
+
+            if prob >= threshold and temp_end:
+                temp_end = 0
+
+            if prob >= threshold and not triggered:
+                triggered = True
+                current['start'] = position
+                continue
+
+            if prob < neg_threshold and triggered:
+                if not temp_end:
+                    temp_end = position
+                if position - temp_end < min_silence_samples:
+                    continue
+                current['end'] = temp_end
+                if current['end'] - current['start'] > min_speech_samples:
+                    speeches.append(current)
+                current = {}
+                temp_end = 0
+                triggered = False
+
+        if current and audio_length - current['start'] > min_speech_samples:
+            current['end'] = audio_length
+            speeches.append(current)
+
+        # Pad speech runs without letting neighbours overlap
+        for i, speech in enumerate(speeches):
+            if i == 0:
+                speech['start'] = int(max(0, speech['start'] - speech_pad_samples))
+            if i != len(speeches) - 1:
+                silence = speeches[i + 1]['start'] - speech['end']
+                if silence < 2 * speech_pad_samples:
+                    speech['end'] += int(silence // 2)
+                    speeches[i + 1]['start'] = int(max(0, speeches[i + 1]['start'] - silence // 2))
+                else:
+                    speech['end'] = int(min(audio_length, speech['end'] + speech_pad_samples))
+                    speeches[i + 1]['start'] = int(max(0, speeches[i + 1]['start'] - speech_pad_samples))
+            else:
+                speech['end'] = int(min(audio_length, speech['end'] + speech_pad_samples))
+
+        return speeches
+
+    @staticmethod
+    def _windows(wav: np.ndarray):
+        for start in range(0, len(wav), WINDOW_SIZE):
+            chunk = np.asarray(wav[start:start + WINDOW_SIZE], dtype=np.float32)
+            if len(chunk) < WINDOW_SIZE:
+                chunk = np.pad(chunk, (0, WINDOW_SIZE - len(chunk)))
+            yield chunk
+
+
+class SileroHubBackend(VadBackend):
+    """Silero VAD loaded through torch.hub (needs the hub cache or network)"""
+
+    name = "hub"
+
+    def __init__(self):
+        super().__init__()
+        import torch
+
+        self.torch = torch
+        self.model, utils = torch.hub.load(
+            repo_or_dir='snakers4/silero-vad',
+            model='silero_vad',
+            force_reload=False
+        )
+        self._get_speech_ts, _, self._read_audio, _, _ = utils
+
+    def read_audio(self, audio_file: str):
+        return self._read_audio(audio_file, sampling_rate=SAMPLE_RATE)
+
+    def speech_probabilities(self, wav: np.ndarray) -> np.ndarray:
+        self.model.reset_states()
+        probs = []
+
+        with self.torch.no_grad():
+            for chunk in self._windows(wav):
+                probs.append(self.model(self.torch.from_numpy(chunk), SAMPLE_RATE).item())
+
+        return np.asarray(probs, dtype=np.float32)
+
+    def get_speech_timestamps(self, wav, **kwargs) -> List[dict]:
+        if isinstance(wav, np.ndarray):
+            wav = self.torch.from_numpy(np.ascontiguousarray(wav, dtype=np.float32))
+        return self._get_speech_ts(wav, self.model, **kwargs)
+
+
+class SileroOnnxBackend(VadBackend):
+    """Silero VAD running a local ONNX model file with ONNX Runtime"""
+
+    name = "onnx"
+
+    def __init__(self, model_path: str, expected_sha256: Optional[str] = None):
+        super().__init__()
+        import onnxruntime
+
+        verify_model_checksum(model_path, expected_sha256)
+
+        options = onnxruntime.SessionOptions()
+        options.inter_op_num_threads = 1
+        options.intra_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+
+    def speech_probabilities(self, wav: np.ndarray) -> np.ndarray:
+        state = np.zeros((2, 1, 128), dtype=np.float32)
+        context = np.zeros((1, CONTEXT_SIZE), dtype=np.float32)
+        sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        probs = []
+
+        for chunk in self._windows(wav):
+            x = np.concatenate([context, chunk[np.newaxis, :]], axis=1)
+            out, state = self.session.run(None, {'input': x, 'state': state, 'sr': sr})
+            context = x[:, -CONTEXT_SIZE:]
+            probs.append(float(out[0][0]))
+
+        return np.asarray(probs, dtype=np.float32)
+
+
+class SileroTorchScriptBackend(VadBackend):
+    """Silero VAD running a local TorchScript model file"""
+
+    name = "torchscript"
+
+    def __init__(self, model_path: str, expected_sha256: Optional[str] = None):
+        super().__init__()
+        import torch
+
+        verify_model_checksum(model_path, expected_sha256)
+
+        self.torch = torch
+        self.model = torch.jit.load(model_path, map_location='cpu')
+        self.model.eval()
+
+    def speech_probabilities(self, wav: np.ndarray) -> np.ndarray:
+        self.model.reset_states()
+        probs = []
+
+        with self.torch.no_grad():
+            for chunk in self._windows(wav):
+                probs.append(self.model(self.torch.from_numpy(chunk), SAMPLE_RATE).item())
+
+        return np.asarray(probs, dtype=np.float32)
+
+
+def create_vad_backend(
+    backend: str,
+    model_path: Optional[str] = None,
+    expected_sha256: Optional[str] = None
+) -> VadBackend:
+    """
+    Create a Silero VAD backend by name.
+
+    Args:
+        backend: Backend name ('hub', 'onnx' or 'torchscript')
+        model_path: Path to the local model file (required for offline backends)
+        expected_sha256: Expected SHA256 of the local model file
+
+    Returns:
+        The loaded VAD backend
+
+    Raises:
+        ValueError: If the backend is unknown, or the model path or checksum is missing
+    """
+    if backend == SileroHubBackend.name:
+        return SileroHubBackend()
+
+    offline_backends = {
+        SileroOnnxBackend.name: SileroOnnxBackend,
+        SileroTorchScriptBackend.name: SileroTorchScriptBackend,
+    }
+    if backend not in offline_backends:
+        raise ValueError(f"Unknown VAD backend: {backend}")
+    if not model_path:
+        raise ValueError(f"VAD backend '{backend}' requires VAD_MODEL_PATH to be set")
+    if not expected_sha256:
+        raise ValueError(f"VAD backend '{backend}' requires VAD_MODEL_SHA256 to be set")
+
+    return offline_backends[backend](model_path, expected_sha256)
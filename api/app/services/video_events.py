@@ -0,0 +1,157 @@
+"""
+Video Events Service - Per-video processing events over Redis pub/sub
+
+Workers publish progress, skip intervals and completion of a video on its
+own Redis channel. Each API process keeps one EventHub: a single pattern
+subscription whose reader task fans messages out to in-memory buffers, one
+per connected client, so an idle subscriber costs a few hundred bytes and
+no Redis connection.
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional, Set, Tuple
+import redis
+import redis.asyncio
+from core.config import settings
+from core.logging import get_logger
+
+CHANNEL_PREFIX = "video_events:"
+# Event names sent to clients
+PROGRESS = "progress"
+INTERVALS = "intervals"
+COMPLETE = "complete"
+FAILED = "failed"
+
+redis_client = redis.from_url(settings.redis_string, decode_responses=True)
+async_redis_client = redis.asyncio.from_url(settings.redis_string, decode_responses=True)
+logger = get_logger('services.video_events')
+
+
+def _channel(provider: str, external_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{provider}:{external_id}"
+
+
+def publish(provider: str, external_id: str, event: str, data: dict) -> None:
+    """
+    Publish an event of a video to every subscribed API process.
+
+    Publishing is best effort: a Redis failure is logged and never fails
+    the calling task.
+
+    Args:
+        provider: Video provider
+        external_id: External video ID
+        event: Event name
+        data: JSON-serializable event data
+    """
+    try:
+        redis_client.publish(_channel(provider, external_id), json.dumps({"event": event, "data": data}))
+    except redis.RedisError as e:
+        logger.warning(f"Could not publish {event} event of {provider}:{external_id}: {e}")
+
+
+class Subscription:
+    """Bounded buffer of the events delivered to one client"""
+    __slots__ = ("channel", "max_size", "events", "waiter")
+
+    def __init__(self, channel: str, max_size: int):
+        self.channel = channel
+        self.max_size = max_size
+        self.events: List[Tuple[str, dict]] = []
+        self.waiter: Optional[asyncio.Future] = None
+
+    def push(self, event: Tuple[str, dict]) -> None:
+        self.events.append(event)
+        if len(self.events) > self.max_size:
+            # A slow client loses its oldest event rather than growing without bound
+            del self.events[0]
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def get(self) -> Tuple[str, dict]:
+        """Wait for the next event as an (event, data) tuple"""
+        while not self.events:
+            self.waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self.waiter
+            finally:
+                self.waiter = None
+        return self.events.pop(0)
+
+
+class EventHub:
+    """Fan-out of video events to the subscribers of this process"""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self.logger = get_logger(f'services.{self.__class__.__name__}')
+
+    def subscribe(self, provider: str, external_id: str) -> Subscription:
+        """
+        Register a subscriber to the events of a video.
+
+        Returns:
+            Subscription receiving the video's events
+        """
+        self._start_reader()
+        subscription = Subscription(_channel(provider, external_id), self.queue_size)
+        self._subscribers.setdefault(subscription.channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber registered with subscribe"""
+        subscriptions = self._subscribers.get(subscription.channel)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscribers[subscription.channel]
+
+    def dispatch(self, channel: str, message: str) -> None:
+        """Deliver a published message to the local subscribers of its channel"""
+        subscriptions = self._subscribers.get(channel)
+        if not subscriptions:
+            return
+
+        payload = json.loads(message)
+        event = (payload["event"], payload["data"])
+        for subscription in subscriptions:
+            subscription.push(event)
+
+    def _start_reader(self) -> None:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.get_running_loop().create_task(self._read())
+
+    async def _read(self) -> None:
+        delay = 1.0
+        while True:
+            pubsub = async_redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                self.logger.info("Video events reader subscribed")
+                delay = 1.0
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self.dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Video events reader failed, reconnecting in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                await pubsub.aclose()
+
+    def stats(self) -> dict:
+        """Number of videos and subscribers followed by this process"""
+        return {
+            "videos": len(self._subscribers),
+            "subscribers": sum(len(subscriptions) for subscriptions in self._subscribers.values()),
+            "reader_running": self._reader is not None and not self._reader.done()
+        }
+
+
+hub = EventHub(settings.video_events_queue_size)
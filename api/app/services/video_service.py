@@ -0,0 +1,149 @@
+"""
+Video Service - Per-video processing status
+
+This service keeps one Video row per (provider, external_id) with the state
+of its processing, chunk progress and the versions that produced its
+segments. Every change is a single UPDATE, so chunk progress can share the
+transaction that persists the chunk's segments.
+"""
+
+from datetime import datetime
+from typing import Optional
+from core.config import settings
+from models.Video import Video, QUEUED, PROCESSING, DONE, FAILED
+from . import skip_manifest, video_events
+
+
+class VideoService:
+    """Service layer for video status"""
+
+    @staticmethod
+    def get(provider: str, external_id: str) -> Optional[Video]:
+        """Get the status row of a video"""
+        return Video.get_or_none(Video.provider == provider, Video.external_id == external_id)
+
+    @staticmethod
+    def _update(provider: str, external_id: str, **fields) -> int:
+        return (Video
+                .update(updated_at=datetime.utcnow(), **fields)
+                .where(Video.provider == provider, Video.external_id == external_id)
+                .execute())
+
+    @staticmethod
+    def enqueue(provider: str, external_id: str) -> None:
+        """
+        Mark a video as queued, creating its row on first request.
+
+        The stored skip manifest describes the previous run and is dropped.
+
+        Args:
+            provider: Video provider
+            external_id: External video ID
+        """
+        now = datetime.utcnow()
+        Video.insert(
+            provider=provider,
+            external_id=external_id,
+            state=QUEUED,
+            created_at=now,
+            updated_at=now
+        ).on_conflict(
+            conflict_target=[Video.provider, Video.external_id],
+            update={Video.state: QUEUED, Video.error: None, Video.updated_at: now}
+        ).execute()
+        skip_manifest.delete_manifest(provider, external_id)
+
+    @staticmethod
+    def start(provider: str, external_id: str, audio_hash: str, whisper_model: str) -> None:
+        """
+        Mark a video as processing, reset its progress and drop its stored skip manifest.
+
+        Args:
+            provider: Video provider
+            external_id: External video ID
+            audio_hash: SHA256 of the audio file
+            whisper_model: Whisper model used for the transcript
+        """
+        now = datetime.utcnow()
+        Video.insert(
+            provider=provider,
+            external_id=external_id,
+            state=PROCESSING,
+            audio_hash=audio_hash,
+            whisper_model=whisper_model,
+            classifier_version=settings.classifier_version,
+            created_at=now,
+            updated_at=now,
+            started_at=now
+        ).on_conflict(
+            conflict_target=[Video.provider, Video.external_id],
+            update={
+                Video.state: PROCESSING,
+                Video.audio_hash: audio_hash,
+                Video.whisper_model: whisper_model,
+                Video.classifier_version: settings.classifier_version,
+                Video.chunks_total: 0,
+                Video.chunks_done: 0,
+                Video.error: None,
+                Video.updated_at: now,
+                Video.started_at: now,
+                Video.finished_at: None
+            }
+        ).execute()
+        skip_manifest.delete_manifest(provider, external_id)
+
+    @staticmethod
+    def set_plan(provider: str, external_id: str, chunks_total: int, duration: Optional[float], language: Optional[str] = None) -> None:
+        """Record the chunk count, duration and (when known) language of a video"""
+        fields = {"chunks_total": chunks_total, "duration": duration}
+        if language:
+            fields["language"] = language
+        VideoService._update(provider, external_id, **fields)
+
+    @staticmethod
+    def record_chunk(provider: str, external_id: str, language: Optional[str] = None) -> None:
+        """
+        Count one more persisted chunk.
+
+        Call it in the transaction that saves the chunk's segments, so
+        progress never runs ahead of the stored segments.
+        """
+        fields = {"chunks_done": Video.chunks_done + 1}
+        if language:
+            fields["language"] = language
+        VideoService._update(provider, external_id, **fields)
+
+    @staticmethod
+    def finish(provider: str, external_id: str, language: Optional[str] = None) -> None:
+        """Mark a video as done"""
+        now = datetime.utcnow()
+        fields = {"state": DONE, "chunks_done": Video.chunks_total, "finished_at": now}
+        if language:
+            fields["language"] = language
+        VideoService._update(provider, external_id, **fields)
+
+    @staticmethod
+    def fail(provider: str, external_id: str, error: str) -> None:
+        """Mark a video as failed with the error that stopped it, and tell its event streams"""
+        VideoService._update(provider, external_id, state=FAILED, error=error[:1000], finished_at=datetime.utcnow())
+        video_events.publish(provider, external_id, video_events.FAILED, {"state": FAILED})
+
+    @staticmethod
+    def to_status(video: Video) -> dict:
+        """
+        Serialize the status of a video for API responses.
+
+        Returns:
+            Dictionary with state, progress, duration, language and versions
+        """
+        return {
+            "state": video.state,
+            "chunks_done": video.chunks_done,
+            "chunks_total": video.chunks_total,
+            "progress": round(video.chunks_done * 100 / video.chunks_total, 1) if video.chunks_total else (100.0 if video.state == DONE else 0.0),
+            "duration": video.duration,
+            "language": video.language,
+            "whisper_model": video.whisper_model,
+            "classifier_version": video.classifier_version,
+            "updated_at": video.updated_at.isoformat() if video.updated_at else None
+        }
@@ -2,27 +2,31 @@
 Voice Activity Detection Service - Voice activity and silence detection
 
 This service provides functionality for detecting voice activity and
-silence intervals in audio files using Silero VAD.
+silence intervals in audio files using Silero VAD. The model backend
+(torch.hub, local ONNX or local TorchScript) is selected through Settings.
 """
 
-import torch
-from typing import List
+from typing import List, Optional
+from core.config import settings
 from core.logging import get_logger
+from .model_pool import model_pool
+from .vad_backends import create_vad_backend, SAMPLE_RATE
 
 
 class VoiceActivityService:
     """Service for voice activity detection using Silero VAD"""
 
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None, model_path: Optional[str] = None):
         self.logger = get_logger(f'services.{self.__class__.__name__}')
         
-        # Initialize Silero VAD model
-        self.model, utils = torch.hub.load(
-            repo_or_dir='snakers4/silero-vad',
-            model='silero_vad',
-            force_reload=False
+        backend = backend or settings.vad_backend
+        model_path = model_path or settings.vad_model_path
+        
+        # Get the Silero VAD backend from the process-wide pool
+        self.backend = model_pool.get(
+            ("silero_vad", backend, model_path),
+            lambda: create_vad_backend(backend, model_path, settings.vad_model_sha256)
         )
-        self.get_speech_ts, _, self.read_audio, _, _ = utils
 
     def detect_silence(self, audio_file: str) -> List[float]:
         """
@@ -35,21 +39,37 @@ class VoiceActivityService:
             List of silence end timestamps
         """
         try:
-            wav = self.read_audio(audio_file, sampling_rate=16000)
-            speech_timestamps = self.get_speech_ts(wav, self.model)
+            wav = self.backend.read_audio(audio_file)
+        except Exception as e:
+            self.logger.error(f"Silero VAD error: {str(e)}")
+            raise ValueError("Silence detection failed")
+        return self.detect_silence_samples(wav)
+
+    def detect_silence_samples(self, wav) -> List[float]:
+        """
+        Detect silence intervals in already decoded 16 kHz mono samples.
+        
+        Args:
+            wav: Decoded audio samples
+            
+        Returns:
+            List of silence end timestamps
+        """
+        try:
+            speech_timestamps = self.backend.get_speech_timestamps(wav, threshold=settings.vad_threshold)
 
             # Invert: we want intervals without speech
             silence_ends = []
             last_end = 0.0
             
             for segment in speech_timestamps:
-                start, end = segment['start'] / 16000.0, segment['end'] / 16000.0
+                start, end = segment['start'] / SAMPLE_RATE, segment['end'] / SAMPLE_RATE
                 if start > last_end:
                     silence_ends.append(start)
                 last_end = end
 
             if not silence_ends:
-                duration = wav.shape[-1] / 16000.0
+                duration = wav.shape[-1] / SAMPLE_RATE
                 self.logger.info("No silence detected, using full duration")
                 silence_ends.append(duration)
 
@@ -70,15 +90,31 @@ class VoiceActivityService:
             List of speech segments with start and end timestamps
         """
         try:
-            wav = self.read_audio(audio_file, sampling_rate=16000)
-            speech_timestamps = self.get_speech_ts(wav, self.model)
+            wav = self.backend.read_audio(audio_file)
+        except Exception as e:
+            self.logger.error(f"Speech detection error: {str(e)}")
+            raise ValueError("Speech detection failed")
+        return self.detect_speech_segments_samples(wav)
+
+    def detect_speech_segments_samples(self, wav) -> List[dict]:
+        """
+        Detect speech segments in already decoded 16 kHz mono samples.
+        
+        Args:
+            wav: Decoded audio samples
+            
+        Returns:
+            List of speech segments with start and end timestamps
+        """
+        try:
+            speech_timestamps = self.backend.get_speech_timestamps(wav, threshold=settings.vad_threshold)
             
             # Convert timestamps to seconds
             segments = []
             for segment in speech_timestamps:
                 segments.append({
-                    'start': segment['start'] / 16000.0,
-                    'end': segment['end'] / 16000.0
+                    'start': segment['start'] / SAMPLE_RATE,
+                    'end': segment['end'] / SAMPLE_RATE
                 })
             
             return segments
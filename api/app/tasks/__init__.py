@@ -2,13 +2,18 @@
 # Contains all Celery background tasks
 
 from .youtube_processing import process_youtube_video
+from .sharded_transcription import transcribe_chunk_range, reduce_sharded_transcription
 from .content_classification import classify_advertisement_content
 from .file_storage import store_audio_file
 from .maintenance import cleanup_temporary_files
+from .skip_manifest import build_skip_manifest
 
 __all__ = [
     'process_youtube_video', 
+    'transcribe_chunk_range',
+    'reduce_sharded_transcription',
     'classify_advertisement_content',
     'store_audio_file',
-    'cleanup_temporary_files'
+    'cleanup_temporary_files',
+    'build_skip_manifest'
 ]
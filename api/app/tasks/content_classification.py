@@ -1,8 +1,17 @@
-import random
 from celery_app.config import celery_app
-from models.Segment import Segment
-import requests
 from core.config import settings
+from core.logging import get_logger
+from services.classification_stages import build_stages
+from services.classifier_client import get_classifier_client
+from services.segment_service import SegmentService
+from services.lock_service import is_task_locked
+from services import segments_cache, skip_manifest
+
+# Initialize logger for content classification tasks
+logger = get_logger('tasks.content_classification')
+
+# Segment type stored for each class returned by the AI service
+LABEL_TYPES = {"1": "ad", "0": None}
 
 
 @celery_app.task
@@ -13,41 +22,71 @@ def classify_advertisement_content(segments_id):
     Args:
         segments_id: List of segment IDs to classify
     
-    This function processes segments sequentially, using context from previous
-    segments to improve classification accuracy.
+    Returns:
+        int: Number of segments labelled as advertisement
+    
+    The configured local stages (ad index, lexical prefilter) label the
+    segments they are confident about; the remaining segments are
+    classified concurrently by the AI service, each request carrying the
+    previous and next segment text as context. Every label is recorded with
+    the version of the stage that produced it, and segments already labelled
+    by a current version are skipped. Labels are written with one UPDATE per
+    label and version. The skip manifest of each video is rebuilt afterwards.
     """
-    previous_segment = None
-    previous_class = None
+    version = settings.classifier_version
+    stages = build_stages()
+    segments = SegmentService.get_unlabelled(segments_id, [version] + [stage.version for stage in stages])
+    if not segments:
+        return 0
+    
+    texts = [segment.text for segment in segments]
+    # Labels by classifier version, then by segment type
+    labels_by_version = {}
+    labels = labels_by_version.setdefault(version, {})
+    remaining = list(range(len(segments)))
+    handled = {}
+    
+    for stage in stages:
+        stage_labels = stage.label(texts, remaining)
+        versioned = labels_by_version.setdefault(stage.version, {})
+        for position, (segment_type, confidence) in stage_labels.items():
+            versioned.setdefault(segment_type, []).append((segments[position].id, confidence))
+        remaining = [position for position in remaining if position not in stage_labels]
+        handled[stage.name] = len(stage_labels)
+    
+    classifications = get_classifier_client().classify_many(texts, remaining)
     
-    for i, id in enumerate(segments_id):
-        segment = Segment.get_or_none(Segment.id == id)
-        
-        if segment is None:
+    new_ads = []
+    for position, classification in zip(remaining, classifications):
+        # Failed requests stay unlabelled so a re-run retries them
+        if classification is None or classification.label not in LABEL_TYPES:
             continue
-        
-        payload = {
-            "previousSegment": previous_segment.text if previous_segment else None,
-            "previousClass": previous_class,
-            "currentSegment": segment.text if segment else None,
-            "nextSegment": None
-        }
-        previous_class = segment
-        
-        try:
-            response = requests.post(settings.ad_ai_url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            current_class = result.get("response")
-            previous_class = current_class
-            
-            print("response", response)
-            # current_class = random.choice(["0", "1"])  # Temporary random assignment
-            # Mark segment as advertisement if classified as such
-            if current_class == "1":
-                if segment:
-                    segment.type = "ad"
-                    segment.save()
-
-            return current_class
-        except Exception as e:
-            previous_class = None
\ No newline at end of file
+        segment_type = LABEL_TYPES[classification.label]
+        labels.setdefault(segment_type, []).append((segments[position].id, classification.confidence))
+        if segment_type == "ad":
+            new_ads.append((segments[position].id, texts[position]))
+    
+    updated = 0
+    for labels_version, version_labels in labels_by_version.items():
+        if version_labels:
+            updated += SegmentService.apply_labels(version_labels, labels_version)
+    
+    ads = sum(len(version_labels.get("ad", [])) for version_labels in labels_by_version.values())
+    for provider, external_id in {(segment.provider, segment.external_id) for segment in segments}:
+        # Any relabel changes the payload, including an ad turned back into content
+        if updated:
+            segments_cache.invalidate(provider, external_id)
+        skip_manifest.refresh_manifest(provider, external_id, processing=is_task_locked(external_id))
+    
+    for stage in stages:
+        stage.learn(new_ads)
+        stage.report(handled[stage.name], len(segments))
+    
+    failed = len(segments) - sum(
+        len(rows) for version_labels in labels_by_version.values() for rows in version_labels.values()
+    )
+    logger.info(
+        f"Classified {len(segments)} segments: {ads} ads, {failed} failed, "
+        f"{len(remaining)} sent to the AI service, local stages: {handled}"
+    )
+    return ads
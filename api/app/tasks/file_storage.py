@@ -1,5 +1,6 @@
 from pathlib import Path
 from celery_app.config import celery_app
+from core.config import settings
 
 
 @celery_app.task
@@ -16,7 +17,7 @@ def store_audio_file(file_str: str, hash_id: str):
     """
     file_content = file_str.encode("latin1")  
 
-    folder = Path(f"/tmp/{hash_id}")
+    folder = settings.tmp_path / hash_id
     folder.mkdir(parents=True, exist_ok=True)
 
     file_path = folder / f"audio_{hash_id}.mp3"
@@ -5,6 +5,7 @@ from pathlib import Path
 from core.config import settings
 import time
 from services.lock_service import is_task_locked
+from services.transcript_cache_service import evict_transcripts, get_transcript_cache_stats
 
 # Initialize logger for maintenance tasks
 logger = get_logger('tasks.maintenance')
@@ -19,6 +20,11 @@ def setup_periodic_tasks(sender, **kwargs):
         cleanup_temporary_files.s(), 
         name='cleanup temporary files every 5 minutes'
     )
+    sender.add_periodic_task(
+        86400, 
+        evict_transcript_cache.s(), 
+        name='evict cached transcripts every day'
+    )
     
     
 @celery_app.task
@@ -34,7 +40,13 @@ def cleanup_temporary_files():
     now = time.time()
     cleaned_count = 0
     
+    blob_store_dir = Path(settings.blob_store_dir).resolve()
+    
     for folder in Path(tmp_dir).iterdir():
+        # The shared blob store may live under the temporary directory
+        if folder.resolve() == blob_store_dir:
+            continue
+        
         if folder.is_dir() and not folder.name.startswith("audio_"):
             hash_id = folder.name
             
@@ -51,3 +63,18 @@ def cleanup_temporary_files():
                         logger.error(f"Error cleaning up temporary folder {folder}: {e}")
     
     logger.info(f'Temporary files cleanup completed. Removed {cleaned_count} folders.')
+
+
+@celery_app.task
+def evict_transcript_cache():
+    """
+    Apply the transcript cache retention policy.
+    
+    Removes transcripts unused for the retention period and trims the
+    least recently used ones beyond the configured maximum.
+    """
+    removed = evict_transcripts(
+        settings.transcript_cache_retention_days,
+        settings.transcript_cache_max_entries
+    )
+    logger.info(f'Transcript cache eviction removed {removed} entries. Stats: {get_transcript_cache_stats()}')
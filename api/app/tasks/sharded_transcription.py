@@ -0,0 +1,164 @@
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+import numpy as np
+from celery import chord
+from celery_app.config import celery_app
+from core.config import settings
+from core.logging import get_logger
+from services.blob_store import LocalBlobStore
+from services.chunk_planner import AudioChunk, ChunkPlan
+from services.lock_service import unlock_task
+from services.transcription_service import TranscriptionService
+from services.transcript_cache_service import TranscriptCacheService
+from services.video_service import VideoService
+from services.vad_backends import SAMPLE_RATE
+from services import progress_store, shard_state
+# Module import: youtube_processing may still be initializing when this module loads
+import tasks.youtube_processing as youtube_processing
+from tasks.skip_manifest import build_skip_manifest
+
+# Initialize logger for sharded transcription tasks
+logger = get_logger('tasks.sharded_transcription')
+
+
+def dispatch_sharded_transcription(
+    video_id: str,
+    hash_id: str,
+    session_key,
+    samples_file: Path,
+    plan: ChunkPlan,
+    language: Optional[str]
+) -> None:
+    """
+    Fan out the chunks of a plan as subtasks and reduce them in order.
+
+    Args:
+        video_id: YouTube video ID
+        hash_id: SHA256 hash of the original audio file
+        session_key: Session key for user identification
+        samples_file: Raw float32 samples written by the ingest stage
+        plan: Chunk plan covering the audio
+        language: Language shared by every chunk
+    """
+    digest = LocalBlobStore().put_file(samples_file)
+    shard_state.start_job(
+        video_id,
+        (chunk.index for chunk in plan),
+        digest=digest,
+        hash_id=hash_id,
+        language=language or ""
+    )
+
+    chunks = [asdict(chunk) for chunk in plan]
+    size = max(1, settings.shard_chunks_per_task)
+    header = [
+        transcribe_chunk_range.s(video_id, digest, chunks[i:i + size], language)
+        for i in range(0, len(chunks), size)
+    ]
+    body = reduce_sharded_transcription.s(video_id, hash_id, session_key).on_error(
+        handle_sharded_transcription_failure.si(video_id)
+    )
+
+    logger.info(f"Dispatching {len(header)} chunk range tasks for video {video_id} ({len(plan)} chunks)")
+    chord(header)(body)
+
+
+@celery_app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def transcribe_chunk_range(self, video_id: str, digest: str, chunks: List[dict], language: Optional[str]):
+    """
+    Transcribe a range of planned chunks from the shared audio blob.
+
+    Args:
+        video_id: YouTube video ID
+        digest: Blob store digest of the decoded float32 samples
+        chunks: Serialized AudioChunk dicts of this range
+        language: Language code for transcription
+
+    Returns:
+        list: Indexes of the chunks covered by this task
+
+    Chunks that already have a result are skipped, so a retry only redoes
+    the chunks that did not finish.
+    """
+    samples = np.memmap(LocalBlobStore().get_path(digest), dtype=np.float32, mode="c")
+    service = TranscriptionService(youtube_processing._transcription_config())
+    indexes = []
+
+    for chunk_data in chunks:
+        chunk = AudioChunk(**chunk_data)
+        indexes.append(chunk.index)
+
+        if shard_state.is_chunk_done(video_id, chunk.index):
+            continue
+
+        start, end = chunk.sample_range(SAMPLE_RATE)
+        segments, detected_lang = service.transcribe_samples(samples[start:end], chunk.offset, language)
+        segments = [segment for segment in segments if chunk.owns(segment["start"])]
+
+        shard_state.store_chunk_result(video_id, chunk.index, segments, detected_lang)
+        progress_store.record_chunk("youtube", video_id)
+        logger.info(f"Chunk {chunk.index} of video {video_id} done: {shard_state.get_progress(video_id)}")
+
+    return indexes
+
+
+@celery_app.task
+def reduce_sharded_transcription(_results, video_id: str, hash_id: str, session_key):
+    """
+    Persist the segments of every chunk in timeline order.
+
+    Args:
+        _results: Chunk indexes returned by the range tasks (unused)
+        video_id: YouTube video ID
+        hash_id: SHA256 hash of the original audio file
+        session_key: Session key for user identification
+
+    Returns:
+        str: Processing ID on success
+    """
+    meta = shard_state.get_meta(video_id)
+    total = int(meta.get("total", 0))
+    language = meta.get("language") or None
+    transcript = []
+    progress_store.set_stage("youtube", video_id, progress_store.SAVING)
+
+    try:
+        for index in range(total):
+            segments, detected_lang = shard_state.get_chunk_result(video_id, index)
+            porcentage = ((index + 1) * 100) / total
+            language = language or detected_lang
+            transcript.extend(segments)
+            youtube_processing._save_youtube_segments_to_database(hash_id, video_id, segments, porcentage, session_key, language)
+
+        # Only a transcript covering every chunk may be reused for this audio
+        if settings.transcript_cache_enabled and shard_state.get_progress(video_id)["done"] == total:
+            TranscriptCacheService(youtube_processing._transcription_config()).put(hash_id, transcript, language)
+
+        VideoService.finish("youtube", video_id, language)
+        progress_store.set_stage("youtube", video_id, progress_store.DONE)
+        logger.info(f"Sharded transcription of video {video_id} reduced ({total} chunks)")
+        return video_id
+    except Exception as e:
+        VideoService.fail("youtube", video_id, f"{type(e).__name__}: {e}")
+        progress_store.set_stage("youtube", video_id, progress_store.FAILED)
+        raise
+    finally:
+        _finish_sharded_job(video_id, meta.get("digest"))
+
+
+@celery_app.task
+def handle_sharded_transcription_failure(video_id: str):
+    """Release the video and clean up shared state when a chunk range fails for good."""
+    logger.error(f"Sharded transcription failed for video {video_id}: {shard_state.get_progress(video_id)}")
+    VideoService.fail("youtube", video_id, "Chunk transcription failed")
+    progress_store.set_stage("youtube", video_id, progress_store.FAILED)
+    _finish_sharded_job(video_id, shard_state.get_meta(video_id).get("digest"))
+
+
+def _finish_sharded_job(video_id: str, digest: Optional[str]) -> None:
+    if digest:
+        LocalBlobStore().delete(digest)
+    shard_state.clear_job(video_id)
+    unlock_task(video_id)
+    build_skip_manifest.delay(video_id)
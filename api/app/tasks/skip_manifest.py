@@ -0,0 +1,26 @@
+from celery_app.config import celery_app
+from core.logging import get_logger
+from services.lock_service import is_task_locked
+from services import skip_manifest
+
+# Initialize logger for skip manifest tasks
+logger = get_logger('tasks.skip_manifest')
+
+
+@celery_app.task
+def build_skip_manifest(external_id: str, provider: str = "youtube"):
+    """
+    Rebuild the stored skip manifest of a video.
+    
+    Args:
+        external_id: External video ID
+        provider: Video provider
+    
+    Returns:
+        int: Manifest version, None when processing of the video failed
+    
+    Queued once processing of a video ends, so the manifest is marked
+    complete as soon as the last segments are labelled.
+    """
+    manifest = skip_manifest.refresh_manifest(provider, external_id, processing=is_task_locked(external_id))
+    return manifest["version"] if manifest is not None else None
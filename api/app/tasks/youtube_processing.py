@@ -1,13 +1,22 @@
 import json
+from pathlib import Path
 from services.youtube import download_audio
 from services.audio_workflow_orchestrator import AudioWorkflowOrchestrator
-from services.transcription_service import TranscriptionConfig
+from services.transcription_service import TranscriptionConfig, TranscriptionService
+from services.voice_activity_service import VoiceActivityService
+from services.model_pool import model_pool
+from services.parallel_transcription import shutdown_executors
+from services.transcript_cache_service import TranscriptCacheService
+from services.segment_service import SegmentService
+from services.video_service import VideoService
+from services import progress_store, segments_cache, video_events
 from core.filesystem import generate_sha256_from_file
 import redis
 import os
 from core.config import settings
 from core.logging import get_logger
 from celery_app.config import celery_app
+from celery.signals import worker_process_init, worker_process_shutdown
 
 # Initialize logger for YouTube processing tasks
 logger = get_logger('tasks.youtube_processing')
@@ -15,6 +24,40 @@ from database import db
 from models.Segment import Segment
 from services.lock_service import is_task_locked, lock_task, unlock_task
 from tasks.content_classification import classify_advertisement_content
+from tasks.skip_manifest import build_skip_manifest
+
+def _transcription_config() -> TranscriptionConfig:
+    """Build the transcription configuration shared by every task in this worker"""
+    return TranscriptionConfig(
+        model_name=settings.whisper_model,
+        cpu_threads=settings.cpu_threads,
+        compute_type=settings.whisper_compute_type,
+        temp_dir=settings.tmp_path
+    )
+
+
+@worker_process_init.connect
+def warm_worker_models(**kwargs):
+    """Load the transcription and VAD models once when a worker process starts."""
+    if not settings.warm_models_on_startup:
+        return
+    
+    try:
+        # With a transcription pool the Whisper models live in the pool processes
+        if settings.transcription_workers <= 1:
+            TranscriptionService(_transcription_config()).preload()
+        VoiceActivityService()
+        logger.info(f"Worker models warmed: {model_pool.stats()}")
+    except Exception as e:
+        # Models are loaded lazily on first use if warming fails
+        logger.warning(f"Could not warm worker models: {e}")
+
+
+@worker_process_shutdown.connect
+def stop_transcription_pools(**kwargs):
+    """Stop the transcription processes started by this worker process."""
+    shutdown_executors()
+
 
 @celery_app.task
 def process_youtube_video(id, session_key, upload=False):
@@ -34,82 +77,126 @@ def process_youtube_video(id, session_key, upload=False):
     audio_file = None
     audio_parts = []
     porcentage = 0
+    sharded = False
+    orchestrator = None
     
     try:
-        config = TranscriptionConfig(
-            model_name=os.environ.get("WHISPER_MODEL", "base"),
-            cpu_threads=int(os.environ.get("CPU_THREADS", 4))
-        )
-        orchestrator = AudioWorkflowOrchestrator(config)
+        config = _transcription_config()
+        progress_store.set_stage("youtube", id, progress_store.DOWNLOADING)
         
-        logger.info(f"Attempting to download audio for video ID: {id}")
-        audio_file = download_audio(id)
-        logger.info(f"Audio downloaded successfully: {audio_file}")
+        if upload:
+            # Uploaded audio was already written by store_audio_file
+            audio_file = str(settings.tmp_path / id / f"audio_{id}.mp3")
+        else:
+            logger.info(f"Attempting to download audio for video ID: {id}")
+            audio_file = download_audio(id)
+            logger.info(f"Audio downloaded successfully: {audio_file}")
         
         hash_id = generate_sha256_from_file(audio_file)
+        VideoService.start("youtube", id, hash_id, config.model_name)
+        
+        # Identical audio was already transcribed: reuse it instead of running VAD and Whisper
+        transcript_cache = TranscriptCacheService(config)
+        cached = transcript_cache.get(hash_id) if settings.transcript_cache_enabled else None
+        if cached is not None:
+            segments, lang = cached
+            duration = max((segment["end"] for segment in segments), default=None)
+            VideoService.set_plan("youtube", id, 1, duration, lang)
+            _save_youtube_segments_to_database(hash_id, id, segments, 100, session_key, lang)
+            VideoService.finish("youtube", id, lang)
+            progress_store.set_stage("youtube", id, progress_store.DONE, chunks_total=1, chunks_done=1, duration=duration)
+            return id
         
-        count = 0
-        total_segments = 0
+        orchestrator = AudioWorkflowOrchestrator(config)
         lang = None
         
-        # First pass to count total segments for percentage calculation
-        segments_list = list(orchestrator.process_audio_complete_workflow(audio_file, id, lang))
-        total = len(segments_list)
+        samples = orchestrator.ingest_audio(Path(audio_file), id)
+        plan = orchestrator.plan_chunks(samples)
+        progress_store.set_stage(
+            "youtube", id, progress_store.TRANSCRIBING,
+            chunks_total=len(plan), duration=plan.total_duration
+        )
+        
+        # Long videos are fanned out to every available worker
+        if settings.shard_transcription and len(plan) >= settings.shard_min_chunks:
+            from tasks.sharded_transcription import dispatch_sharded_transcription
+            
+            lang = orchestrator.detect_language(samples, plan)
+            VideoService.set_plan("youtube", id, len(plan), plan.total_duration, lang)
+            dispatch_sharded_transcription(id, hash_id, session_key, Path(samples.filename), plan, lang)
+            sharded = True
+            orchestrator.cleanup_workflow_files(id)
+            return id
         
-        for segments, info in segments_list:
-            count += 1
-            porcentage = ((count) * 100) / total  
-            if len(segments) > 0:
-                _save_youtube_segments_to_database(hash_id, id, segments, porcentage, session_key)
+        # The plan gives the chunk count up front, so every chunk is
+        # persisted and sent to classification as soon as it is transcribed
+        total = len(plan)
+        VideoService.set_plan("youtube", id, total, plan.total_duration)
+        transcript = []
+        transcribed = 0
+        for chunk, segments, info in orchestrator.transcribe_plan(samples, plan, lang):
+            transcribed += 1
+            porcentage = ((chunk.index + 1) * 100) / total
+            lang = lang or info
+            transcript.extend(segments)
+            _save_youtube_segments_to_database(hash_id, id, segments, porcentage, session_key, lang)
+            progress_store.record_chunk("youtube", id)
         
+        # Only a transcript covering every chunk may be reused for this audio
+        if settings.transcript_cache_enabled and transcribed == total:
+            transcript_cache.put(hash_id, transcript, lang)
+        VideoService.finish("youtube", id, lang)
+        progress_store.set_stage("youtube", id, progress_store.DONE)
+        
+        logger.info(f"Model pool stats after video {id}: {model_pool.stats()}")
         return id
     except Exception as e:
         logger.error(f"Error processing video {id}: {str(e)}")
         logger.error(f"Error type: {type(e).__name__}")
         logger.error(f"Full error details: {repr(e)}")
+        VideoService.fail("youtube", id, f"{type(e).__name__}: {e}")
+        progress_store.set_stage("youtube", id, progress_store.FAILED)
         raise e
     finally:
-        unlock_task(id)
+        # Sharded jobs are released by their reducer
+        if not sharded:
+            if orchestrator is not None:
+                orchestrator.cleanup_workflow_files(id)
+            unlock_task(id)
+            build_skip_manifest.delay(id)
 
 
-def _save_youtube_segments_to_database(hash_id, external_id, segments, porcentage, session_key):
+def _save_youtube_segments_to_database(hash_id, external_id, segments, porcentage, session_key, language=None):
     """
     Save YouTube video transcription segments to database and trigger content classification.
     
     Args:
         hash_id: SHA256 hash of the audio file
         external_id: YouTube video ID
-        segments: List of transcription segments
+        segments: Transcription segments of one chunk (may be empty)
         porcentage: Processing completion percentage
         session_key: Session key for user identification
+        language: Language detected for the chunk
+    
+    The segments and the video's chunk count are written in one transaction.
     """
     segments_id = []
     try:
-        for segment in segments:
-            existing_segment = Segment.get_or_none(
-            Segment.external_id == external_id,
-            Segment.start == segment["start"],
-            Segment.end == segment["end"]
-            )
-
-            if existing_segment:
-                logger.info(f"Segment already exists for external_id {external_id} at start={segment['start']}, end={segment['end']}. Skipping.")
-                continue  
-
-            seg = Segment.create(
-            hash_id=hash_id,
-            external_id=external_id,
-            start=str(segment["start"])[:6],
-            end=str(segment["end"])[:6],
-            text=segment["text"],
-            provider="youtube",
-            type=None,
-            porcentage=porcentage
-            )
-            segments_id.append(seg.id)
+        # Multi-row inserts; existing segments are skipped by the unique index
+        with db.atomic():
+            if segments:
+                segments_id = SegmentService.save_segments(hash_id, external_id, segments, porcentage)
+            VideoService.record_chunk("youtube", external_id, language)
+        skipped = len(segments) - len(segments_id)
+        if skipped:
+            logger.info(f"{skipped} segments already exist for external_id {external_id}. Skipping.")
+        if segments_id:
+            segments_cache.invalidate("youtube", external_id)
+        video_events.publish("youtube", external_id, video_events.PROGRESS, {"progress": round(porcentage, 1)})
     except Exception as e:
         logger.error(f"Error saving transcription for video {external_id}: {str(e)}")
         raise ValueError(f"Internal Server Error")
     finally:
         # Trigger advertisement classification for the segments
-        classify_advertisement_content.delay(segments_id)
+        if segments_id:
+            classify_advertisement_content.delay(segments_id)
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# Settings require these; the tests never talk to the services behind them
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("JWT_SECRET", "test")
+os.environ.setdefault("TURNSTILE_SECRET_KEY", "test")
+os.environ.setdefault("REDIS_STRING", "redis://localhost:6379/0")
+os.environ.setdefault("AD_AI_URL", "http://localhost:9")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,79 @@
+import pytest
+from services.chunk_planner import ChunkPlanner
+
+
+def assert_valid(plan, planner, total):
+    """Chunks cover the audio, own disjoint windows and stay within the maximum"""
+    assert plan.chunks[0].offset == 0
+    assert plan.chunks[-1].end == pytest.approx(total)
+    for chunk in plan.chunks:
+        assert chunk.duration <= planner.max_seconds + 1e-9
+        assert chunk.offset <= max(chunk.keep_start, 0)
+        assert min(chunk.keep_end, total) <= chunk.end + 1e-9
+    for previous, chunk in zip(plan.chunks, plan.chunks[1:]):
+        assert previous.keep_end == chunk.keep_start
+
+
+def test_short_audio_is_one_chunk():
+    planner = ChunkPlanner(180, 30, 300, 2)
+    plan = planner.plan([50, 100], 250)
+    assert len(plan) == 1
+    assert plan.chunks[0].duration == 250
+
+
+def test_no_cut_points_uses_fixed_length_cuts_with_overlap():
+    planner = ChunkPlanner(180, 30, 300, 2)
+    plan = planner.plan([], 1000)
+    assert_valid(plan, planner, 1000)
+    assert [chunk.keep_start for chunk in plan.chunks[1:]] == [180, 360, 540, 720]
+    # Hard cuts overlap their neighbours by half the overlap on each side
+    assert plan.chunks[1].offset == 179
+    assert plan.chunks[0].end == 181
+
+
+def test_cuts_at_silence_closest_to_target():
+    planner = ChunkPlanner(180, 30, 300, 2)
+    plan = planner.plan([100, 170, 250, 400], 500)
+    assert_valid(plan, planner, 500)
+    assert plan.chunks[1].keep_start == 170
+    assert plan.chunks[1].offset == 170
+
+
+def test_short_tail_is_merged_into_previous_chunk():
+    planner = ChunkPlanner(180, 30, 300, 2)
+    plan = planner.plan([180], 320)
+    assert_valid(plan, planner, 320)
+    assert len(plan) == 2
+    plan = planner.plan([290], 310)
+    assert_valid(plan, planner, 310)
+    # 290 + a 20 s tail would exceed the maximum: the span is cut again in the middle
+    assert len(plan) == 2
+    assert plan.chunks[1].keep_start == 155
+
+
+def test_target_equal_to_max_never_exceeds_max():
+    planner = ChunkPlanner(300, 30, 300, 4)
+    plan = planner.plan([], 1000)
+    assert_valid(plan, planner, 1000)
+    assert max(chunk.duration for chunk in plan.chunks) == pytest.approx(300)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_plans_stay_within_bounds(seed):
+    import random
+
+    rng = random.Random(seed)
+    for _ in range(200):
+        min_seconds = rng.uniform(5, 60)
+        max_seconds = rng.uniform(2 * min_seconds, 400)
+        target_seconds = rng.uniform(min_seconds, max_seconds)
+        planner = ChunkPlanner(target_seconds, min_seconds, max_seconds, rng.uniform(0, 4))
+        total = rng.uniform(1, 3000)
+        cuts = [rng.uniform(0, total) for _ in range(rng.randint(0, 40))]
+        assert_valid(planner.plan(cuts, total), planner, total)
+
+
+@pytest.mark.parametrize("durations", [(0, 30, 300), (180, 0, 300), (180, 30, 0), (180, 200, 300), (200, 160, 300)])
+def test_invalid_durations_are_rejected(durations):
+    with pytest.raises(ValueError):
+        ChunkPlanner(*durations, overlap_seconds=2)
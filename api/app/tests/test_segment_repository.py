@@ -0,0 +1,123 @@
+import pytest
+from peewee import SqliteDatabase
+from models.Segment import Segment
+from models.SkipInterval import SkipInterval
+from models.TranscriptBlob import TranscriptBlob
+from services.segment_repository import (
+    BlobSegmentRepository,
+    RowSegmentRepository,
+    SegmentRepository,
+    pack_segments,
+    parse_cursor,
+    unpack_segments,
+)
+
+MODELS = [Segment, TranscriptBlob, SkipInterval]
+
+ROWS = [
+    (0, 1500, "Welcome back", None),
+    (1500, 4000, "Este vídeo é patrocinado por — ", "ad"),
+    (1500, 4200, "视频赞助商", "ad"),
+    (4200, 9000, "Now the topic", None),
+    (9000, 12500, "Subscribe and 🔔", "self"),
+    (1_250_000, 1_251_234, "After twenty minutes", "ad"),
+    (3_600_000, 3_605_000, "", None),
+]
+
+
+def as_dicts(rows):
+    return [
+        {"start": start_ms / 1000, "end": end_ms / 1000, "text": text, "type": segment_type}
+        for start_ms, end_ms, text, segment_type in rows
+    ]
+
+
+@pytest.fixture
+def repositories():
+    """Row and blob repositories over the same video in an in-memory database"""
+    database = SqliteDatabase(":memory:")
+    with database.bind_ctx(MODELS):
+        database.create_tables(MODELS)
+        Segment.insert_many([
+            {
+                "hash_id": "v1",
+                "start": str(start_ms / 1000),
+                "end": str(end_ms / 1000),
+                "start_ms": start_ms,
+                "end_ms": end_ms,
+                "text": text,
+                "type": segment_type,
+                "porcentage": 0,
+                "provider": "youtube",
+                "external_id": "v1"
+            }
+            for start_ms, end_ms, text, segment_type in ROWS
+        ]).execute()
+        blob = BlobSegmentRepository()
+        blob.compact("youtube", "v1")
+        yield RowSegmentRepository(), blob
+    database.close()
+
+
+def test_round_trip_empty():
+    assert unpack_segments(pack_segments([])) == []
+
+
+def test_round_trip_keeps_text_types_and_long_times():
+    assert unpack_segments(pack_segments(ROWS)) == as_dicts(ROWS)
+
+
+def test_round_trip_untyped_rows():
+    rows = [(0, 1000, "a", None), (1000, 2500, "b", None)]
+    assert unpack_segments(pack_segments(rows)) == as_dicts(rows)
+
+
+def test_unpack_rejects_foreign_data():
+    import zstandard
+    with pytest.raises(ValueError):
+        unpack_segments(zstandard.ZstdCompressor().compress(b"JUNK" + bytes(8)))
+
+
+def test_base_repository_is_abstract():
+    with pytest.raises(TypeError):
+        SegmentRepository()
+
+
+def test_blob_load_matches_rows(repositories):
+    rows, blob = repositories
+    assert TranscriptBlob.select().count() == 1
+    assert blob.load("youtube", "v1") == rows.load("youtube", "v1") == as_dicts(ROWS)
+
+
+@pytest.mark.parametrize("after", [
+    None, "0:1500", "1500:4000", "1500:4200", "1.5", "4.2", "1250:9999", "3605", "0:0"
+])
+@pytest.mark.parametrize("limit", [1, 2, 100])
+def test_blob_page_matches_rows(repositories, after, limit):
+    rows, blob = repositories
+    cursor = None if after is None else parse_cursor(after)
+    assert blob.page("youtube", "v1", cursor, limit) == rows.page("youtube", "v1", cursor, limit)
+
+
+@pytest.mark.parametrize("t0, t1", [(0, 1.5), (1.5, 4.2), (3.9, 4.1), (4.2, 4.2), (10, 1300), (5000, 6000)])
+def test_blob_overlapping_matches_rows(repositories, t0, t1):
+    rows, blob = repositories
+    assert blob.overlapping("youtube", "v1", t0, t1) == rows.overlapping("youtube", "v1", t0, t1)
+
+
+@pytest.mark.parametrize("t", [0, 1.5, 1.6, 1250, 1251, 9999])
+def test_blob_next_ad_matches_rows(repositories, t):
+    rows, blob = repositories
+    assert blob.next_ad("youtube", "v1", t) == rows.next_ad("youtube", "v1", t)
+
+
+def test_blob_falls_back_to_rows_for_unpacked_videos(repositories):
+    rows, blob = repositories
+    TranscriptBlob.delete().execute()
+    assert blob.load("youtube", "v1") == rows.load("youtube", "v1")
+    assert blob.page("youtube", "v1", (1500, 4000), 2) == rows.page("youtube", "v1", (1500, 4000), 2)
+
+
+def test_blob_skip_intervals_match_rows(repositories):
+    rows, blob = repositories
+    assert blob.skip_intervals("youtube", "v1") == rows.skip_intervals("youtube", "v1")